@@ -94,6 +94,10 @@ async def on_startup():
 
     from core.database import init_db
     init_db()  # Create SQLite tables if they don't exist (TASK-13)
+
+    from api.routers.schedule import prune_checkpoints, resume_interrupted_runs
+    resume_interrupted_runs()  # Runs a previous process left unfinished
+    prune_checkpoints()  # Checkpoints past GA_CHECKPOINT_RETENTION_HOURS
     logger.info("ShopFloorScheduler API starting up (v5.0.0 — Phase 5).")
     logger.info("Swagger docs available at http://localhost:8000/docs")
 
@@ -32,6 +32,8 @@ class ScheduleRunSummary(BaseModel):
     total_tardiness: Optional[float]
     avg_flow_time: Optional[float]
     on_time_percent: Optional[float]
+    stop_reason: Optional[str] = None
+    generations_run: Optional[int] = None
 
     model_config = {"from_attributes": True}
 
@@ -59,7 +61,7 @@ def get_history(
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(default=10, ge=1, le=100, description="Results per page"),
     algorithm: Optional[str] = Query(default=None, description="Filter by algorithm (e.g. GA, FCFS)"),
-    status: Optional[str] = Query(default=None, description="Filter by status (pending, processing, complete, error)"),
+    status: Optional[str] = Query(default=None, description="Filter by status (pending, processing, complete, error, cancelled)"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> HistoryResponse:
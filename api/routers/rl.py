@@ -133,6 +133,7 @@ def _run_training(training_id: str, payload: RLTrainRequest) -> None:
         from rl.q_agent import QAgent
         from rl.environment import ShopFloorEnv
         from models import Job, Machine, Operation
+        from scheduler.instance import compile_instance
 
         # Build synthetic training data (3 machines, 5 jobs)
         machines = [Machine(machine_id=i, unavailable_periods=[]) for i in range(1, 4)]
@@ -167,12 +168,16 @@ def _run_training(training_id: str, payload: RLTrainRequest) -> None:
             reg["current_reward"] = round(reward, 4)
             reg["best_reward"] = round(agent.best_reward, 4)
 
+        # Compile once; every training episode's env shares the same arrays
+        instance = compile_instance(jobs, machines)
+
         agent.train(
             env_factory=lambda: ShopFloorEnv(
                 jobs=jobs,
                 machines=machines,
                 setup_time=2,
                 lambda_tardiness=payload.lambda_tardiness,
+                instance=instance,
             ),
             episodes=payload.episodes,
             progress_callback=_progress,
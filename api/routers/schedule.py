@@ -7,15 +7,21 @@ Routes:
   GET  /api/schedule/status/{id}    — Poll task status
   GET  /api/schedule/results/{id}   — Get final results (completed tasks only)
   GET  /api/schedule/download/{fn}  — Download generated Excel report
+  DELETE /api/schedule/{id}         — Cancel a pending or running optimization
+  GET  /api/schedule/{id}/pareto    — Pareto front of a Pareto-mode GA run
+  POST /api/schedule/{id}/pareto/{i} — Make front point i the run's schedule
+  POST /api/schedule/{id}/extend    — Continue a finished GA run for more generations
 
 NOTE: Uses in-process background threading (no Redis/Celery required).
       All state is persisted to SQLite via SQLAlchemy — no in-memory cache.
 """
 import json
 import os
+import random
+import time
 import uuid
 import threading
-import copy
+from typing import Optional
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException
 from fastapi.responses import FileResponse
@@ -30,9 +36,12 @@ from api.schemas import (
     ComparisonResultResponse,
     ManualSchedulePatch,
     ManualScheduleResult,
+    ParetoPointSchema,
+    ParetoFrontResponse,
 )
 from core.logger import logger
 from core.security import get_current_user
+from scheduler.tuner import TuningCache
 
 router = APIRouter(prefix="/api/schedule", tags=["Scheduling"])
 
@@ -41,6 +50,208 @@ OUTPUT_FOLDER = "output"
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# Worker processes per GA run (1 = evaluate in the background thread)
+GA_WORKERS = max(1, int(os.getenv("GA_WORKERS", "1")))
+# Orderings whose objectives each GA run remembers (0 = no fitness cache)
+GA_FITNESS_CACHE = max(0, int(os.getenv("GA_FITNESS_CACHE", "4096")))
+# Island-model GA: independent populations, one process each (1 = off)
+GA_ISLANDS = max(1, int(os.getenv("GA_ISLANDS", "1")))
+# Share of each GA's initial population seeded from heuristic orderings
+GA_SEED_RATIO = min(1.0, max(0.0, float(os.getenv("GA_SEED_RATIO", "0.1"))))
+# Seconds of memetic local search per GA generation, also in auto-tune races (opt-in: 0 = off)
+GA_LOCAL_SEARCH_TIME = max(0.0, float(os.getenv("GA_LOCAL_SEARCH_TIME", "0")))
+# Abandon decoding GA children that a lower bound shows can never be selected (opt-in: 1 = on)
+GA_PRESCREEN = bool(int(os.getenv("GA_PRESCREEN", "0")))
+# Minimum seconds between persisted intermediate best schedules of a GA run (0 = off)
+GA_INTERMEDIATE_INTERVAL = max(0.0, float(os.getenv("GA_INTERMEDIATE_INTERVAL", "5")))
+# Seconds between GA checkpoints, which make runs resumable and extendable (0 = off)
+GA_CHECKPOINT_INTERVAL = max(0.0, float(os.getenv("GA_CHECKPOINT_INTERVAL", "60")))
+CHECKPOINT_FOLDER = os.path.join(OUTPUT_FOLDER, "checkpoints")
+# Hours a finished GA run's checkpoint is kept for /extend
+GA_CHECKPOINT_RETENTION_HOURS = max(0.0, float(os.getenv("GA_CHECKPOINT_RETENTION_HOURS", "24")))
+# CPU seconds for tuning an "auto" GA run's parameters, and the length of that run
+GA_AUTO_TUNE_BUDGET = max(1.0, float(os.getenv("GA_AUTO_TUNE_BUDGET", "20")))
+# Wall-clock seconds of a TABU run when the upload sets no time_limit
+TABU_TIME_LIMIT = max(0.1, float(os.getenv("TABU_TIME_LIMIT", "30")))
+# Simulated annealing: parallel chains (one process each) and wall-clock seconds
+# when the upload sets no time_limit
+SA_CHAINS = max(1, int(os.getenv("SA_CHAINS", str(os.cpu_count() or 1))))
+SA_TIME_LIMIT = max(0.1, float(os.getenv("SA_TIME_LIMIT", "30")))
+# Tuning recommendations per instance-size bucket, shared by all auto runs
+_tuning_cache = TuningCache(os.path.join(OUTPUT_FOLDER, "ga_tuning.json"))
+
+
+def _ga_parallel_options() -> dict:
+    """Process options for run_genetic_algorithm; islands already use one process each."""
+    if GA_ISLANDS > 1:
+        return {"islands": GA_ISLANDS}
+    return {"workers": GA_WORKERS}
+
+
+def _ga_local_search_options() -> dict:
+    """Memetic local search options for run_genetic_algorithm; not used by the island model."""
+    if GA_LOCAL_SEARCH_TIME <= 0 or GA_ISLANDS > 1:
+        return {}
+    return {"local_search": True, "local_search_time": GA_LOCAL_SEARCH_TIME}
+
+
+def _ga_prescreen_options() -> dict:
+    """Pre-screening options for run_genetic_algorithm; serial runs only."""
+    if not GA_PRESCREEN or GA_ISLANDS > 1 or GA_WORKERS > 1:
+        return {}
+    return {"prescreen": True}
+
+
+def _search_progress(task_id: str, label: str, base: float = 0.0, span: float = 100.0):
+    """
+    WebSocket progress callback for the time-limited searches (tabu search,
+    simulated annealing), mapped onto [base, base + span] percent.
+    """
+    from api.routers.ws import send_task_progress_sync
+
+    def progress(elapsed, time_limit, best_fitness, iteration=None):
+        step = f"Iteration {iteration}, " if iteration is not None else ""
+        send_task_progress_sync(task_id, {
+            "type": "progress",
+            "message": f"{label}: {step}{elapsed:.0f}/{time_limit:.0f}s (best fitness: {round(best_fitness, 2)})",
+            "percent": round(base + min(1.0, elapsed / time_limit) * span, 1),
+        })
+    return progress
+
+
+def _checkpoint_path(task_id: str) -> str:
+    return os.path.join(CHECKPOINT_FOLDER, f"{task_id}.ckpt")
+
+
+def _ga_checkpoint_options(task_id: str, resume: bool = False) -> dict:
+    """
+    Checkpoint options for run_genetic_algorithm; not used by the island model.
+
+    With `resume`, the run continues from the task's checkpoint if it has one.
+    """
+    if GA_CHECKPOINT_INTERVAL <= 0 or GA_ISLANDS > 1:
+        return {}
+    path = _checkpoint_path(task_id)
+    options = {"checkpoint_path": path, "checkpoint_interval": GA_CHECKPOINT_INTERVAL}
+    if resume and os.path.exists(path):
+        options["resume_from"] = path
+    return options
+
+
+def _remove_checkpoint(task_id: str) -> None:
+    try:
+        os.remove(_checkpoint_path(task_id))
+    except FileNotFoundError:
+        pass
+
+
+def prune_checkpoints() -> int:
+    """
+    Delete checkpoints older than GA_CHECKPOINT_RETENTION_HOURS, except
+    those of pending or processing runs, which still resume from them.
+
+    Called on startup and whenever a run ends. Returns the number deleted.
+    """
+    from core.database import SessionLocal
+    from core.models_db import ScheduleRun
+
+    if not os.path.isdir(CHECKPOINT_FOLDER):
+        return 0
+    cutoff = time.time() - GA_CHECKPOINT_RETENTION_HOURS * 3600
+    expired = []
+    for entry in os.scandir(CHECKPOINT_FOLDER):
+        if entry.name.endswith(".ckpt") and entry.stat().st_mtime < cutoff:
+            expired.append(entry.name[:-len(".ckpt")])
+    if not expired:
+        return 0
+
+    db = SessionLocal()
+    try:
+        active = {
+            task_id for (task_id,) in db.query(ScheduleRun.task_id).filter(
+                ScheduleRun.task_id.in_(expired),
+                ScheduleRun.status.in_(("pending", "processing")),
+            )
+        }
+    finally:
+        db.close()
+    removed = 0
+    for task_id in expired:
+        if task_id not in active:
+            _remove_checkpoint(task_id)
+            removed += 1
+    if removed:
+        logger.info("Deleted {} expired GA checkpoint(s)", removed)
+    return removed
+
+
+def _store_params(task_id: str, updates: dict) -> None:
+    """Merge `updates` into a run's stored upload parameters (if it has any)."""
+    run = _get_run(task_id)
+    if run is None or not run.get("params_json"):
+        return
+    params = {**json.loads(run["params_json"]), **updates}
+    _update_run_status(task_id, run["status"], params_json=json.dumps(params))
+
+
+def _ga_intermediate_options(callback) -> dict:
+    """Anytime-result options for run_genetic_algorithm."""
+    if GA_INTERMEDIATE_INTERVAL <= 0:
+        return {}
+    return {"best_callback": callback, "best_callback_interval": GA_INTERMEDIATE_INTERVAL}
+
+
+def _save_intermediate(task_id: str, result: dict) -> int | None:
+    """Store a processing run's best schedule so far; returns its new version."""
+    from core.database import SessionLocal
+    from core.models_db import ScheduleRun
+
+    db = SessionLocal()
+    try:
+        run = db.query(ScheduleRun).filter(ScheduleRun.task_id == task_id).first()
+        if run is None:
+            return None
+        run.intermediate_json = json.dumps(result)
+        run.intermediate_version = (run.intermediate_version or 0) + 1
+        db.commit()
+        return run.intermediate_version
+    except Exception as e:
+        db.rollback()
+        logger.error("Task {}: Intermediate result update failed — {}", task_id, str(e))
+        return None
+    finally:
+        db.close()
+
+
+# Cancellation tokens of the runs started by this process, keyed by task_id.
+# Set by DELETE /api/schedule/{task_id}; the GA checks its token once per
+# generation and returns the best schedule found so far.
+_cancel_events: dict[str, threading.Event] = {}
+_cancel_lock = threading.Lock()
+
+
+def _register_cancel_event(task_id: str) -> threading.Event:
+    event = threading.Event()
+    with _cancel_lock:
+        _cancel_events[task_id] = event
+    return event
+
+
+def _release_cancel_event(task_id: str) -> None:
+    with _cancel_lock:
+        _cancel_events.pop(task_id, None)
+
+
+def _mark_cancelled(task_id: str, generations_run: int | None = None) -> None:
+    """Persist a cancelled run, discard its checkpoint and notify its WebSocket listeners."""
+    from api.routers.ws import send_task_progress_sync, send_global_notification_sync
+
+    logger.info("Task {}: Cancelled after {} generations", task_id, generations_run or 0)
+    _remove_checkpoint(task_id)
+    _update_run_status(task_id, "cancelled", stop_reason="cancelled", generations_run=generations_run)
+    send_task_progress_sync(task_id, {"type": "cancelled", "generations_run": generations_run})
+    send_global_notification_sync({"type": "run_cancelled", "task_id": task_id})
+
 
 # ---------------------------------------------------------------------------
 # DB helpers — read/write task state directly in SQLite
@@ -69,6 +280,36 @@ def _update_run_status(task_id: str, status: str, message: str = "", **kwargs):
         db.close()
 
 
+def _claim_run(task_id: str, expected: str, status: str, **kwargs) -> bool:
+    """
+    Move a ScheduleRun from `expected` to `status` in one conditional UPDATE.
+
+    Returns False when the run was no longer in `expected`, i.e. another
+    request or process changed it first.
+    """
+    from core.database import SessionLocal
+    from core.models_db import ScheduleRun
+
+    values = {ScheduleRun.status: status}
+    values.update({getattr(ScheduleRun, key): value for key, value in kwargs.items()})
+    db = SessionLocal()
+    try:
+        updated = db.query(ScheduleRun).filter(
+            ScheduleRun.task_id == task_id, ScheduleRun.status == expected,
+        ).update(values, synchronize_session=False)
+        db.commit()
+        return bool(updated)
+    finally:
+        db.close()
+
+
+def _allowed_algorithms() -> set[str]:
+    """Algorithms accepted by the upload endpoints: GA, SA plus every engine heuristic."""
+    from scheduler.engine import ALGORITHM_MAP
+
+    return {"GA", "SA", *ALGORITHM_MAP}
+
+
 def _get_run(task_id: str):
     """Fetch a ScheduleRun row from the database. Returns None if not found."""
     from core.database import SessionLocal
@@ -85,6 +326,7 @@ def _get_run(task_id: str):
             "status": run.status,
             "error_message": run.error_message,
             "algorithm": run.algorithm,
+            "file_name": run.file_name,
             "makespan": run.makespan,
             "total_tardiness": run.total_tardiness,
             "avg_flow_time": run.avg_flow_time,
@@ -92,6 +334,11 @@ def _get_run(task_id: str):
             "chart_url": run.chart_url,
             "excel_url": run.excel_url,
             "result_json": run.result_json,
+            "pareto_front_json": run.pareto_front_json,
+            "params_json": run.params_json,
+            "intermediate_json": run.intermediate_json,
+            "intermediate_version": run.intermediate_version,
+            "generations_run": run.generations_run,
             "user_id": run.user_id,
         }
         return data
@@ -115,26 +362,83 @@ def _run_schedule_background(
     tournament_size: int,
     w_makespan: float,
     w_tardiness: float,
+    time_limit: float | None = None,
+    stagnation_limit: int | None = None,
+    cancel_event: threading.Event | None = None,
+    pareto: bool = False,
+    resume: bool = False,
+    auto_tune: bool = False,
 ):
-    """Run the full scheduling pipeline in a background thread and persist to DB."""
+    """
+    Run the full scheduling pipeline in a background thread and persist to DB.
+
+    With `pareto`, the GA runs in NSGA-II mode: every schedule of the final
+    makespan / tardiness front is stored on the run, and the one with the
+    best weighted fitness becomes its result.
+
+    With `resume`, a weighted GA continues from the task's checkpoint (if
+    any) up to `generations` in total, and replaces the run's stored result.
+    Every GA run draws from its own random.Random, since restoring a
+    checkpoint sets the RNG state and other runs share this process.
+
+    With `auto_tune`, the GA's pop_size, generations, mutation_rate and
+    tournament_size are replaced by a tuning recommendation (scheduler/
+    tuner.py) sized for GA_AUTO_TUNE_BUDGET CPU seconds, and stored as the
+    run's parameters.
+
+    While a weighted GA runs, each new best schedule is stored as a versioned
+    intermediate result (at most every GA_INTERMEDIATE_INTERVAL seconds) and
+    announced over the WebSocket, so it can be used before the run ends.
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        _release_cancel_event(task_id)
+        _mark_cancelled(task_id)
+        return
     _update_run_status(task_id, "processing")
+    ga_stats: dict = {}
     try:
         from data_loader import load_data_from_excel
         from scheduler.engine import ALGORITHM_MAP
+        from scheduler.instance import compile_instance, snapshot_machine_state
+        from scheduler.bounds import makespan_lower_bound, optimality_gap
         from scheduler.metrics import build_full_metrics
         from visualization import create_gantt_chart
         from exporter import export_to_excel
-        from genetic_algorithm import run_genetic_algorithm
+        from genetic_algorithm import run_genetic_algorithm, run_nsga2
         from core.database import SessionLocal
         from core.models_db import ScheduleRun, JobRecord, OperationRecord
         from api.routers.ws import send_task_progress_sync, send_global_notification_sync
 
         logger.info("Task {}: Loading data from {}", task_id, filepath)
         machines, jobs = load_data_from_excel(filepath)
+        instance = compile_instance(jobs, machines)
+        lower_bound = makespan_lower_bound(instance, setup_time, snapshot_machine_state(machines))
 
         logger.info("Task {}: Running {} algorithm", task_id, algorithm)
 
         if algorithm == "GA":
+            if auto_tune:
+                from scheduler.tuner import recommend
+
+                send_task_progress_sync(task_id, {"type": "progress", "percent": 0, "message": "Tuning GA parameters..."})
+                tuned, cached = recommend(
+                    jobs, machines, setup_time, w_makespan, w_tardiness, GA_AUTO_TUNE_BUDGET,
+                    cache=_tuning_cache, instance=instance,
+                    ga_options={"fitness_cache": GA_FITNESS_CACHE, "seed_ratio": GA_SEED_RATIO, **_ga_local_search_options()},
+                )
+                pop_size, mutation_rate, tournament_size = tuned["pop_size"], tuned["mutation_rate"], tuned["tournament_size"]
+                generations = min(2000, max(5, tuned["generations"]))
+                # Bounds the run if this server evaluates slower than the tuning race measured
+                time_limit = time_limit or GA_AUTO_TUNE_BUDGET
+                logger.info(
+                    "Task {}: Auto-tuned GA ({}) — pop_size={}, generations={}, mutation_rate={}, tournament_size={}",
+                    task_id, "cached" if cached else "raced", pop_size, generations, mutation_rate, tournament_size,
+                )
+                _store_params(task_id, {
+                    "pop_size": pop_size, "generations": generations, "mutation_rate": mutation_rate,
+                    "tournament_size": tournament_size, "time_limit": time_limit, "auto_tune": False,
+                })
+
             # Build WebSocket progress callback
             def _ws_progress(generation, total_generations, best_fitness):
                 percent = round((generation / total_generations) * 100, 1)
@@ -146,18 +450,77 @@ def _run_schedule_background(
                     "percent": percent,
                 })
 
-            best_schedule = run_genetic_algorithm(
-                jobs=jobs,
-                machines=machines,
-                setup_time=setup_time,
-                pop_size=pop_size,
-                num_gen=generations,
-                mut_rate=mutation_rate,
-                tourn_size=tournament_size,
-                w_makespan=w_makespan,
-                w_tardiness=w_tardiness,
-                progress_callback=_ws_progress,
-            )
+            def _publish_intermediate(generation, schedule, makespan, tardiness):
+                intermediate = {
+                    **_result_fields(schedule, jobs, machines, lower_bound),
+                    "algorithm": algorithm,
+                    "lower_bound": lower_bound,
+                    "generation": generation,
+                }
+                version = _save_intermediate(task_id, intermediate)
+                if version is not None:
+                    send_task_progress_sync(task_id, {
+                        "type": "intermediate",
+                        "version": version,
+                        "generation": generation,
+                        "makespan": makespan,
+                        "total_tardiness": tardiness,
+                    })
+
+            if pareto:
+                front = run_nsga2(
+                    jobs=jobs,
+                    machines=machines,
+                    setup_time=setup_time,
+                    pop_size=pop_size,
+                    num_gen=generations,
+                    mut_rate=mutation_rate,
+                    tourn_size=tournament_size,
+                    progress_callback=_ws_progress,
+                    instance=instance,
+                    stats=ga_stats,
+                    fitness_cache=GA_FITNESS_CACHE,
+                    seed_ratio=GA_SEED_RATIO,
+                    rng=random.Random(),
+                    time_limit=time_limit,
+                    stagnation_limit=stagnation_limit,
+                    cancel_event=cancel_event,
+                )
+                # Show the front point the requested weights prefer; the rest stay selectable
+                pareto_index = min(
+                    range(len(front)),
+                    key=lambda i: front[i][1] * w_makespan + front[i][2] * w_tardiness,
+                )
+                best_schedule = front[pareto_index][0]
+            else:
+                best_schedule = run_genetic_algorithm(
+                    jobs=jobs,
+                    machines=machines,
+                    setup_time=setup_time,
+                    pop_size=pop_size,
+                    num_gen=generations,
+                    mut_rate=mutation_rate,
+                    tourn_size=tournament_size,
+                    w_makespan=w_makespan,
+                    w_tardiness=w_tardiness,
+                    progress_callback=_ws_progress,
+                    instance=instance,
+                    stats=ga_stats,
+                    **_ga_parallel_options(),
+                    fitness_cache=GA_FITNESS_CACHE,
+                    seed_ratio=GA_SEED_RATIO,
+                    **_ga_local_search_options(),
+                    **_ga_prescreen_options(),
+                    **_ga_checkpoint_options(task_id, resume),
+                    rng=random.Random(),
+                    time_limit=time_limit,
+                    stagnation_limit=stagnation_limit,
+                    cancel_event=cancel_event,
+                    **_ga_intermediate_options(_publish_intermediate),
+                )
+            if ga_stats.get("stop_reason") == "cancelled":
+                _mark_cancelled(task_id, ga_stats.get("generations_run"))
+                return
         elif algorithm == "RL":
             from rl.rl_scheduler import run_rl_schedule
             send_task_progress_sync(task_id, {"type": "progress", "percent": 0, "message": "RL scheduler loading model..."})
@@ -168,11 +531,36 @@ def _run_schedule_background(
                 lambda_tardiness=w_tardiness,
             )
             send_task_progress_sync(task_id, {"type": "progress", "percent": 100, "message": "RL schedule complete."})
+        elif algorithm == "TABU":
+            tabu_stats: dict = {}
+            best_schedule = ALGORITHM_MAP["TABU"](
+                jobs, machines, setup_time, instance=instance,
+                w_makespan=w_makespan, w_tardiness=w_tardiness,
+                time_limit=time_limit or TABU_TIME_LIMIT,
+                progress_callback=_search_progress(task_id, "TABU"),
+                cancel_event=cancel_event, stats=tabu_stats,
+            )
+            if tabu_stats["stop_reason"] == "cancelled":
+                _mark_cancelled(task_id)
+                return
+        elif algorithm == "SA":
+            from scheduler.annealing import run_simulated_annealing
+
+            sa_stats: dict = {}
+            best_schedule = run_simulated_annealing(
+                jobs, machines, setup_time, w_makespan, w_tardiness,
+                chains=SA_CHAINS, time_limit=time_limit or SA_TIME_LIMIT, instance=instance,
+                progress_callback=_search_progress(task_id, "SA"),
+                cancel_event=cancel_event, stats=sa_stats,
+            )
+            if sa_stats["stop_reason"] == "cancelled":
+                _mark_cancelled(task_id)
+                return
         else:
             fn = ALGORITHM_MAP.get(algorithm)
             if fn is None:
                 raise ValueError(f"Unknown algorithm: {algorithm}")
-            best_schedule = fn(jobs, machines, setup_time)
+            best_schedule = fn(jobs, machines, setup_time, instance=instance)
 
         logger.info("Task {}: Computing metrics", task_id)
         metrics = build_full_metrics(best_schedule, jobs, machines)
@@ -224,7 +612,15 @@ def _run_schedule_background(
             "excel_url": excel_url,
             "schedule": schedule_list,
             "utilization": utilization_list,
+            "lower_bound": lower_bound,
+            "optimality_gap": optimality_gap(metrics.get("makespan", 0), lower_bound),
         }
+        pareto_front = None
+        if algorithm == "GA" and pareto:
+            pareto_front = [
+                _result_fields(schedule, jobs, machines, lower_bound) for schedule, _, _ in front
+            ]
+            result["pareto_index"] = pareto_index
 
         # ── Persist everything to SQLite ──────────────────────────────────────
         try:
@@ -240,8 +636,16 @@ def _run_schedule_background(
                 run_row.chart_url = chart_url
                 run_row.excel_url = excel_url
                 run_row.result_json = json.dumps(result)
-
-                # Persist operations
+                run_row.stop_reason = ga_stats.get("stop_reason")
+                run_row.generations_run = ga_stats.get("generations_run")
+                if pareto_front is not None:
+                    run_row.pareto_front_json = json.dumps(pareto_front)
+                # Superseded by the final result
+                run_row.intermediate_json = None
+
+                # Persist operations (replacing those of an extended run)
+                db.query(OperationRecord).filter(OperationRecord.run_id == run_row.id).delete()
+                db.query(JobRecord).filter(JobRecord.run_id == run_row.id).delete()
                 for op in schedule_list:
                     db.add(OperationRecord(
                         run_id=run_row.id,
@@ -311,6 +715,12 @@ def _run_schedule_background(
             "task_id": task_id,
             "error": str(exc),
         })
+    finally:
+        _release_cancel_event(task_id)
+        try:
+            prune_checkpoints()
+        except Exception as exc:
+            logger.warning("Task {}: Checkpoint cleanup failed — {}", task_id, str(exc))
 
 
 
@@ -326,12 +736,18 @@ def _run_compare_background(
     tournament_size: int,
     w_makespan: float,
     w_tardiness: float,
+    time_limit: float | None = None,
+    stagnation_limit: int | None = None,
+    cancel_event: threading.Event | None = None,
 ):
     """Run multiple scheduling algorithms side-by-side in a background thread."""
     _update_run_status(task_id, "processing")
+    ga_stats: dict = {}
     try:
         from data_loader import load_data_from_excel
         from scheduler.engine import ALGORITHM_MAP
+        from scheduler.instance import compile_instance, snapshot_machine_state
+        from scheduler.bounds import makespan_lower_bound, optimality_gap
         from scheduler.metrics import build_full_metrics
         from visualization import create_gantt_chart
         from exporter import export_to_excel
@@ -343,8 +759,16 @@ def _run_compare_background(
         logger.info("Task {}: Loading data from {}", task_id, filepath)
         machines, jobs = load_data_from_excel(filepath)
 
+        # Compiled once and shared: the engines never mutate the machines,
+        # so every algorithm starts from the same untouched input.
+        instance = compile_instance(jobs, machines)
+        lower_bound = makespan_lower_bound(instance, setup_time, snapshot_machine_state(machines))
+
         results = []
         for i, algo in enumerate(algorithms):
+            if cancel_event is not None and cancel_event.is_set():
+                _mark_cancelled(task_id, ga_stats.get("generations_run"))
+                return
             logger.info("Task {}: Running {} ({}/{})", task_id, algo, i + 1, len(algorithms))
             
             # Send status update for current algorithm
@@ -354,10 +778,6 @@ def _run_compare_background(
                 "percent": round((i / len(algorithms)) * 100, 1),
             })
 
-            # Create a deep copy of the machines list so that state mutations
-            # (available_at, last_job_id) do not leak between algorithm runs.
-            algo_machines = copy.deepcopy(machines)
-
             if algo == "GA":
                 # Build WebSocket progress callback for GA
                 def _ws_progress(generation, total_generations, best_fitness):
@@ -372,7 +792,7 @@ def _run_compare_background(
 
                 best_schedule = run_genetic_algorithm(
                     jobs=jobs,
-                    machines=algo_machines,
+                    machines=machines,
                     setup_time=setup_time,
                     pop_size=pop_size,
                     num_gen=generations,
@@ -381,14 +801,52 @@ def _run_compare_background(
                     w_makespan=w_makespan,
                     w_tardiness=w_tardiness,
                     progress_callback=_ws_progress,
+                    instance=instance,
+                    stats=ga_stats,
+                    **_ga_parallel_options(),
+                    fitness_cache=GA_FITNESS_CACHE,
+                    seed_ratio=GA_SEED_RATIO,
+                    **_ga_local_search_options(),
+                    rng=random.Random(),
+                    time_limit=time_limit,
+                    stagnation_limit=stagnation_limit,
+                    cancel_event=cancel_event,
+                )
+                if ga_stats.get("stop_reason") == "cancelled":
+                    _mark_cancelled(task_id, ga_stats.get("generations_run"))
+                    return
+            elif algo == "TABU":
+                tabu_stats: dict = {}
+                best_schedule = ALGORITHM_MAP["TABU"](
+                    jobs, machines, setup_time, instance=instance,
+                    w_makespan=w_makespan, w_tardiness=w_tardiness,
+                    time_limit=time_limit or TABU_TIME_LIMIT,
+                    progress_callback=_search_progress(task_id, "TABU", (i / len(algorithms)) * 100, 100 / len(algorithms)),
+                    cancel_event=cancel_event, stats=tabu_stats,
                 )
+                if tabu_stats["stop_reason"] == "cancelled":
+                    _mark_cancelled(task_id, ga_stats.get("generations_run"))
+                    return
+            elif algo == "SA":
+                from scheduler.annealing import run_simulated_annealing
+
+                sa_stats: dict = {}
+                best_schedule = run_simulated_annealing(
+                    jobs, machines, setup_time, w_makespan, w_tardiness,
+                    chains=SA_CHAINS, time_limit=time_limit or SA_TIME_LIMIT, instance=instance,
+                    progress_callback=_search_progress(task_id, "SA", (i / len(algorithms)) * 100, 100 / len(algorithms)),
+                    cancel_event=cancel_event, stats=sa_stats,
+                )
+                if sa_stats["stop_reason"] == "cancelled":
+                    _mark_cancelled(task_id, ga_stats.get("generations_run"))
+                    return
             else:
                 fn = ALGORITHM_MAP.get(algo)
                 if fn is None:
                     raise ValueError(f"Unknown algorithm: {algo}")
-                best_schedule = fn(jobs, algo_machines, setup_time)
+                best_schedule = fn(jobs, machines, setup_time, instance=instance)
 
-            metrics = build_full_metrics(best_schedule, jobs, algo_machines)
+            metrics = build_full_metrics(best_schedule, jobs, machines)
 
             # Generate Gantt chart for this algorithm
             chart_filename = f"gantt_{task_id}_{algo}.png"
@@ -436,6 +894,8 @@ def _run_compare_background(
                 "excel_url": excel_url,
                 "schedule": schedule_list,
                 "utilization": utilization_list,
+                "lower_bound": lower_bound,
+                "optimality_gap": optimality_gap(metrics.get("makespan", 0), lower_bound),
             })
 
         # Save to DB
@@ -453,6 +913,8 @@ def _run_compare_background(
                 run_row.on_time_percent = best_run["on_time_percent"]
                 # Store the full comparison list in result_json
                 run_row.result_json = json.dumps({"results": results})
+                run_row.stop_reason = ga_stats.get("stop_reason")
+                run_row.generations_run = ga_stats.get("generations_run")
                 db.commit()
         except Exception as e:
             db.rollback()
@@ -484,6 +946,8 @@ def _run_compare_background(
             "task_id": task_id,
             "error": str(e),
         })
+    finally:
+        _release_cancel_event(task_id)
 
 
 # ---------------------------------------------------------------------------
@@ -506,6 +970,8 @@ async def upload_and_compare(
     tournament_size: int = Form(default=3, ge=2, le=20),
     w_makespan: float = Form(default=0.6, ge=0.0, le=1.0),
     w_tardiness: float = Form(default=0.4, ge=0.0, le=1.0),
+    time_limit: Optional[float] = Form(default=None, gt=0, le=3600),
+    stagnation_limit: Optional[int] = Form(default=None, ge=1, le=2000),
     current_user=Depends(get_current_user),
 ) -> UploadResponse:
     # Validate file type
@@ -514,7 +980,7 @@ async def upload_and_compare(
 
     # Validate algorithms
     algo_list = [a.strip().upper() for a in algorithms.split(",") if a.strip()]
-    allowed_algorithms = {"GA", "FCFS", "SPT", "EDD", "WSPT"}
+    allowed_algorithms = _allowed_algorithms()
     for algo in algo_list:
         if algo not in allowed_algorithms:
             raise HTTPException(status_code=422, detail=f"Algorithm '{algo}' must be one of {allowed_algorithms}")
@@ -574,6 +1040,9 @@ async def upload_and_compare(
             "tournament_size": tournament_size,
             "w_makespan": w_makespan,
             "w_tardiness": w_tardiness,
+            "time_limit": time_limit,
+            "stagnation_limit": stagnation_limit,
+            "cancel_event": _register_cancel_event(task_id),
         },
         daemon=True,
     )
@@ -623,6 +1092,8 @@ async def get_compare_status(
                     excel_url=r.get("excel_url"),
                     schedule=[ScheduledOperationSchema(**op) for op in r.get("schedule", [])],
                     utilization=[UtilizationSchema(**u) for u in r.get("utilization", [])],
+                    lower_bound=r.get("lower_bound"),
+                    optimality_gap=r.get("optimality_gap"),
                 )
                 for r in raw_result.get("results", [])
             ]
@@ -679,6 +1150,10 @@ async def upload_and_schedule(
     tournament_size: int = Form(default=3, ge=2, le=20),
     w_makespan: float = Form(default=0.6, ge=0.0, le=1.0),
     w_tardiness: float = Form(default=0.4, ge=0.0, le=1.0),
+    time_limit: Optional[float] = Form(default=None, gt=0, le=3600),
+    stagnation_limit: Optional[int] = Form(default=None, ge=1, le=2000),
+    pareto: bool = Form(default=False),
+    auto_tune: bool = Form(default=False),
     current_user=Depends(get_current_user),
 ) -> UploadResponse:
     # Validate file type
@@ -686,10 +1161,14 @@ async def upload_and_schedule(
         raise HTTPException(status_code=400, detail="Only Excel files (.xlsx, .xls) are supported.")
 
     # Validate algorithm
-    allowed_algorithms = {"GA", "FCFS", "SPT", "EDD", "WSPT"}
+    allowed_algorithms = _allowed_algorithms()
     algorithm = algorithm.upper()
     if algorithm not in allowed_algorithms:
         raise HTTPException(status_code=422, detail=f"algorithm must be one of {allowed_algorithms}")
+    if pareto and algorithm != "GA":
+        raise HTTPException(status_code=422, detail="pareto is only supported with algorithm GA.")
+    if auto_tune and algorithm != "GA":
+        raise HTTPException(status_code=422, detail="auto_tune is only supported with algorithm GA.")
 
     # Save uploaded file
     task_id = str(uuid.uuid4())
@@ -709,6 +1188,20 @@ async def upload_and_schedule(
         raise HTTPException(status_code=500, detail="Failed to save uploaded file.")
 
     logger.info("File uploaded for task {}. Starting {} optimization.", task_id, algorithm)
+    params = {
+        "setup_time": setup_time,
+        "algorithm": algorithm,
+        "pop_size": pop_size,
+        "generations": generations,
+        "mutation_rate": mutation_rate,
+        "tournament_size": tournament_size,
+        "w_makespan": w_makespan,
+        "w_tardiness": w_tardiness,
+        "time_limit": time_limit,
+        "stagnation_limit": stagnation_limit,
+        "pareto": pareto,
+        "auto_tune": auto_tune,
+    }
 
     # Create initial DB row (status = pending)
     try:
@@ -722,6 +1215,7 @@ async def upload_and_schedule(
             file_name=original_filename,
             user_id=current_user.id,
             trigger_type="initial",
+            params_json=json.dumps(params),
         ))
         db.commit()
         db.close()
@@ -729,30 +1223,73 @@ async def upload_and_schedule(
         logger.warning("Task {}: Could not create DB row — {}", task_id, str(db_err))
 
     # Run in background thread (no Redis/Celery required)
+    _start_schedule_thread(task_id, original_filename, params)
+
+    return UploadResponse(
+        task_id=task_id,
+        message=f"{algorithm} optimization started.",
+        status_url=f"/api/schedule/status/{task_id}",
+    )
+
+
+def _start_schedule_thread(task_id: str, original_filename: str, params: dict, resume: bool = False) -> None:
+    """Run `_run_schedule_background` for an uploaded file in a daemon thread."""
     thread = threading.Thread(
         target=_run_schedule_background,
         kwargs={
             "task_id": task_id,
-            "filepath": filepath,
+            "filepath": os.path.join(UPLOAD_FOLDER, f"{task_id}.xlsx"),
             "original_filename": original_filename,
-            "setup_time": setup_time,
-            "algorithm": algorithm,
-            "pop_size": pop_size,
-            "generations": generations,
-            "mutation_rate": mutation_rate,
-            "tournament_size": tournament_size,
-            "w_makespan": w_makespan,
-            "w_tardiness": w_tardiness,
+            **params,
+            "cancel_event": _register_cancel_event(task_id),
+            "resume": resume,
         },
         daemon=True,
     )
     thread.start()
 
-    return UploadResponse(
-        task_id=task_id,
-        message=f"{algorithm} optimization started.",
-        status_url=f"/api/schedule/status/{task_id}",
-    )
+
+def resume_interrupted_runs() -> int:
+    """
+    Restart the runs a previous server process left pending or processing.
+
+    Called once on startup. Each run is first claimed with a conditional
+    UPDATE (pending/processing -> resuming), so when several server
+    processes start at once only the one whose update matched restarts it.
+    GA runs continue from their last checkpoint; runs that cannot be
+    restarted (no stored parameters or upload) are marked as failed instead
+    of staying stuck. Returns the number restarted.
+    """
+    from core.database import SessionLocal
+    from core.models_db import ScheduleRun
+
+    db = SessionLocal()
+    try:
+        runs = [
+            (run.task_id, run.status, run.file_name, run.params_json)
+            for run in db.query(ScheduleRun).filter(ScheduleRun.status.in_(("pending", "processing")))
+        ]
+        claimed = []
+        for task_id, status, file_name, params_json in runs:
+            updated = db.query(ScheduleRun).filter(
+                ScheduleRun.task_id == task_id, ScheduleRun.status == status,
+            ).update({ScheduleRun.status: "resuming"}, synchronize_session=False)
+            db.commit()
+            if updated:
+                claimed.append((task_id, file_name, params_json))
+    finally:
+        db.close()
+
+    restarted = 0
+    for task_id, file_name, params_json in claimed:
+        if not params_json or not os.path.exists(os.path.join(UPLOAD_FOLDER, f"{task_id}.xlsx")):
+            logger.warning("Task {}: Interrupted by a server restart and cannot be resumed", task_id)
+            _update_run_status(task_id, "error", message="Interrupted by a server restart.")
+            continue
+        logger.info("Task {}: Resuming after a server restart", task_id)
+        _start_schedule_thread(task_id, file_name, json.loads(params_json), resume=True)
+        restarted += 1
+    return restarted
 
 
 # ---------------------------------------------------------------------------
@@ -778,17 +1315,31 @@ async def get_status(
             raise HTTPException(status_code=403, detail="Access denied to this schedule run.")
 
     result_data = None
+    message = run.get("error_message") or ""
+    intermediate_version = intermediate_generation = None
     if run["status"] == "complete" and run.get("result_json"):
         try:
             result_data = _build_result(json.loads(run["result_json"]))
         except Exception:
             logger.warning("Task {}: Could not deserialize result_json", task_id)
+    elif run["status"] == "processing" and run.get("intermediate_json"):
+        # Best schedule so far of a running GA — usable before the run ends
+        try:
+            intermediate = json.loads(run["intermediate_json"])
+            result_data = _build_result(intermediate)
+            intermediate_version = run.get("intermediate_version")
+            intermediate_generation = intermediate.get("generation")
+            message = f"Best schedule so far (generation {intermediate_generation})."
+        except Exception:
+            logger.warning("Task {}: Could not deserialize intermediate_json", task_id)
 
     return ScheduleStatusResponse(
         task_id=task_id,
         state=run["status"],
-        message=run.get("error_message") or "",
+        message=message,
         result=result_data,
+        intermediate_version=intermediate_version,
+        intermediate_generation=intermediate_generation,
     )
 
 
@@ -840,6 +1391,47 @@ async def get_results(
     )
 
 
+# ---------------------------------------------------------------------------
+# DELETE /api/schedule/{task_id}
+# ---------------------------------------------------------------------------
+
+@router.delete(
+    "/{task_id}",
+    response_model=ScheduleStatusResponse,
+    status_code=202,
+    summary="Cancel a pending or running optimization",
+)
+async def cancel_run(
+    task_id: str,
+    current_user=Depends(get_current_user),
+) -> ScheduleStatusResponse:
+    run = _get_run(task_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found.")
+
+    # Ownership check
+    if run.get("user_id") is not None:
+        if not current_user.is_admin and current_user.id != run["user_id"]:
+            raise HTTPException(status_code=403, detail="Access denied to this schedule run.")
+
+    with _cancel_lock:
+        event = _cancel_events.get(task_id)
+    if run["status"] not in ("pending", "resuming", "processing") or event is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Task is not running. Task state: {run['status']}",
+        )
+
+    # Cooperative: the run stops at its next generation boundary
+    event.set()
+    logger.info("Task {}: Cancellation requested", task_id)
+    return ScheduleStatusResponse(
+        task_id=task_id,
+        state=run["status"],
+        message="Cancellation requested.",
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /api/schedule/download/{filename}
 # ---------------------------------------------------------------------------
@@ -896,6 +1488,8 @@ def _build_result(data: dict) -> ScheduleResultData:
             excel_url=best_run.get("excel_url"),
             schedule=[ScheduledOperationSchema(**op) for op in best_run.get("schedule", [])],
             utilization=[UtilizationSchema(**u) for u in best_run.get("utilization", [])],
+            lower_bound=best_run.get("lower_bound"),
+            optimality_gap=best_run.get("optimality_gap"),
         )
 
     return ScheduleResultData(
@@ -908,6 +1502,242 @@ def _build_result(data: dict) -> ScheduleResultData:
         excel_url=data.get("excel_url"),
         schedule=[ScheduledOperationSchema(**op) for op in data.get("schedule", [])],
         utilization=[UtilizationSchema(**u) for u in data.get("utilization", [])],
+        lower_bound=data.get("lower_bound"),
+        optimality_gap=data.get("optimality_gap"),
+        pareto_index=data.get("pareto_index"),
+    )
+
+
+def _result_fields(schedule: list, jobs: list, machines: list, lower_bound) -> dict:
+    """Metrics, operations and utilization of one schedule, as stored in result_json."""
+    from scheduler.bounds import optimality_gap
+    from scheduler.metrics import build_full_metrics
+
+    metrics = build_full_metrics(schedule, jobs, machines)
+    return {
+        "makespan": metrics.get("makespan", 0),
+        "total_tardiness": metrics.get("total_tardiness", 0),
+        "avg_flow_time": metrics.get("avg_flow_time", 0.0),
+        "on_time_percent": metrics.get("on_time_percent", 0.0),
+        "optimality_gap": optimality_gap(metrics.get("makespan", 0), lower_bound),
+        "schedule": [
+            {"job_id": op[0], "op_index": op[1], "machine_id": op[2], "start_time": op[3], "end_time": op[4]}
+            for op in schedule
+        ],
+        "utilization": [
+            {"machine_id": m_id, "utilization": util}
+            for m_id, util in metrics.get("utilization", {}).items()
+        ],
+    }
+
+
+def _get_pareto_run(task_id: str, current_user) -> tuple[dict, list]:
+    """A completed Pareto-mode run the current user may access, and its stored front."""
+    run = _get_run(task_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found.")
+
+    # Ownership check
+    if run.get("user_id") is not None:
+        if not current_user.is_admin and current_user.id != run["user_id"]:
+            raise HTTPException(status_code=403, detail="Access denied to this schedule run.")
+
+    if run["status"] != "complete" or not run.get("pareto_front_json"):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No Pareto front for this run. Task state: {run['status']}",
+        )
+    return run, json.loads(run["pareto_front_json"])
+
+
+# ---------------------------------------------------------------------------
+# GET /api/schedule/{task_id}/pareto
+# ---------------------------------------------------------------------------
+
+@router.get(
+    "/{task_id}/pareto",
+    response_model=ParetoFrontResponse,
+    summary="Makespan / tardiness Pareto front of a Pareto-mode GA run",
+)
+async def get_pareto_front(
+    task_id: str,
+    current_user=Depends(get_current_user),
+) -> ParetoFrontResponse:
+    run, front = _get_pareto_run(task_id, current_user)
+    selected = json.loads(run["result_json"]).get("pareto_index")
+    return ParetoFrontResponse(
+        task_id=task_id,
+        points=[
+            ParetoPointSchema(
+                index=i,
+                makespan=point["makespan"],
+                total_tardiness=point["total_tardiness"],
+                avg_flow_time=point["avg_flow_time"],
+                on_time_percent=point["on_time_percent"],
+                optimality_gap=point.get("optimality_gap"),
+                selected=i == selected,
+            )
+            for i, point in enumerate(front)
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# POST /api/schedule/{task_id}/pareto/{index}
+# ---------------------------------------------------------------------------
+
+@router.post(
+    "/{task_id}/pareto/{index}",
+    response_model=ScheduleStatusResponse,
+    summary="Make one schedule of the Pareto front the run's result",
+)
+def select_pareto_point(
+    task_id: str,
+    index: int,
+    current_user=Depends(get_current_user),
+) -> ScheduleStatusResponse:
+    """
+    Swap the run's result for a stored front schedule — no optimization
+    is re-run. Metrics, operation and job records, the Gantt chart and
+    the Excel report are updated to the selected schedule.
+    """
+    from core.database import SessionLocal
+    from core.models_db import ScheduleRun, JobRecord, OperationRecord
+    from visualization import create_gantt_chart
+
+    run, front = _get_pareto_run(task_id, current_user)
+    if not 0 <= index < len(front):
+        raise HTTPException(status_code=404, detail=f"Pareto front has no point {index} (size {len(front)}).")
+    point = front[index]
+    result = {**json.loads(run["result_json"]), **point, "pareto_index": index}
+    schedule = [
+        (op["job_id"], op["op_index"], op["machine_id"], op["start_time"], op["end_time"])
+        for op in point["schedule"]
+    ]
+
+    chart_path = os.path.join("static", f"gantt_{task_id}.png")
+    try:
+        create_gantt_chart(schedule, f"{result.get('algorithm', 'GA')} Schedule", chart_path)
+    except Exception as e:
+        logger.warning("Task {}: Gantt chart generation failed: {}", task_id, e)
+        result["chart_url"] = None
+
+    excel_path = os.path.join(OUTPUT_FOLDER, f"schedule_{task_id}.xlsx")
+    upload_path = os.path.join(UPLOAD_FOLDER, f"{task_id}.xlsx")
+    try:
+        from data_loader import load_data_from_excel
+        from exporter import export_to_excel
+
+        _, jobs = load_data_from_excel(upload_path)
+        export_to_excel(schedule, jobs, excel_path)
+    except Exception as e:
+        # Without the original upload the report cannot be rebuilt; never serve a stale one
+        logger.warning("Task {}: Excel export failed: {}", task_id, e)
+        result["excel_url"] = None
+
+    db = SessionLocal()
+    try:
+        run_row = db.query(ScheduleRun).filter(ScheduleRun.task_id == task_id).first()
+        run_row.makespan = result["makespan"]
+        run_row.total_tardiness = result["total_tardiness"]
+        run_row.avg_flow_time = result["avg_flow_time"]
+        run_row.on_time_percent = result["on_time_percent"]
+        run_row.chart_url = result.get("chart_url")
+        run_row.excel_url = result.get("excel_url")
+        run_row.result_json = json.dumps(result)
+
+        db.query(OperationRecord).filter(OperationRecord.run_id == run_row.id).delete()
+        for jid, oi, mid, st, et in schedule:
+            db.add(OperationRecord(
+                run_id=run_row.id,
+                job_id=jid, op_index=oi,
+                machine_id=mid, start_time=st, end_time=et,
+            ))
+
+        # Job records keep their due dates; completion and tardiness follow the schedule
+        job_completion: dict[str, float] = {}
+        for jid, _, _, _, et in schedule:
+            job_completion[str(jid)] = max(job_completion.get(str(jid), 0.0), et)
+        for job_row in db.query(JobRecord).filter(JobRecord.run_id == run_row.id).all():
+            ct = job_completion.get(job_row.job_id, 0.0)
+            job_row.completion_time = ct
+            job_row.tardiness = max(0.0, ct - (job_row.due_date or ct))
+        db.commit()
+    finally:
+        db.close()
+
+    logger.info(
+        "Task {}: Selected Pareto point {} (makespan={}, tardiness={})",
+        task_id, index, result["makespan"], result["total_tardiness"],
+    )
+    return ScheduleStatusResponse(
+        task_id=task_id,
+        state="complete",
+        message=f"Pareto point {index} selected.",
+        result=_build_result(result),
+    )
+
+
+# ---------------------------------------------------------------------------
+# POST /api/schedule/{task_id}/extend
+# ---------------------------------------------------------------------------
+
+@router.post(
+    "/{task_id}/extend",
+    response_model=UploadResponse,
+    status_code=202,
+    summary="Continue a finished GA run for more generations",
+)
+def extend_run(
+    task_id: str,
+    generations: int = Form(default=50, ge=1, le=2000),
+    time_limit: Optional[float] = Form(default=None, gt=0, le=3600),
+    stagnation_limit: Optional[int] = Form(default=None, ge=1, le=2000),
+    current_user=Depends(get_current_user),
+) -> UploadResponse:
+    """
+    Evolve a completed GA run's checkpointed population for `generations`
+    more generations instead of starting from scratch. The run is processing
+    again until the extension finishes, then its result is replaced by the
+    best schedule found over the whole run. Checkpoints are kept for
+    GA_CHECKPOINT_RETENTION_HOURS after a run ends; cancelled runs have none.
+    """
+    run = _get_run(task_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found.")
+
+    # Ownership check
+    if run.get("user_id") is not None:
+        if not current_user.is_admin and current_user.id != run["user_id"]:
+            raise HTTPException(status_code=403, detail="Access denied to this schedule run.")
+
+    if run["status"] != "complete":
+        raise HTTPException(status_code=409, detail=f"Task is not complete. Task state: {run['status']}")
+    if (
+        run["algorithm"] != "GA"
+        or not run.get("params_json")
+        or not os.path.exists(_checkpoint_path(task_id))
+        or not os.path.exists(os.path.join(UPLOAD_FOLDER, f"{task_id}.xlsx"))
+    ):
+        raise HTTPException(status_code=409, detail="This run has no checkpoint to extend.")
+
+    params = json.loads(run["params_json"])
+    params.update({
+        "generations": (run.get("generations_run") or 0) + generations,
+        "time_limit": time_limit,
+        "stagnation_limit": stagnation_limit,
+    })
+    # Stored with the claim, so a restart during the extension resumes it to the same target.
+    # The claim is conditional: of two concurrent requests only one starts an extension.
+    if not _claim_run(task_id, "complete", "processing", stop_reason=None, params_json=json.dumps(params)):
+        raise HTTPException(status_code=409, detail="Task is already being extended.")
+
+    logger.info("Task {}: Extending GA run to {} generations", task_id, params["generations"])
+    _start_schedule_thread(task_id, run.get("file_name") or "", params, resume=True)
+    return UploadResponse(
+        task_id=task_id,
+        message=f"GA run extended by {generations} generations.",
+        status_url=f"/api/schedule/status/{task_id}",
     )
 
 
@@ -65,7 +65,7 @@ class ScheduleRequest(BaseModel):
     )
     algorithm: str = Field(
         default="GA",
-        description="Primary algorithm to run. One of: GA, FCFS, SPT, EDD, WSPT.",
+        description="Primary algorithm to run. One of: GA, SA, RL or any key of ALGORITHM_MAP (FCFS, SPT, EDD, WSPT, ACTIVE, ATC, MWKR, CR, SLACK, TABU).",
     )
     pop_size: int = Field(
         default=30,
@@ -107,7 +107,9 @@ class ScheduleRequest(BaseModel):
     @field_validator("algorithm")
     @classmethod
     def validate_algorithm(cls, v: str) -> str:
-        allowed = {"GA", "FCFS", "SPT", "EDD", "WSPT", "RL"}
+        from scheduler.engine import ALGORITHM_MAP
+
+        allowed = {"GA", "SA", "RL", *ALGORITHM_MAP}
         if v.upper() not in allowed:
             raise ValueError(f"algorithm must be one of {allowed}")
         return v.upper()
@@ -167,23 +169,65 @@ class ScheduleResultData(BaseModel):
         default_factory=list,
         description="Per-machine utilization breakdown.",
     )
+    lower_bound: Optional[float] = Field(
+        None,
+        description="Makespan lower bound of the instance; no schedule can finish earlier.",
+    )
+    optimality_gap: Optional[float] = Field(
+        None,
+        description="Percentage by which makespan exceeds lower_bound (0 = provably optimal).",
+    )
+    pareto_index: Optional[int] = Field(
+        None,
+        description="Position of this schedule in the run's Pareto front (Pareto-mode runs only).",
+    )
 
 
 class ScheduleStatusResponse(BaseModel):
     """
     Response for GET /api/schedule/status/{task_id}.
-    Clients should poll this endpoint until state == 'complete' or 'error'.
+    Clients should poll this endpoint until state is 'complete', 'error' or 'cancelled'.
     """
 
     task_id: str
-    state: str = Field(..., description="One of: pending, processing, complete, error.")
+    state: str = Field(..., description="One of: pending, resuming, processing, complete, error, cancelled.")
     message: str = Field(default="", description="Human-readable status message.")
     result: Optional[ScheduleResultData] = Field(
         None,
-        description="Populated only when state == 'complete'.",
+        description=(
+            "The final result when state == 'complete'; while a GA run is 'processing', "
+            "its best schedule so far (no chart or Excel report yet), if any."
+        ),
+    )
+    intermediate_version: Optional[int] = Field(
+        None,
+        description="Version of the intermediate result, incremented on every new best schedule.",
+    )
+    intermediate_generation: Optional[int] = Field(
+        None,
+        description="Generation at which the intermediate result was found.",
     )
 
 
+class ParetoPointSchema(BaseModel):
+    """One schedule of a Pareto-mode run's makespan / tardiness front."""
+
+    index: int = Field(..., description="Position in the front, by increasing makespan.")
+    makespan: int
+    total_tardiness: int
+    avg_flow_time: float
+    on_time_percent: float
+    optimality_gap: Optional[float] = None
+    selected: bool = Field(False, description="True for the schedule currently shown as the run's result.")
+
+
+class ParetoFrontResponse(BaseModel):
+    """Response for GET /api/schedule/{task_id}/pareto."""
+
+    task_id: str
+    points: list[ParetoPointSchema] = Field(default_factory=list)
+
+
 class UploadResponse(BaseModel):
     """Response returned immediately after a successful file upload."""
 
@@ -386,13 +430,15 @@ class ComparisonRunResult(BaseModel):
     utilization: list[UtilizationSchema] = Field(default_factory=list)
     chart_url: Optional[str] = None
     excel_url: Optional[str] = None
+    lower_bound: Optional[float] = None
+    optimality_gap: Optional[float] = None
 
 
 class ComparisonResultResponse(BaseModel):
     """Response containing side-by-side results for multiple compared algorithms."""
 
     task_id: str
-    state: str = Field(..., description="One of: pending, processing, complete, error.")
+    state: str = Field(..., description="One of: pending, resuming, processing, complete, error, cancelled.")
     message: str = Field(default="")
     results: Optional[list[ComparisonRunResult]] = Field(
         None,
@@ -2,7 +2,6 @@
 import os
 import threading
 import uuid
-import copy
 from flask import Flask, render_template, request, send_file, jsonify
 
 # --- Custom Modules ---
@@ -38,13 +37,12 @@ def process_schedule(task_id, filepath, setup_time, pop_size, gens, w_makespan,
     try:
         JOBS[task_id]['message'] = "Loading Data..."
         machines, jobs_data = load_data_from_excel(filepath)
-        machines_copy = copy.deepcopy(machines)
 
         JOBS[task_id]['message'] = "Running Genetic Algorithm..."
         
         # Run GA
         schedule_result = run_genetic_algorithm(
-            jobs_data, machines_copy, setup_time,
+            jobs_data, machines, setup_time,
             pop_size, gens, 0.1, 3, w_makespan, w_tardiness
         )
 
@@ -105,6 +105,22 @@ class ScheduleRun(Base):
         String(20), nullable=True, default="initial"
     )  # "initial", "breakdown", "rush_order"
 
+    # GA early stopping: why evolution stopped and how far it got
+    stop_reason: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    generations_run: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # NSGA-II Pareto mode: every schedule of the makespan / tardiness front
+    # (JSON list, same fields as result_json); result_json holds the selected one
+    pareto_front_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Upload parameters (JSON), so an interrupted run can be restarted or extended
+    params_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Anytime results: best schedule so far of a processing GA run (JSON, same
+    # fields as result_json) and how many times it has been replaced
+    intermediate_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    intermediate_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
     # Relationships
     user: Mapped[Optional["User"]] = relationship("User", back_populates="schedule_runs")
     parent_run: Mapped[Optional["ScheduleRun"]] = relationship(
@@ -91,7 +91,7 @@ function Metric({ value, unit = "" }: { value: number | null; unit?: string }) {
 // ── Main page ─────────────────────────────────────────────────────────────
 
 const ALGORITHMS = ["", "GA", "FCFS", "SPT", "EDD", "WSPT"];
-const STATUSES = ["", "pending", "processing", "complete", "error"];
+const STATUSES = ["", "pending", "processing", "complete", "error", "cancelled"];
 
 export default function HistoryPage() {
   const [runs, setRuns] = useState<ScheduleRunSummary[]>([]);
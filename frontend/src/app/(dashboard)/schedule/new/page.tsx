@@ -15,6 +15,8 @@ const DEFAULT_CONFIG = {
   mutation_rate: 0.1,
   w_makespan: 0.6,
   w_tardiness: 0.4,
+  pareto: false,
+  auto_tune: false,
 };
 
 export default function NewSchedulePage() {
@@ -25,7 +27,7 @@ export default function NewSchedulePage() {
   const [error, setError] = useState<string | null>(null);
   const [fileError, setFileError] = useState<string | null>(null);
 
-  const handleConfigChange = (field: string, value: string | number) => {
+  const handleConfigChange = (field: string, value: string | number | boolean) => {
     setConfig((prev) => ({ ...prev, [field]: value }));
   };
 
@@ -40,7 +42,11 @@ export default function NewSchedulePage() {
     setLoading(true);
 
     try {
-      const res = await uploadSchedule(file, config);
+      const res = await uploadSchedule(file, {
+        ...config,
+        pareto: config.algorithm === "GA" && config.pareto,
+        auto_tune: config.algorithm === "GA" && config.auto_tune,
+      });
       router.push(`/schedule/status/${res.task_id}`);
     } catch (err: unknown) {
       const msg = err instanceof Error ? err.message : "Failed to start schedule optimization.";
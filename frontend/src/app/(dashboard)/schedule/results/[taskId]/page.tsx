@@ -5,6 +5,7 @@ import { useRouter } from "next/navigation";
 import { ArrowLeft, RefreshCw, Loader2, AlertTriangle, Zap, Play, Plus, Trash2, Download, Info, SlidersHorizontal } from "lucide-react";
 import KPICards from "@/components/results/KPICards";
 import ExportButtons from "@/components/results/ExportButtons";
+import ParetoFront from "@/components/results/ParetoFront";
 import GanttChart from "@/components/gantt/GanttChart";
 import { getResults, StatusResponse, rescheduleBreakdown, rescheduleRushOrder, getCompareResults, ComparisonRunResult, resourceUrl } from "@/lib/api";
 import ComparisonChart from "@/components/analytics/ComparisonChart";
@@ -262,6 +263,11 @@ export default function ResultsPage({ params }: { params: Promise<{ taskId: stri
         />
       </div>
 
+      {/* Pareto front (only for Pareto-mode GA runs) */}
+      {result.pareto_index != null && taskId && (
+        <ParetoFront taskId={taskId} onSelect={setData} />
+      )}
+
       {/* Comparative Dashboard (only for COMPARE algorithm runs) */}
       {result.algorithm === "COMPARE" && compareResults && (
         <div style={{ display: "flex", flexDirection: "column", gap: 24, marginBottom: 24 }}>
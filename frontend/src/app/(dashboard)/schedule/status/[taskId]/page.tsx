@@ -16,6 +16,13 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
     result: null,
   });
   const [apiError, setApiError] = useState<string | null>(null);
+  // Best schedule so far of a running GA (stored server-side, fetchable via /status)
+  const [intermediate, setIntermediate] = useState<{
+    version: number;
+    generation: number;
+    makespan: number;
+    total_tardiness: number;
+  } | null>(null);
 
   // Keep track of the latest status to read it from within the effect without triggers
   const statusRef = useRef(status);
@@ -42,12 +49,20 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
           const s = await getStatus(taskId);
           if (!isMounted) return;
           setStatus(s);
+          if (s.state === "processing" && s.result && s.intermediate_version != null) {
+            setIntermediate({
+              version: s.intermediate_version,
+              generation: s.intermediate_generation ?? 0,
+              makespan: s.result.makespan,
+              total_tardiness: s.result.total_tardiness,
+            });
+          }
           if (s.state === "complete") {
             if (pollInterval) clearInterval(pollInterval);
             setTimeout(() => {
               if (isMounted) router.push(`/schedule/results/${taskId}`);
             }, 800);
-          } else if (s.state === "error") {
+          } else if (s.state === "error" || s.state === "cancelled") {
             if (pollInterval) clearInterval(pollInterval);
           }
         } catch (err) {
@@ -82,6 +97,13 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
                 state: "processing",
                 message: `Optimizing... Generation ${data.generation}/${data.total_generations} (Best makespan/fitness: ${data.best_fitness})`,
               }));
+            } else if (data.type === "intermediate") {
+              setIntermediate({
+                version: data.version,
+                generation: data.generation,
+                makespan: data.makespan,
+                total_tardiness: data.total_tardiness,
+              });
             } else if (data.type === "complete") {
               setStatus({
                 task_id: taskId,
@@ -101,6 +123,14 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
                 result: null,
               });
               if (ws) ws.close();
+            } else if (data.type === "cancelled") {
+              setStatus({
+                task_id: taskId,
+                state: "cancelled",
+                message: "Optimization cancelled.",
+                result: null,
+              });
+              if (ws) ws.close();
             }
           } catch (err) {
             console.error("Failed to parse WS payload", err);
@@ -117,7 +147,7 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
         ws.onclose = (event) => {
           console.log("WebSocket closed with code:", event.code);
           // If closed prematurely (not completed/error state), trigger polling
-          if (event.code !== 1000 && isMounted && statusRef.current.state !== "complete" && statusRef.current.state !== "error") {
+          if (event.code !== 1000 && isMounted && statusRef.current.state !== "complete" && statusRef.current.state !== "error" && statusRef.current.state !== "cancelled") {
             startPolling();
           }
         };
@@ -166,6 +196,26 @@ export default function StatusPage({ params }: { params: Promise<{ taskId: strin
           taskId={taskId ?? "—"}
         />
 
+        {status.state === "processing" && intermediate && (
+          <div
+            style={{
+              marginTop: 24,
+              padding: "14px 16px",
+              background: "rgba(37,99,235,0.06)",
+              border: "1px solid rgba(37,99,235,0.2)",
+              borderRadius: "var(--radius-md)",
+              fontSize: "0.875rem",
+            }}
+          >
+            <div style={{ fontWeight: 600, marginBottom: 4 }}>Best schedule so far</div>
+            <div style={{ color: "var(--text-secondary)" }}>
+              Makespan {intermediate.makespan}, total tardiness {intermediate.total_tardiness} — found at generation{" "}
+              {intermediate.generation} (version {intermediate.version}). Available from the status endpoint
+              before the run finishes.
+            </div>
+          </div>
+        )}
+
         {status.state === "complete" && (
           <div
             style={{
@@ -0,0 +1,96 @@
+"use client";
+
+import React, { useEffect, useState } from "react";
+import { Loader2, Check } from "lucide-react";
+import { getParetoFront, selectParetoPoint, ParetoPoint, StatusResponse } from "@/lib/api";
+
+interface ParetoFrontProps {
+  taskId: string;
+  /** Called with the run's new result after a point is selected */
+  onSelect: (res: StatusResponse) => void;
+}
+
+export default function ParetoFront({ taskId, onSelect }: ParetoFrontProps) {
+  const [points, setPoints] = useState<ParetoPoint[] | null>(null);
+  const [pending, setPending] = useState<number | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    getParetoFront(taskId)
+      .then((res) => setPoints(res.points))
+      .catch((err) => setError(err instanceof Error ? err.message : "Failed to load Pareto front."));
+  }, [taskId]);
+
+  const handleSelect = async (index: number) => {
+    setPending(index);
+    setError(null);
+    try {
+      const res = await selectParetoPoint(taskId, index);
+      setPoints((prev) => prev?.map((p) => ({ ...p, selected: p.index === index })) ?? null);
+      onSelect(res);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : "Failed to select schedule.");
+    } finally {
+      setPending(null);
+    }
+  };
+
+  return (
+    <div className="card" style={{ marginBottom: 24 }}>
+      <h2 style={{ fontSize: "1rem", fontWeight: 600, marginBottom: 4 }}>Makespan / Tardiness Trade-off</h2>
+      <p style={{ fontSize: "0.875rem", color: "var(--text-secondary)", marginBottom: 16 }}>
+        Every schedule below is Pareto-optimal: none is better in both makespan and tardiness. Switching
+        between them does not re-run the optimization.
+      </p>
+      {error && <p style={{ color: "var(--error)", fontSize: "0.875rem", marginBottom: 12 }}>{error}</p>}
+      {!points ? (
+        !error && <Loader2 size={20} className="animate-spin" style={{ color: "var(--secondary)" }} />
+      ) : (
+        <table style={{ width: "100%", borderCollapse: "collapse", fontSize: "0.875rem" }}>
+          <thead>
+            <tr style={{ textAlign: "left", color: "var(--text-muted)" }}>
+              <th style={{ padding: "6px 8px" }}>Makespan</th>
+              <th style={{ padding: "6px 8px" }}>Total Tardiness</th>
+              <th style={{ padding: "6px 8px" }}>Avg Flow Time</th>
+              <th style={{ padding: "6px 8px" }}>On-Time</th>
+              <th style={{ padding: "6px 8px" }} />
+            </tr>
+          </thead>
+          <tbody>
+            {points.map((p) => (
+              <tr
+                key={p.index}
+                style={{
+                  borderTop: "1px solid var(--border)",
+                  background: p.selected ? "rgba(37,99,235,0.06)" : undefined,
+                }}
+              >
+                <td style={{ padding: "6px 8px" }}>{p.makespan}</td>
+                <td style={{ padding: "6px 8px" }}>{p.total_tardiness}</td>
+                <td style={{ padding: "6px 8px" }}>{p.avg_flow_time.toFixed(1)}</td>
+                <td style={{ padding: "6px 8px" }}>{p.on_time_percent.toFixed(0)}%</td>
+                <td style={{ padding: "6px 8px", textAlign: "right" }}>
+                  {p.selected ? (
+                    <span style={{ display: "inline-flex", alignItems: "center", gap: 4, color: "var(--secondary)" }}>
+                      <Check size={14} /> Shown
+                    </span>
+                  ) : (
+                    <button
+                      type="button"
+                      className="btn btn-secondary"
+                      style={{ height: 28, fontSize: "0.8125rem" }}
+                      disabled={pending !== null}
+                      onClick={() => handleSelect(p.index)}
+                    >
+                      {pending === p.index ? <Loader2 size={12} className="animate-spin" /> : "Use this schedule"}
+                    </button>
+                  )}
+                </td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      )}
+    </div>
+  );
+}
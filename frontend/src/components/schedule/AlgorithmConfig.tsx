@@ -11,16 +11,25 @@ interface AlgorithmConfigProps {
     mutation_rate: number;
     w_makespan: number;
     w_tardiness: number;
+    pareto: boolean;
+    auto_tune: boolean;
   };
-  onChange: (field: string, value: string | number) => void;
+  onChange: (field: string, value: string | number | boolean) => void;
 }
 
 const ALGORITHMS = [
   { value: "GA",   label: "Genetic Algorithm",         desc: "Multi-objective optimization (recommended)" },
+  { value: "SA",   label: "Simulated Annealing",       desc: "Parallel annealing chains sharing the best schedule" },
   { value: "FCFS", label: "First-Come First-Served",   desc: "Processes jobs in arrival order" },
   { value: "SPT",  label: "Shortest Processing Time",  desc: "Minimizes average flow time" },
   { value: "EDD",  label: "Earliest Due Date",         desc: "Minimizes maximum tardiness" },
   { value: "WSPT", label: "Weighted SPT",              desc: "Priority-weighted variant of SPT" },
+  { value: "ACTIVE", label: "Active (gap filling)",    desc: "Input order, reusing idle machine gaps" },
+  { value: "ATC",  label: "Apparent Tardiness Cost",   desc: "Dispatching rule for weighted tardiness" },
+  { value: "MWKR", label: "Most Work Remaining",       desc: "Dispatching rule, long jobs first" },
+  { value: "CR",   label: "Critical Ratio",            desc: "Dispatching rule, due date vs. remaining work" },
+  { value: "SLACK", label: "Minimum Slack",            desc: "Dispatching rule, least slack first" },
+  { value: "TABU", label: "Tabu Search",              desc: "Critical-block local search from the best rule" },
 ];
 
 function SliderField({
@@ -188,6 +197,27 @@ export default function AlgorithmConfig({ values, onChange }: AlgorithmConfigPro
           >
             Genetic Algorithm Parameters
           </div>
+          <label
+            htmlFor="auto-tune"
+            style={{ display: "flex", alignItems: "flex-start", gap: 10, cursor: "pointer" }}
+          >
+            <input
+              id="auto-tune"
+              type="checkbox"
+              checked={values.auto_tune}
+              onChange={(e) => onChange("auto_tune", e.target.checked)}
+              style={{ marginTop: 3, accentColor: "var(--secondary)" }}
+            />
+            <span>
+              <span style={{ display: "block", fontSize: "0.875rem", fontWeight: 500, color: "var(--text-primary)" }}>
+                Auto-tune
+              </span>
+              <span style={{ fontSize: "0.8125rem", color: "var(--text-muted)" }}>
+                Race candidate settings on this data and use the best within the server&apos;s time budget;
+                the sliders below are ignored
+              </span>
+            </span>
+          </label>
           <SliderField
             label="Population Size"
             id="pop-size"
@@ -244,6 +274,26 @@ export default function AlgorithmConfig({ values, onChange }: AlgorithmConfigPro
               onChange("w_makespan", Math.round((1 - v) * 10) / 10);
             }}
           />
+          <label
+            htmlFor="pareto"
+            style={{ display: "flex", alignItems: "flex-start", gap: 10, cursor: "pointer" }}
+          >
+            <input
+              id="pareto"
+              type="checkbox"
+              checked={values.pareto}
+              onChange={(e) => onChange("pareto", e.target.checked)}
+              style={{ marginTop: 3, accentColor: "var(--secondary)" }}
+            />
+            <span>
+              <span style={{ display: "block", fontSize: "0.875rem", fontWeight: 500, color: "var(--text-primary)" }}>
+                Pareto front
+              </span>
+              <span style={{ fontSize: "0.8125rem", color: "var(--text-muted)" }}>
+                Find the whole makespan / tardiness trade-off in one run; the weights pick the schedule shown first
+              </span>
+            </span>
+          </label>
         </>
       )}
     </div>
@@ -3,7 +3,7 @@
 import React from "react";
 import { CheckCircle2, Circle, Loader2, XCircle } from "lucide-react";
 
-export type ScheduleState = "pending" | "processing" | "complete" | "error";
+export type ScheduleState = "pending" | "resuming" | "processing" | "complete" | "error" | "cancelled";
 
 const STEPS = [
   { key: "pending",    label: "Queued",             desc: "Job queued for processing" },
@@ -14,8 +14,10 @@ const STEPS = [
 function stepStatus(step: string, current: ScheduleState) {
   const order: ScheduleState[] = ["pending", "processing", "complete"];
   const si = order.indexOf(step as ScheduleState);
-  const ci = order.indexOf(current === "error" ? "processing" : current);
-  if (current === "error" && step === "complete") return "error";
+  const stopped = current === "error" || current === "cancelled";
+  // A run claimed for restart after a server restart is queued again
+  const ci = order.indexOf(stopped ? "processing" : current === "resuming" ? "pending" : current);
+  if (stopped && step === "complete") return "error";
   if (si < ci) return "done";
   if (si === ci) return "active";
   return "upcoming";
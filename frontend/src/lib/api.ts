@@ -38,13 +38,34 @@ export interface ScheduleResultData {
   excel_url: string | null;
   schedule: ScheduledOperation[];
   utilization: UtilizationEntry[];
+  lower_bound?: number | null;
+  optimality_gap?: number | null;
+  pareto_index?: number | null;
+}
+
+export interface ParetoPoint {
+  index: number;
+  makespan: number;
+  total_tardiness: number;
+  avg_flow_time: number;
+  on_time_percent: number;
+  optimality_gap?: number | null;
+  selected: boolean;
+}
+
+export interface ParetoFrontResponse {
+  task_id: string;
+  points: ParetoPoint[];
 }
 
 export interface StatusResponse {
   task_id: string;
-  state: "pending" | "processing" | "complete" | "error";
+  state: "pending" | "processing" | "complete" | "error" | "cancelled";
   message: string;
   result: ScheduleResultData | null;
+  /** Set while a GA run is processing and `result` is its best schedule so far */
+  intermediate_version?: number | null;
+  intermediate_generation?: number | null;
 }
 
 export interface HealthResponse {
@@ -55,13 +76,15 @@ export interface HealthResponse {
 export interface ScheduleRunSummary {
   task_id: string;
   created_at: string;
-  status: "pending" | "processing" | "complete" | "error";
+  status: "pending" | "processing" | "complete" | "error" | "cancelled";
   algorithm: string | null;
   file_name: string | null;
   makespan: number | null;
   total_tardiness: number | null;
   avg_flow_time: number | null;
   on_time_percent: number | null;
+  stop_reason?: string | null;
+  generations_run?: number | null;
 }
 
 export interface HistoryResponse {
@@ -134,6 +157,8 @@ export interface ComparisonRunResult {
   excel_url: string | null;
   schedule: ScheduledOperation[];
   utilization: UtilizationEntry[];
+  lower_bound?: number | null;
+  optimality_gap?: number | null;
 }
 
 export interface ComparisonResultResponse {
@@ -288,6 +313,8 @@ export async function uploadSchedule(
     mutation_rate?: number;
     w_makespan?: number;
     w_tardiness?: number;
+    pareto?: boolean;
+    auto_tune?: boolean;
   }
 ): Promise<UploadResponse> {
   const form = new FormData();
@@ -306,11 +333,36 @@ export async function getStatus(taskId: string): Promise<StatusResponse> {
   return apiFetch<StatusResponse>(`/api/schedule/status/${taskId}`);
 }
 
+/** DELETE /api/schedule/{taskId} — stop a pending or running optimization */
+export async function cancelSchedule(taskId: string): Promise<StatusResponse> {
+  return apiFetch<StatusResponse>(`/api/schedule/${taskId}`, { method: "DELETE" });
+}
+
 /** GET /api/schedule/results/{taskId} */
 export async function getResults(taskId: string): Promise<StatusResponse> {
   return apiFetch<StatusResponse>(`/api/schedule/results/${taskId}`);
 }
 
+/** GET /api/schedule/{taskId}/pareto — makespan / tardiness front of a Pareto-mode run */
+export async function getParetoFront(taskId: string): Promise<ParetoFrontResponse> {
+  return apiFetch<ParetoFrontResponse>(`/api/schedule/${taskId}/pareto`);
+}
+
+/** POST /api/schedule/{taskId}/pareto/{index} — make a front schedule the run's result */
+export async function selectParetoPoint(taskId: string, index: number): Promise<StatusResponse> {
+  return apiFetch<StatusResponse>(`/api/schedule/${taskId}/pareto/${index}`, { method: "POST" });
+}
+
+/** POST /api/schedule/{taskId}/extend — continue a finished GA run from its checkpoint */
+export async function extendSchedule(taskId: string, generations: number): Promise<UploadResponse> {
+  const form = new FormData();
+  form.append("generations", String(generations));
+  return apiFetch<UploadResponse>(`/api/schedule/${taskId}/extend`, {
+    method: "POST",
+    body: form,
+  });
+}
+
 /** Build an absolute URL for a backend resource (Gantt PNG, Excel download) */
 export function resourceUrl(path: string | null | undefined): string | null {
   if (!path) return null;
@@ -6,14 +6,23 @@ This module implements the core GA loop:
 1.  Population Initialization
 2.  Fitness Evaluation (Multi-Objective)
 3.  Selection (Tournament)
-4.  Crossover (Ordered)
-5.  Mutation (Swap)
+4.  Crossover (Ordered OX1, or Partially Mapped PMX)
+5.  Mutation (Swap, or Insertion)
+
+Chromosomes are compact array('i') permutations of job indices — the
+same indices the compiled ProblemInstance uses — so they are decoded
+without any Job-to-index lookups and every operator runs in O(n).
+
+`run_nsga2` evolves the same chromosomes with NSGA-II ranking instead of a
+weighted fitness and returns the whole makespan / tardiness Pareto front.
 """
 import random
-import copy
+import time
+from array import array
 from core.logger import logger
+from scheduler.metrics import schedule_objectives
 
-def run_genetic_algorithm(jobs, machines, setup_time, pop_size, num_gen, mut_rate, tourn_size, w_makespan, w_tardiness, progress_callback=None):
+def run_genetic_algorithm(jobs, machines, setup_time, pop_size, num_gen, mut_rate, tourn_size, w_makespan, w_tardiness, progress_callback=None, instance=None, prefix_cache=False, stats=None, backend="auto", decoder="fcfs", stop_at_bound=True, workers=1, fitness_cache=0, crossover_op="ox1", mutation_op="swap", islands=1, migration_interval=10, migrants=1, time_limit=None, stagnation_limit=None, target_fitness=None, cancel_event=None, seed_ratio=0.0, seed_orderings=None, local_search=False, local_search_rate=0.1, local_search_time=0.1, checkpoint_path=None, checkpoint_interval=60.0, resume_from=None, best_callback=None, best_callback_interval=5.0, prescreen=False, rng=None):
     """
     Runs the complete Genetic Algorithm to find a near-optimal schedule.
     
@@ -29,83 +38,882 @@ def run_genetic_algorithm(jobs, machines, setup_time, pop_size, num_gen, mut_rat
         w_tardiness (float): The weight for the tardiness objective.
         progress_callback: Optional callable(generation, total_generations, best_fitness)
             for real-time WebSocket progress reporting (Phase 3).
+        best_callback: Optional callable(generation, schedule, makespan, tardiness)
+            receiving the best schedule so far whenever it improves, at most
+            once every `best_callback_interval` seconds. An improvement inside
+            the interval is handed over when it ends, so the caller always
+            catches up with the run; only handed-over orderings are decoded.
+        instance (ProblemInstance): Optional pre-compiled instance for `jobs` and
+            `machines`. Compiled once per run when omitted, so each fitness
+            evaluation decodes over flat arrays instead of the object graph.
+        prefix_cache (bool): Resume each decode from the longest ordering prefix
+            already decoded (see scheduler/prefix_cache.py). Same results;
+            about 1.8x faster once the population has converged, slightly
+            slower before. Off by default.
+        stats (dict): Optional dict that receives run statistics.
+        backend (str): "python" decodes individuals one at a time; "numpy"
+            evaluates each generation's objectives in one batched pass
+            (scheduler/batch_decoder.py) and builds only the best schedule;
+            "numba" evaluates objectives with the JIT kernel
+            (scheduler/kernel.py). "auto" picks "numba" when Numba is
+            installed and the instance is large enough, else "python".
+        decoder (str): "fcfs" appends each operation after the machine's last
+            one; "active" fills earlier idle gaps (scheduler/gap_fill.py) and
+            runs on the "python" backend only.
+        stop_at_bound (bool): Stop evolving once the best fitness reaches the
+            lower bound from scheduler/bounds.py — no schedule can do better.
+        workers (int): Evaluate each generation on this many worker processes
+            (scheduler/parallel.py). 1 evaluates in the calling thread.
+            Not combinable with the "numpy" backend or prefix_cache.
+        fitness_cache (int): Remember the objectives of up to this many
+            orderings (scheduler/fitness_cache.py) so repeated chromosomes,
+            such as the elite, are not decoded again. 0 disables the cache.
+        crossover_op (str): "ox1" (ordered) or "pmx" (partially mapped).
+        mutation_op (str): "swap" or "insertion".
+        islands (int): Island model — run this many independent populations
+            of `pop_size`, one per worker process, each with its own RNG
+            stream. Every `migration_interval` generations each island's
+            best `migrants` individuals replace the worst of the next island
+            on a ring. Not combinable with workers > 1, the "numpy" backend
+            or prefix_cache.
+        time_limit (float): Wall-clock budget in seconds; evolution stops at
+            the first generation boundary past it.
+        stagnation_limit (int): Stop after this many generations without an
+            improvement of the best fitness.
+        target_fitness (float): Stop as soon as the best fitness is at or
+            below this value.
+        cancel_event: Optional threading.Event; setting it from another
+            thread stops the run at the next generation boundary. The best
+            schedule found so far is still returned.
+        seed_ratio (float): Share (0.0 - 1.0) of the initial population seeded
+            from heuristic orderings and small perturbations of them; the
+            rest is random. 0 starts from random permutations only.
+        seed_orderings (list): Job-index orderings to seed from. Defaults to
+            one per distinct ALGORITHM_MAP schedule (scheduler/seeding.py).
+        local_search (bool): Memetic step — every generation, improve the
+            elite and a `local_search_rate` share of the other individuals
+            with swap/insertion local search (scheduler/local_search.py),
+            for at most `local_search_time` seconds per generation.
+            Improved orderings replace the originals. "fcfs" decoder only,
+            not combinable with the island model.
+        prescreen (bool): Abandon the decode of a child once a lower bound on
+            its fitness shows it can never win a tournament
+            (scheduler/prescreen.py). Selection and results are unchanged;
+            stats["prescreen"] counts the abandoned decodes per generation.
+            Applies to the serial "python" backend with the "fcfs" decoder
+            and non-negative weights; "auto" then keeps the JIT kernel
+            when it would pick it.
+        checkpoint_path (str): Write the population, RNG state, best
+            ordering and generation counter to this file
+            (scheduler/checkpoint.py) at the first generation boundary
+            every `checkpoint_interval` seconds, and once more when the run
+            ends. Not combinable with the island model.
+        resume_from (str): Continue from a checkpoint of the same problem
+            instead of a new population. `num_gen` is the total number of
+            generations, so the run evolves from the checkpoint's generation
+            up to `num_gen` — pass a larger value to extend a finished run.
+            The checkpoint's RNG state is restored into `rng`.
+        rng (random.Random): Source of every random choice of the run.
+            Defaults to the `random` module, so random.seed() applies;
+            concurrent runs in one process (the API server) should each
+            pass their own random.Random, since resuming a checkpoint
+            sets the state of `rng`.
+
+        The stopping criteria are checked after every generation (after
+        every migration epoch in island mode), and stats["stop_reason"] is
+        set to "completed", "lower_bound", "target_fitness", "stagnation",
+        "time_limit" or "cancelled".
 
     Returns:
         list: The best schedule found by the algorithm.
     """
-    from scheduler.engine import schedule_fcfs  # Import from dedicated engine module
-    
-    population = create_initial_population(jobs, pop_size)
-    best_overall_schedule = None
-    best_overall_fitness = float('inf')
+    from scheduler.engine import evaluate_instance, schedule_instance  # Import from dedicated engine module
+    from scheduler.instance import compile_instance, snapshot_machine_state
+    from scheduler.prefix_cache import PrefixCheckpointEvaluator
+    from scheduler.kernel import KernelDecoder, use_kernel
+    from scheduler.gap_fill import schedule_instance_gap_fill
+    from scheduler.bounds import lower_bounds
 
-    logger.info("Running Genetic Algorithm (Multi-Objective) | Pop={}, Gen={}, M-Rate={}", pop_size, num_gen, mut_rate)
-    logger.info("Fitness Weights: Makespan={}, Tardiness={}", w_makespan, w_tardiness)
-    
-    # Start the evolution loop
-    for gen in range(num_gen):
-        fitness_scores = []
-        
-        # 1. Calculate fitness for each individual in the population
-        for chromosome in population:
-            machine_copy = copy.deepcopy(machines)
-            # Use the main scheduler as the fitness function
-            current_schedule = schedule_fcfs(chromosome, machine_copy, setup_time)
-            
-            # --- Multi-Objective Fitness Calculation ---
-            makespan = max(op[4] for op in current_schedule) if current_schedule else 0
-            total_tardiness = calculate_tardiness(current_schedule, jobs)
-            
-            # Combine objectives into a single fitness score
-            fitness = (makespan * w_makespan) + (total_tardiness * w_tardiness)
-            
-            fitness_scores.append((chromosome, fitness, current_schedule, makespan, total_tardiness))
-
-        # Find the best individual in this generation
-        best_in_gen = min(fitness_scores, key=lambda x: x[1])
-        
-        # Update the all-time best if this one is better
-        if best_in_gen[1] < best_overall_fitness:
-            best_overall_fitness = best_in_gen[1]
-            best_overall_schedule = best_in_gen[2]
-            best_makespan = best_in_gen[3]
-            best_tardiness = best_in_gen[4]
-            logger.debug("Gen {}: New best! Fitness={:.2f} (Makespan={}, Tardiness={})", gen + 1, best_overall_fitness, best_makespan, best_tardiness)
-
-        # 2. Create the next generation
-        next_generation = [best_in_gen[0]] # Elitism: Keep the best individual
-        
-        # 3. Fill the rest of the generation with new children
-        while len(next_generation) < pop_size:
-            # 3a. Selection
-            parent1 = select_parents(fitness_scores, tourn_size)
-            parent2 = select_parents(fitness_scores, tourn_size)
-            
-            # 3b. Crossover
-            child = crossover(parent1, parent2)
-            
-            # 3c. Mutation
-            child = mutate(child, mut_rate)
-            
-            next_generation.append(child)
-        
-        population = next_generation
-
-        # Phase 3: Report progress via callback (for WebSocket push)
-        if progress_callback:
-            try:
-                progress_callback(
-                    generation=gen + 1,
-                    total_generations=num_gen,
-                    best_fitness=best_overall_fitness,
-                )
-            except Exception:
-                pass  # Don't let callback errors break the GA
+    if rng is None:
+        rng = random
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    # Starting machine state, captured once; the decoder never mutates it
+    initial_state = snapshot_machine_state(machines)
+
+    if backend not in ("auto", "python", "numpy", "numba"):
+        raise ValueError(f"Unknown GA backend: {backend!r}")
+    if decoder not in ("fcfs", "active"):
+        raise ValueError(f"Unknown GA decoder: {decoder!r}")
+    if decoder == "active" and (backend not in ("auto", "python") or prefix_cache):
+        raise ValueError("The active decoder runs on the python backend without prefix_cache.")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if workers > 1 and (backend == "numpy" or prefix_cache):
+        raise ValueError("Parallel evaluation (workers > 1) runs without the numpy backend and prefix_cache.")
+    if crossover_op not in CROSSOVER_OPERATORS:
+        raise ValueError(f"Unknown crossover operator: {crossover_op!r}")
+    if mutation_op not in MUTATION_OPERATORS:
+        raise ValueError(f"Unknown mutation operator: {mutation_op!r}")
+    cross = CROSSOVER_OPERATORS[crossover_op]
+    mutate_child = MUTATION_OPERATORS[mutation_op]
+    if fitness_cache < 0:
+        raise ValueError("fitness_cache must be >= 0")
+    if islands < 1 or migration_interval < 1:
+        raise ValueError("islands and migration_interval must be >= 1")
+    if islands > 1:
+        if workers > 1 or backend == "numpy" or prefix_cache:
+            raise ValueError("The island model runs without workers > 1, the numpy backend and prefix_cache.")
+        if not 0 <= migrants < pop_size:
+            raise ValueError("migrants must be between 0 and pop_size - 1")
+    if time_limit is not None and time_limit <= 0:
+        raise ValueError("time_limit must be > 0")
+    if stagnation_limit is not None and stagnation_limit < 1:
+        raise ValueError("stagnation_limit must be >= 1")
+    if not 0.0 <= seed_ratio <= 1.0:
+        raise ValueError("seed_ratio must be between 0 and 1")
+    if (checkpoint_path is not None or resume_from is not None) and islands > 1:
+        raise ValueError("Checkpointing runs without the island model.")
+    if checkpoint_interval < 0:
+        raise ValueError("checkpoint_interval must be >= 0")
+    if best_callback_interval < 0:
+        raise ValueError("best_callback_interval must be >= 0")
+    if prescreen:
+        if decoder != "fcfs" or islands > 1 or workers > 1 or backend in ("numpy", "numba") or prefix_cache:
+            raise ValueError("Pre-screening runs serially with the fcfs decoder on the python backend, without prefix_cache.")
+        if w_makespan < 0 or w_tardiness < 0:
+            raise ValueError("Pre-screening needs non-negative fitness weights.")
+    if local_search:
+        if decoder != "fcfs" or islands > 1:
+            raise ValueError("Local search runs with the fcfs decoder, without the island model.")
+        if not 0.0 <= local_search_rate <= 1.0 or local_search_time <= 0:
+            raise ValueError("local_search_rate must be between 0 and 1 and local_search_time > 0")
+    if backend == "auto":
+        backend = "numba" if use_kernel(instance) and not prefix_cache and decoder == "fcfs" else "python"
+    batch = None
+    if backend == "numpy":
+        from scheduler.batch_decoder import BatchDecoder
+        batch = BatchDecoder(instance, setup_time, initial_state)
+    kernel = None
+    if backend == "numba":
+        kernel = KernelDecoder(instance, setup_time, initial_state)
+
+    parallel = None
+    # The worker pool is closed in the finally below, whatever fails after it starts
+    try:
+        if workers > 1:
+            from scheduler.parallel import ParallelEvaluator
+            parallel = ParallelEvaluator(
+                instance, setup_time, initial_state, workers, decoder, use_jit=backend == "numba"
+            )
+
+        evaluator = None
+        if prefix_cache:
+            evaluator = PrefixCheckpointEvaluator(instance, setup_time, initial_state)
+
+        delta = None
+        local_search_stats = {"moves": 0, "improvements": 0, "seconds": 0.0}
+        if local_search:
+            from scheduler.local_search import DeltaEvaluator
+            delta = DeltaEvaluator(instance, setup_time, initial_state)
+
+        cache = None
+        if fitness_cache and islands == 1:
+            from scheduler.fitness_cache import FitnessCache
+            cache = FitnessCache(fitness_cache)
+
+        prescreener = None
+        aborts_per_generation = []
+        if prescreen and kernel is None:
+            from scheduler.prescreen import PrescreenEvaluator
+            prescreener = PrescreenEvaluator(instance, setup_time, initial_state, w_makespan, w_tardiness)
+
+        def decode(order):
+            order = list(order)
+            if decoder == "active":
+                return schedule_instance_gap_fill(instance, order, setup_time, initial_state)
+            return schedule_instance(instance, order, setup_time, initial_state)
+
+        publisher = _BestPublisher(best_callback, best_callback_interval, decode)
+
+        # Built once per run rather than once per fitness evaluation
+        due_dates = dict(zip(instance.job_ids, instance.due_dates))
+
+        def objectives(order):
+            """(makespan, total_tardiness) of one job-index ordering, without building its schedule."""
+            if kernel is not None:
+                return kernel.objectives(order)
+            if evaluator is not None:
+                return evaluator.evaluate(order)
+            if decoder == "fcfs":
+                return evaluate_instance(instance, order, setup_time, initial_state)
+            return schedule_objectives(schedule_instance_gap_fill(instance, order, setup_time, initial_state), due_dates)
 
+        def evaluate_orders(orders):
+            """Objectives of a list of orderings on the selected backend."""
+            if batch is not None:
+                makespans, tardiness = batch.evaluate(orders)
+                return list(zip(makespans.tolist(), tardiness.tolist()))
+            if parallel is not None:
+                return parallel.evaluate(orders)
+            return [objectives(order) for order in orders]
+
+        bounds = lower_bounds(instance, setup_time, initial_state)
+        # Only a valid bound on the weighted fitness for non-negative weights
+        fitness_bound = (bounds["makespan"] * w_makespan) + (bounds["tardiness"] * w_tardiness)
+        if w_makespan < 0 or w_tardiness < 0:
+            fitness_bound = float('-inf')
+        stopping = _StopCriteria(
+            fitness_bound if stop_at_bound else float('-inf'),
+            target_fitness, time_limit, stagnation_limit, cancel_event,
+        )
+
+        seeds = None
+        if seed_ratio > 0 and resume_from is None:
+            if seed_orderings is None:
+                from scheduler.seeding import heuristic_orderings
+                seed_orderings = list(heuristic_orderings(jobs, machines, setup_time, instance).values())
+            seeds = [list(order) for order in seed_orderings]
+            # Best seeds first, so a small seed_ratio keeps the most promising ones
+            seed_scores = _score(seeds, evaluate_orders(seeds), w_makespan, w_tardiness)
+            seeds = [order for order, *_ in sorted(seed_scores, key=lambda x: x[1])]
+            logger.info("Seeding {:.0%} of the initial population from {} heuristic orderings", seed_ratio, len(seeds))
+
+        best_overall_chromosome = None
+        best_overall_fitness = float('inf')
+
+        logger.info("Running Genetic Algorithm (Multi-Objective) | Pop={}, Gen={}, M-Rate={}", pop_size, num_gen, mut_rate)
+        logger.info("Fitness Weights: Makespan={}, Tardiness={}", w_makespan, w_tardiness)
+
+        if islands > 1:
+            best_overall_chromosome, best_overall_fitness, generations_run = _evolve_islands(
+                instance, setup_time, initial_state, decoder, backend == "numba",
+                islands, migration_interval, migrants, fitness_cache,
+                pop_size, num_gen, mut_rate, tourn_size, w_makespan, w_tardiness,
+                crossover_op, mutation_op, stopping, progress_callback, stats,
+                seeds, seed_ratio, publisher, rng,
+            )
+        else:
+            from scheduler.checkpoint import (
+                instance_fingerprint, load_checkpoint, rng_state_from_json, rng_state_to_json, save_checkpoint,
+            )
+
+            fingerprint = instance_fingerprint(instance, setup_time, initial_state)
+            best_makespan = best_tardiness = None
+            start_gen = 0
+            if resume_from is not None:
+                checkpoint = load_checkpoint(resume_from, fingerprint)
+                population = [array('i', order) for order in checkpoint["population"]]
+                rng.setstate(rng_state_from_json(checkpoint["rng_state"]))
+                start_gen = checkpoint["generation"]
+                if checkpoint["best_chromosome"] is not None:
+                    best_overall_chromosome = array('i', checkpoint["best_chromosome"])
+                    best_makespan, best_tardiness = checkpoint["best_objectives"]
+                    # Weighted with this run's weights, which may differ from the checkpointed run's
+                    best_overall_fitness = (best_makespan * w_makespan) + (best_tardiness * w_tardiness)
+                logger.info("Resuming GA at generation {} from {}", start_gen, resume_from)
+            else:
+                population = create_initial_population(jobs, pop_size, seeds, seed_ratio, rng)
+
+            checkpoints_written = 0
+            last_checkpoint = time.monotonic()
+
+            def write_checkpoint(generation, population):
+                nonlocal checkpoints_written, last_checkpoint
+                save_checkpoint(checkpoint_path, {
+                    "fingerprint": fingerprint,
+                    "generation": generation,
+                    "population": population,
+                    "rng_state": rng_state_to_json(rng.getstate()),
+                    "best_chromosome": best_overall_chromosome,
+                    "best_objectives": [best_makespan, best_tardiness],
+                })
+                checkpoints_written += 1
+                last_checkpoint = time.monotonic()
+
+            # Start the evolution loop
+            generations_run = start_gen
+            for gen in range(start_gen, num_gen):
+                generations_run = gen + 1
+
+                # 1. Calculate fitness for each individual in the population
+                # Chromosomes are job-index orderings already
+                if prescreener is not None:
+                    aborted = prescreener.aborted
+                    # Only the fittest len - tourn_size + 1 can win a tournament
+                    results = prescreener.evaluate_population(population, len(population) - tourn_size + 1, cache)
+                    aborts_per_generation.append(prescreener.aborted - aborted)
+                elif cache is not None:
+                    results = cache.evaluate(population, evaluate_orders)
+                else:
+                    results = evaluate_orders(population)
+                fitness_scores = _score(population, results, w_makespan, w_tardiness)
+                if delta is not None:
+                    _memetic_step(fitness_scores, delta, local_search_rate, local_search_time,
+                                  w_makespan, w_tardiness, local_search_stats, rng)
+
+                # Find the best individual in this generation
+                best_in_gen = min(fitness_scores, key=lambda x: x[1])
+
+                # Update the all-time best if this one is better
+                if best_in_gen[1] < best_overall_fitness:
+                    best_overall_fitness = best_in_gen[1]
+                    best_overall_chromosome = best_in_gen[0]
+                    best_makespan = best_in_gen[2]
+                    best_tardiness = best_in_gen[3]
+                    publisher.improved(best_overall_chromosome, best_makespan, best_tardiness)
+                    logger.debug("Gen {}: New best! Fitness={:.2f} (Makespan={}, Tardiness={})", gen + 1, best_overall_fitness, best_makespan, best_tardiness)
+
+                # 2-3. Create the next generation
+                population = _breed(fitness_scores, best_in_gen[0], pop_size, tourn_size, mut_rate, cross, mutate_child, rng)
+
+                # Phase 3: Report progress via callback (for WebSocket push)
+                _report_progress(progress_callback, gen + 1, num_gen, best_overall_fitness)
+                publisher.publish(gen + 1)
+
+                if stopping.check(best_overall_fitness, gen + 1):
+                    logger.info("GA stopped at generation {}/{}: {}", gen + 1, num_gen, stopping.reason)
+                    break
+                if (checkpoint_path is not None and gen + 1 < num_gen
+                        and time.monotonic() - last_checkpoint >= checkpoint_interval):
+                    write_checkpoint(gen + 1, population)
+            if checkpoint_path is not None:
+                # The population that would be evaluated next, so the run can be extended
+                write_checkpoint(generations_run, population)
+            if stats is not None:
+                if resume_from is not None:
+                    stats["resumed_from"] = start_gen
+                if checkpoint_path is not None:
+                    stats["checkpoints"] = checkpoints_written
+    finally:
+        if parallel is not None:
+            parallel.close()
+
+    # Only the final best individual is decoded into a full schedule
+    best_overall_schedule = decode(best_overall_chromosome) if best_overall_chromosome is not None else None
     final_makespan = max(op[4] for op in best_overall_schedule) if best_overall_schedule else 0
-    logger.info("Genetic Algorithm finished. Best makespan: {}", final_makespan)
+    logger.info("Genetic Algorithm finished. Best makespan: {} (lower bound {})", final_makespan, bounds["makespan"])
+    rss = peak_rss_mb()
+    if rss is not None:
+        logger.info("GA peak RSS: {:.1f} MB (largest worker process: {:.1f} MB)", rss["self"], rss["children"])
+    if stats is not None:
+        stats["peak_rss_mb"] = rss
+        stats["lower_bound"] = bounds["makespan"]
+        stats["generations_run"] = generations_run
+        stats["reached_bound"] = best_overall_fitness <= fitness_bound
+        stats["stop_reason"] = stopping.reason
+        if best_callback is not None:
+            stats["intermediate_results"] = publisher.published
+    if prescreener is not None:
+        prescreen_stats = prescreener.stats()
+        logger.info(
+            "Pre-screening: {} of {} decodes abandoned early, {} job decodes skipped",
+            prescreen_stats["aborted"], prescreen_stats["decoded"], prescreen_stats["jobs_skipped"],
+        )
+        if stats is not None:
+            stats["prescreen"] = {**prescreen_stats, "aborts_per_generation": aborts_per_generation}
+    if evaluator is not None:
+        cache_stats = evaluator.stats()
+        logger.info(
+            "Prefix cache: {} hits / {} misses, {:.1%} of job decodes reused",
+            cache_stats["hits"], cache_stats["misses"], cache_stats["reuse_ratio"],
+        )
+        if stats is not None:
+            stats["prefix_cache"] = cache_stats
+    if delta is not None:
+        logger.info(
+            "Local search: {} improvements in {} moves ({:.2f}s)",
+            local_search_stats["improvements"], local_search_stats["moves"], local_search_stats["seconds"],
+        )
+        if stats is not None:
+            stats["local_search"] = local_search_stats
+    if cache is not None:
+        cache_stats = cache.stats()
+        logger.info(
+            "Fitness cache: {} hits / {} misses ({:.1%} of evaluations skipped)",
+            cache_stats["hits"], cache_stats["misses"], cache_stats["hit_ratio"],
+        )
+        if stats is not None:
+            stats["fitness_cache"] = cache_stats
     return best_overall_schedule
 
+def _score(population, results, w_makespan, w_tardiness):
+    """
+    Fitness tuples (chromosome, fitness, makespan, tardiness) for evaluated objectives.
+
+    Individuals carry only their permutation and objective values; schedules
+    are never kept per individual, only the final best one is decoded.
+    """
+    fitness_scores = []
+    for chromosome, (makespan, total_tardiness) in zip(population, results):
+        # --- Multi-Objective Fitness Calculation ---
+        fitness = (makespan * w_makespan) + (total_tardiness * w_tardiness)
+        fitness_scores.append((chromosome, fitness, makespan, total_tardiness))
+    return fitness_scores
+
+def _breed(fitness_scores, elite, pop_size, tourn_size, mut_rate, cross, mutate_child, rng=random):
+    """Builds the next generation from scored parents, drawing from `rng`."""
+    next_generation = [elite] # Elitism: Keep the best individual
+
+    # Fill the rest of the generation with new children
+    while len(next_generation) < pop_size:
+        # Selection
+        parent1 = select_parents(fitness_scores, tourn_size, rng)
+        parent2 = select_parents(fitness_scores, tourn_size, rng)
+
+        # Crossover
+        child = cross(parent1, parent2, rng)
+
+        # Mutation
+        child = mutate_child(child, mut_rate, rng)
+
+        next_generation.append(child)
+    return next_generation
+
+def _memetic_step(fitness_scores, delta, rate, time_cap, w_makespan, w_tardiness, totals, rng=random):
+    """
+    Improves the elite and a random `rate` share of the other individuals
+    in place with local search, within `time_cap` seconds.
+    """
+    from scheduler.local_search import local_search
+
+    started = time.monotonic()
+    deadline = started + time_cap
+    elite = min(range(len(fitness_scores)), key=lambda i: fitness_scores[i][1])
+    others = [i for i in range(len(fitness_scores)) if i != elite]
+    sample = rng.sample(others, round(rate * len(others)))
+    for i in [elite] + sample:
+        if time.monotonic() >= deadline:
+            break
+        chromosome = fitness_scores[i][0]
+        order, (makespan, tardiness), moves, improvements = local_search(
+            delta, chromosome, w_makespan, w_tardiness, deadline, max_moves=len(chromosome), rng=rng,
+        )
+        fitness_scores[i] = (order, (makespan * w_makespan) + (tardiness * w_tardiness), makespan, tardiness)
+        totals["moves"] += moves
+        totals["improvements"] += improvements
+    totals["seconds"] += time.monotonic() - started
+
+def _report_progress(progress_callback, generation, total_generations, best_fitness):
+    if progress_callback:
+        try:
+            progress_callback(
+                generation=generation,
+                total_generations=total_generations,
+                best_fitness=best_fitness,
+            )
+        except Exception:
+            pass  # Don't let callback errors break the GA
+
+class _BestPublisher:
+    """
+    Hands the best schedule so far to a callback, throttled.
+
+    `improved()` records a new best ordering; `publish(generation)` decodes
+    and hands over the latest unpublished one once `interval` seconds have
+    passed since the previous hand-over (the first goes out immediately).
+    """
+
+    def __init__(self, callback, interval, decode):
+        self.callback = callback
+        self.interval = interval
+        self.decode = decode
+        self.published = 0
+        self._pending = None
+        self._last = float('-inf')
+
+    def improved(self, chromosome, makespan, tardiness):
+        if self.callback is not None:
+            self._pending = (chromosome, makespan, tardiness)
+
+    def publish(self, generation):
+        if self._pending is None or time.monotonic() - self._last < self.interval:
+            return
+        chromosome, makespan, tardiness = self._pending
+        self._pending = None
+        self._last = time.monotonic()
+        self.published += 1
+        try:
+            self.callback(generation, self.decode(chromosome), makespan, tardiness)
+        except Exception:
+            logger.exception("best_callback failed at generation {}", generation)
+
+class _StopCriteria:
+    """
+    Early-stopping rules of a GA run, checked once per generation.
+
+    `check(best_fitness, generations_run)` returns True when evolution should
+    stop; `reason` then names the rule that fired ("completed" until then).
+    The lower bound and the target fitness are tried first, so a run that
+    reaches either is never reported as merely timed out.
+    """
+
+    def __init__(self, fitness_bound, target_fitness=None, time_limit=None, stagnation_limit=None, cancel_event=None):
+        self.fitness_bound = fitness_bound
+        self.target_fitness = target_fitness
+        self.stagnation_limit = stagnation_limit
+        self.cancel_event = cancel_event
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.reason = "completed"
+        self._best = float('inf')
+        self._improved_at = 0
+
+    def check(self, best_fitness, generations_run):
+        if best_fitness < self._best:
+            self._best = best_fitness
+            self._improved_at = generations_run
+
+        if best_fitness <= self.fitness_bound:
+            self.reason = "lower_bound"
+        elif self.target_fitness is not None and best_fitness <= self.target_fitness:
+            self.reason = "target_fitness"
+        elif self.cancel_event is not None and self.cancel_event.is_set():
+            self.reason = "cancelled"
+        elif self.stagnation_limit is not None and generations_run - self._improved_at >= self.stagnation_limit:
+            self.reason = "stagnation"
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "time_limit"
+        else:
+            return False
+        return True
+
+# --- NSGA-II Pareto mode ---------------------------------------------------
+#
+# Instead of one weighted fitness, individuals are ranked by Pareto front
+# and crowding distance (scheduler/pareto.py). Parents and children are
+# merged every generation and the best pop_size survive, so the whole
+# makespan / tardiness trade-off is evolved in one run.
+
+def run_nsga2(jobs, machines, setup_time, pop_size, num_gen, mut_rate, tourn_size=2, progress_callback=None, instance=None, stats=None, decoder="fcfs", fitness_cache=0, crossover_op="ox1", mutation_op="swap", time_limit=None, stagnation_limit=None, cancel_event=None, seed_ratio=0.0, seed_orderings=None, rng=None):
+    """
+    Runs NSGA-II and returns the Pareto front of makespan vs total tardiness.
+
+    Arguments shared with run_genetic_algorithm mean the same there. Parents
+    are picked by crowded tournament (lower front, then larger crowding
+    distance). There are no weights: progress_callback receives the front's
+    hypervolume as `best_fitness`, and stagnation_limit counts generations
+    in which the hypervolume did not grow. As there, `rng` defaults to the
+    `random` module and concurrent runs should each pass their own
+    random.Random.
+
+    Returns:
+        list: (schedule, makespan, total_tardiness) for each distinct point
+        of the final front, by increasing makespan.
+    """
+    from scheduler.engine import evaluate_instance, schedule_instance
+    from scheduler.instance import compile_instance, snapshot_machine_state
+    from scheduler.kernel import KernelDecoder, use_kernel
+    from scheduler.gap_fill import schedule_instance_gap_fill
+    from scheduler.bounds import lower_bounds
+    from scheduler.fitness_cache import FitnessCache, ordering_key
+    from scheduler.pareto import crowding_distance, hypervolume, non_dominated_sort
+
+    if rng is None:
+        rng = random
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    initial_state = snapshot_machine_state(machines)
+
+    if decoder not in ("fcfs", "active"):
+        raise ValueError(f"Unknown GA decoder: {decoder!r}")
+    if crossover_op not in CROSSOVER_OPERATORS:
+        raise ValueError(f"Unknown crossover operator: {crossover_op!r}")
+    if mutation_op not in MUTATION_OPERATORS:
+        raise ValueError(f"Unknown mutation operator: {mutation_op!r}")
+    if pop_size < 2 or tourn_size < 1:
+        raise ValueError("pop_size must be >= 2 and tourn_size >= 1")
+    if time_limit is not None and time_limit <= 0:
+        raise ValueError("time_limit must be > 0")
+    if stagnation_limit is not None and stagnation_limit < 1:
+        raise ValueError("stagnation_limit must be >= 1")
+    if not 0.0 <= seed_ratio <= 1.0:
+        raise ValueError("seed_ratio must be between 0 and 1")
+    cross = CROSSOVER_OPERATORS[crossover_op]
+    mutate_child = MUTATION_OPERATORS[mutation_op]
+
+    kernel = KernelDecoder(instance, setup_time, initial_state) if decoder == "fcfs" and use_kernel(instance) else None
+    due_dates = dict(zip(instance.job_ids, instance.due_dates))
+
+    def decode(order):
+        if decoder == "active":
+            return schedule_instance_gap_fill(instance, list(order), setup_time, initial_state)
+        return schedule_instance(instance, list(order), setup_time, initial_state)
+
+    def evaluate_orders(orders):
+        if kernel is not None:
+            return [kernel.objectives(order) for order in orders]
+        if decoder == "fcfs":
+            return [evaluate_instance(instance, order, setup_time, initial_state) for order in orders]
+        return [schedule_objectives(decode(order), due_dates) for order in orders]
+
+    cache = FitnessCache(fitness_cache) if fitness_cache else None
+
+    def evaluate(population):
+        return cache.evaluate(population, evaluate_orders) if cache is not None else evaluate_orders(population)
+
+    def rank(population, points):
+        """
+        The `pop_size` survivors as (ordering, point, front, crowding distance).
+
+        Many orderings decode to the same objectives; only one per point is
+        ranked, otherwise copies of a single point fill the first front and
+        the population collapses onto it. Other orderings of an already
+        ranked point, then repeated orderings, only fill remaining places.
+        """
+        seen_points = set()
+        seen_orders = set()
+        unique, repeats = [], []
+        for order, point in zip(population, points):
+            key = ordering_key(order)
+            if key in seen_orders:
+                continue
+            seen_orders.add(key)
+            if point in seen_points:
+                repeats.append((order, point))
+            else:
+                seen_points.add(point)
+                unique.append((order, point))
+        points = [point for _, point in unique]
+        survivors = []
+        fronts = non_dominated_sort(points)
+        for level, front in enumerate(fronts):
+            distance = crowding_distance(points, front)
+            if len(survivors) + len(front) > pop_size:
+                # Truncate the last front that fits, least crowded first
+                front = sorted(front, key=distance.get, reverse=True)[:pop_size - len(survivors)]
+            survivors.extend((unique[i][0], points[i], level, distance[i]) for i in front)
+            if len(survivors) == pop_size:
+                break
+        for order, point in repeats[:pop_size - len(survivors)]:
+            survivors.append((order, point, len(fronts), 0.0))
+        return survivors
+
+    def select(ranked):
+        """Crowded tournament: lowest front wins, ties go to the less crowded individual."""
+        tournament = rng.sample(ranked, min(tourn_size, len(ranked)))
+        return min(tournament, key=lambda x: (x[2], -x[3]))[0]
+
+    seeds = None
+    if seed_ratio > 0:
+        if seed_orderings is None:
+            from scheduler.seeding import heuristic_orderings
+            seed_orderings = list(heuristic_orderings(jobs, machines, setup_time, instance).values())
+        seeds = [list(order) for order in seed_orderings]
+
+    bounds = lower_bounds(instance, setup_time, initial_state)
+    stopping = _StopCriteria(float('-inf'), None, time_limit, stagnation_limit, cancel_event)
+
+    logger.info("Running NSGA-II (Pareto mode) | Pop={}, Gen={}, M-Rate={}", pop_size, num_gen, mut_rate)
+    population = create_initial_population(jobs, pop_size, seeds, seed_ratio, rng)
+    points = evaluate(population)
+    # Fixed for the whole run so hypervolumes of different generations compare
+    reference = (max(p[0] for p in points) + 1, max(p[1] for p in points) + 1)
+    ranked = rank(population, points)
+
+    generations_run = 0
+    volume = 0.0
+    for gen in range(num_gen):
+        generations_run = gen + 1
+        children = []
+        while len(children) < pop_size:
+            child = cross(select(ranked), select(ranked), rng)
+            children.append(mutate_child(child, mut_rate, rng))
+        parents = [x[0] for x in ranked]
+        ranked = rank(parents + children, [x[1] for x in ranked] + evaluate(children))
+
+        front = [x[1] for x in ranked if x[2] == 0]
+        volume = hypervolume(front, reference)
+        logger.debug("Gen {}: front of {} points, hypervolume {:.1f}", gen + 1, len(set(front)), volume)
+        _report_progress(progress_callback, gen + 1, num_gen, volume)
+        if stopping.check(-volume, gen + 1):
+            logger.info("NSGA-II stopped at generation {}/{}: {}", gen + 1, num_gen, stopping.reason)
+            break
+
+    # One schedule per distinct point of the final front
+    pareto = {}
+    for order, point, level, _ in ranked:
+        if level == 0 and point not in pareto:
+            pareto[point] = order
+    result = [(decode(order), makespan, tardiness) for (makespan, tardiness), order in sorted(pareto.items())]
+    logger.info(
+        "NSGA-II finished. {} Pareto-optimal schedules, makespan {}-{} (lower bound {})",
+        len(result), result[0][1], result[-1][1], bounds["makespan"],
+    )
+    if stats is not None:
+        stats["lower_bound"] = bounds["makespan"]
+        stats["generations_run"] = generations_run
+        stats["stop_reason"] = stopping.reason
+        stats["front_size"] = len(result)
+        stats["hypervolume"] = volume
+        if cache is not None:
+            stats["fitness_cache"] = cache.stats()
+    return result
+
+# --- Island model ----------------------------------------------------------
+#
+# Each island is an independent sub-population with its own RNG stream.
+# Islands evolve `migration_interval` generations at a time in worker
+# processes; between epochs the parent moves each island's best
+# individuals to the next island on a ring, replacing its worst.
+
+_island_fitness_cache = None  # per worker process, shared by the islands it runs
+
+def _island_epoch(fitness_scores, generations, rng_state, settings):
+    """
+    Evolves one island for up to `generations` generations in a worker process.
+
+    `fitness_scores` is the island's last scored population (None to start
+    a new one). The epoch draws from a random.Random set to the island's
+    own stream.
+
+    Returns:
+        (fitness_scores, rng_state, generations_done, cache_hits, cache_misses)
+    """
+    global _island_fitness_cache
+    from scheduler.parallel import _evaluate_chunk
+    from scheduler.fitness_cache import FitnessCache
+
+    (n_jobs, pop_size, tourn_size, mut_rate, w_makespan, w_tardiness,
+     crossover_op, mutation_op, fitness_bound, cache_size, seeds, seed_ratio) = settings
+    cross = CROSSOVER_OPERATORS[crossover_op]
+    mutate_child = MUTATION_OPERATORS[mutation_op]
+
+    cache = None
+    if cache_size:
+        if _island_fitness_cache is None or _island_fitness_cache.max_entries != cache_size:
+            _island_fitness_cache = FitnessCache(cache_size)
+        cache = _island_fitness_cache
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+    def evaluate(population):
+        results = cache.evaluate(population, _evaluate_chunk) if cache is not None else _evaluate_chunk(population)
+        return _score(population, results, w_makespan, w_tardiness)
+
+    rng = random.Random()
+    rng.setstate(rng_state)
+    done = 0
+    if fitness_scores is None:
+        fitness_scores = evaluate(create_initial_population(range(n_jobs), pop_size, seeds, seed_ratio, rng))
+        done = 1
+    while done < generations:
+        best_in_gen = min(fitness_scores, key=lambda x: x[1])
+        if best_in_gen[1] <= fitness_bound:
+            break
+        population = _breed(fitness_scores, best_in_gen[0], pop_size, tourn_size, mut_rate, cross, mutate_child, rng)
+        fitness_scores = evaluate(population)
+        done += 1
+
+    if cache is not None:
+        hits, misses = cache.hits - hits, cache.misses - misses
+    return fitness_scores, rng.getstate(), done, hits, misses
+
+def _migrate(island_scores, migrants):
+    """Ring migration: island i's best `migrants` replace island i+1's worst."""
+    if migrants <= 0:
+        return island_scores
+    ranked = [sorted(scores, key=lambda x: x[1]) for scores in island_scores]
+    return [
+        ranked[i][:len(ranked[i]) - migrants] + ranked[i - 1][:migrants]
+        for i in range(len(ranked))
+    ]
+
+def _evolve_islands(instance, setup_time, initial_state, decoder, use_jit,
+                    islands, migration_interval, migrants, fitness_cache,
+                    pop_size, num_gen, mut_rate, tourn_size, w_makespan, w_tardiness,
+                    crossover_op, mutation_op, stopping, progress_callback, stats,
+                    seeds=None, seed_ratio=0.0, publisher=None, rng=random):
+    """
+    Runs the island model on `islands` worker processes.
+
+    Returns:
+        (best_chromosome, best_fitness, generations_run)
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from scheduler.parallel import _init_worker
+
+    # Island RNG streams are drawn from the run's RNG, so seeding it still
+    # makes a run reproducible
+    rng_states = [random.Random(rng.getrandbits(64)).getstate() for _ in range(islands)]
+    settings = (instance.n_jobs, pop_size, tourn_size, mut_rate, w_makespan, w_tardiness,
+                crossover_op, mutation_op, stopping.fitness_bound, fitness_cache, seeds, seed_ratio)
+    island_scores = [None] * islands
+    best_chromosome = None
+    best_fitness = float('inf')
+    generations_run = 0
+    cache_hits = cache_misses = 0
+
+    logger.info("Island model: {} islands, migration every {} generations ({} migrants)", islands, migration_interval, migrants)
+    pool = ProcessPoolExecutor(
+        max_workers=islands,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(instance, setup_time, initial_state, decoder, use_jit),
+    )
+    try:
+        while generations_run < num_gen:
+            step = min(migration_interval, num_gen - generations_run)
+            futures = [
+                pool.submit(_island_epoch, island_scores[i], step, rng_states[i], settings)
+                for i in range(islands)
+            ]
+            done = 0
+            for i, future in enumerate(futures):
+                island_scores[i], rng_states[i], island_done, hits, misses = future.result()
+                done = max(done, island_done)
+                cache_hits += hits
+                cache_misses += misses
+            generations_run += done
+
+            for scores in island_scores:
+                best_in_island = min(scores, key=lambda x: x[1])
+                if best_in_island[1] < best_fitness:
+                    best_fitness = best_in_island[1]
+                    best_chromosome = best_in_island[0]
+                    if publisher is not None:
+                        publisher.improved(best_chromosome, best_in_island[2], best_in_island[3])
+                    logger.debug("Gen {}: New best! Fitness={:.2f} (Makespan={}, Tardiness={})", generations_run, best_fitness, best_in_island[2], best_in_island[3])
+
+            _report_progress(progress_callback, generations_run, num_gen, best_fitness)
+            if publisher is not None:
+                publisher.publish(generations_run)
+            if stopping.check(best_fitness, generations_run):
+                logger.info("GA stopped at generation {}/{}: {}", generations_run, num_gen, stopping.reason)
+                break
+            island_scores = _migrate(island_scores, migrants)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    if stats is not None:
+        stats["islands"] = [min(x[1] for x in scores) for scores in island_scores if scores]
+        if fitness_cache:
+            total = cache_hits + cache_misses
+            stats["fitness_cache"] = {
+                "hits": cache_hits,
+                "misses": cache_misses,
+                "max_entries": fitness_cache,
+                "hit_ratio": round(cache_hits / total, 4) if total else 0.0,
+            }
+    return best_chromosome, best_fitness, generations_run
+
+def peak_rss_mb():
+    """
+    Peak resident set size, in MB, of this process and of its largest
+    finished child process (GA workers and islands), or None where the
+    `resource` module is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    import sys
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    }
+
 def calculate_tardiness(schedule: list, jobs: list) -> int:
     """Calculates the total tardiness for a given schedule."""
     job_completion_times = {}
@@ -122,42 +930,102 @@ def calculate_tardiness(schedule: list, jobs: list) -> int:
             total_tardiness += tardiness
     return total_tardiness
 
-def create_initial_population(jobs, size):
-    """Creates an initial population of random schedules."""
+def create_initial_population(jobs, size, seeds=None, seed_ratio=0.0, rng=random):
+    """
+    Creates an initial population of random schedules.
+
+    Each chromosome is an array('i') permutation of job indices: position p
+    holds the index (into `jobs`, and into the compiled instance) of the
+    job decoded p-th.
+
+    With `seeds` (job-index orderings, e.g. from scheduler/seeding.py), a
+    `seed_ratio` share of the population is seeded: every seed once, then
+    copies of the seeds with a few random swaps. The rest is random.
+
+    Random choices here and in the operators below come from `rng`, the
+    `random` module unless a run passes its own random.Random.
+    """
     population = []
-    for _ in range(size):
-        chromosome = random.sample(jobs, len(jobs)) # A random permutation of jobs
+    n_seeded = min(size, round(size * seed_ratio)) if seeds else 0
+    for i in range(n_seeded):
+        chromosome = array('i', seeds[i % len(seeds)])
+        if i >= len(seeds):
+            # A small random perturbation of a seed
+            for _ in range(rng.randint(1, max(1, len(chromosome) // 20))):
+                chromosome = mutate(chromosome, 1.0, rng)
+        population.append(chromosome)
+    while len(population) < size:
+        chromosome = array('i', rng.sample(range(len(jobs)), len(jobs))) # A random permutation of job indices
         population.append(chromosome)
     return population
 
-def select_parents(fitness_scores, tourn_size):
+def select_parents(fitness_scores, tourn_size, rng=random):
     """Selects one parent using tournament selection."""
-    tournament = random.sample(fitness_scores, tourn_size)
+    tournament = rng.sample(fitness_scores, tourn_size)
     winner = min(tournament, key=lambda x: x[1]) # [1] is the fitness score
     return winner[0] # [0] is the chromosome
 
-def crossover(parent1, parent2):
-    """Creates a new child schedule using Ordered Crossover (OX1)."""
-    child = [None] * len(parent1)
-    start, end = sorted(random.sample(range(len(parent1)), 2))
-    
-    # Copy the slice from parent 1
-    child[start:end] = parent1[start:end]
-    
+def crossover(parent1, parent2, rng=random):
+    """
+    Creates a new child schedule using Ordered Crossover (OX1).
+
+    A slice of parent 1 is kept in place; the other positions are filled,
+    left to right, with the remaining job indices in parent 2's order.
+    Membership is a boolean mask over job indices, so this is O(n).
+    """
+    n = len(parent1)
+    if n < 2:
+        return array('i', parent1)
+    start, end = sorted(rng.sample(range(n), 2))
+
+    # Mark the jobs copied from parent 1
+    taken = bytearray(n)
+    segment = parent1[start:end]
+    for job in segment:
+        taken[job] = 1
+
     # Get the remaining jobs from parent 2
-    parent2_jobs = [job for job in parent2 if job not in child]
-    
-    # Fill the Nones in the child
-    current_pos = 0
-    for i in range(len(child)):
-        if child[i] is None:
-            child[i] = parent2_jobs[current_pos]
-            current_pos += 1
+    parent2_jobs = array('i', [job for job in parent2 if not taken[job]])
+    return parent2_jobs[:start] + array('i', segment) + parent2_jobs[start:]
+
+def pmx_crossover(parent1, parent2, rng=random):
+    """
+    Creates a new child schedule using Partially Mapped Crossover (PMX).
+
+    The child starts as a copy of parent 2; each job of parent 1's slice is
+    swapped into its parent-1 position, which carries the displaced job to
+    the mapped position. Job positions are tracked in an index array, so
+    this is O(n).
+    """
+    n = len(parent1)
+    child = array('i', parent2)
+    if n < 2:
+        return child
+    start, end = sorted(rng.sample(range(n), 2))
+
+    position = [0] * n
+    for i, job in enumerate(child):
+        position[job] = i
+    for i in range(start, end):
+        job, displaced = parent1[i], child[i]
+        j = position[job]
+        child[i], child[j] = job, displaced
+        position[job], position[displaced] = i, j
     return child
 
-def mutate(chromosome: list, mut_rate):
-    """Applies swap mutation to a chromosome."""
-    if random.random() < mut_rate:
-        idx1, idx2 = random.sample(range(len(chromosome)), 2)
+def mutate(chromosome, mut_rate, rng=random):
+    """Applies swap mutation to a chromosome (in place)."""
+    if rng.random() < mut_rate and len(chromosome) > 1:
+        idx1, idx2 = rng.sample(range(len(chromosome)), 2)
         chromosome[idx1], chromosome[idx2] = chromosome[idx2], chromosome[idx1] # Swap
     return chromosome
+
+def insertion_mutate(chromosome, mut_rate, rng=random):
+    """Applies insertion mutation (in place): one job moves to another position."""
+    if rng.random() < mut_rate and len(chromosome) > 1:
+        idx1, idx2 = rng.sample(range(len(chromosome)), 2)
+        chromosome.insert(idx2, chromosome.pop(idx1))
+    return chromosome
+
+CROSSOVER_OPERATORS = {"ox1": crossover, "pmx": pmx_crossover}
+MUTATION_OPERATORS = {"swap": mutate, "insertion": insertion_mutate}
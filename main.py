@@ -17,9 +17,9 @@ from data_loader import load_data_from_excel
 from exporter import export_to_excel
 from genetic_algorithm import run_genetic_algorithm
 from scheduler.engine import schedule_fcfs, schedule_spt, schedule_edd, schedule_wspt
+from scheduler.instance import compile_instance
 from scheduler.metrics import build_full_metrics
 from core.logger import logger
-import copy
 import os
 import configparser
 
@@ -105,9 +105,11 @@ if __name__ == "__main__":
     
     logger.info("Running Simple Schedulers (Setup Time: {})", SETUP_TIME)
     
+    # The engines never mutate the machines, so one compiled instance serves every run
+    instance = compile_instance(jobs_data, machines)
+
     for name, func in simple_schedulers.items():
-        machine_copy = copy.deepcopy(machines) # Deepcopy ensures each algo gets fresh machines
-        schedule_result = func(jobs_data, machine_copy, SETUP_TIME)
+        schedule_result = func(jobs_data, machines, SETUP_TIME, instance=instance)
         
         print_schedule(schedule_result, jobs_data, f"{name} Schedule")
         create_gantt_chart(schedule_result, f"{name} Schedule")
@@ -117,9 +119,10 @@ if __name__ == "__main__":
         
     # --- 4. Run the Genetic Algorithm ---
     ga_schedule = run_genetic_algorithm(
-        jobs_data, copy.deepcopy(machines), SETUP_TIME,
+        jobs_data, machines, SETUP_TIME,
         GA_POP_SIZE, GA_NUM_GEN, GA_MUT_RATE, GA_TOURN_SIZE,
-        GA_W_MAKESPAN, GA_W_TARDINESS
+        GA_W_MAKESPAN, GA_W_TARDINESS,
+        instance=instance,
     )
     
     print_schedule(ga_schedule, jobs_data, "Genetic Algorithm Schedule")
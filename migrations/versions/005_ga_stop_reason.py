@@ -0,0 +1,33 @@
+"""005_ga_stop_reason.py
+Alembic migration: GA early stopping and cancellation.
+
+Adds to schedule_runs:
+  - stop_reason     : Why the GA stopped (completed, lower_bound, target_fitness,
+                      stagnation, time_limit, cancelled)
+  - generations_run : Generations actually evolved
+
+Revision ID: 005
+Revises: 004
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = [c["name"] for c in inspector.get_columns("schedule_runs")]
+    if "stop_reason" not in columns:
+        op.add_column("schedule_runs", sa.Column("stop_reason", sa.String(20), nullable=True))
+    if "generations_run" not in columns:
+        op.add_column("schedule_runs", sa.Column("generations_run", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("schedule_runs", "generations_run")
+    op.drop_column("schedule_runs", "stop_reason")
@@ -0,0 +1,29 @@
+"""006_pareto_front.py
+Alembic migration: NSGA-II Pareto mode.
+
+Adds to schedule_runs:
+  - pareto_front_json : Every schedule of the run's makespan / tardiness
+                        Pareto front (JSON), selectable after the run
+
+Revision ID: 006
+Revises: 005
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = [c["name"] for c in inspector.get_columns("schedule_runs")]
+    if "pareto_front_json" not in columns:
+        op.add_column("schedule_runs", sa.Column("pareto_front_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("schedule_runs", "pareto_front_json")
@@ -0,0 +1,30 @@
+"""007_run_params.py
+Alembic migration: resumable GA runs.
+
+Adds to schedule_runs:
+  - params_json : Upload parameters of the run (JSON), used to restart it
+                  after a server restart and to extend it with more
+                  generations
+
+Revision ID: 007
+Revises: 006
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = [c["name"] for c in inspector.get_columns("schedule_runs")]
+    if "params_json" not in columns:
+        op.add_column("schedule_runs", sa.Column("params_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("schedule_runs", "params_json")
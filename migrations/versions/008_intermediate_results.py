@@ -0,0 +1,32 @@
+"""008_intermediate_results.py
+Alembic migration: anytime results of running GA optimizations.
+
+Adds to schedule_runs:
+  - intermediate_json    : Best schedule so far of a processing run (JSON)
+  - intermediate_version : Incremented every time it is replaced
+
+Revision ID: 008
+Revises: 007
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = [c["name"] for c in inspector.get_columns("schedule_runs")]
+    if "intermediate_json" not in columns:
+        op.add_column("schedule_runs", sa.Column("intermediate_json", sa.Text(), nullable=True))
+    if "intermediate_version" not in columns:
+        op.add_column("schedule_runs", sa.Column("intermediate_version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("schedule_runs", "intermediate_version")
+    op.drop_column("schedule_runs", "intermediate_json")
@@ -14,11 +14,11 @@ step/reset interface directly.
 """
 from __future__ import annotations
 
-import copy
 import math
 from typing import List, Optional, Tuple
 
-from models import Job, Machine, Operation
+from models import Job, Machine
+from scheduler.instance import ProblemInstance, compile_instance
 
 
 # ---------------------------------------------------------------------------
@@ -49,24 +49,35 @@ class ShopFloorEnv:
         machines: List[Machine],
         setup_time: int = 2,
         lambda_tardiness: float = 0.5,
+        instance: Optional[ProblemInstance] = None,
     ) -> None:
         self.original_jobs = jobs
         self.original_machines = machines
         self.setup_time = setup_time
         self.lambda_tardiness = lambda_tardiness
 
-        self.n_jobs = len(jobs)
-        self.n_machines = len(machines)
-        self.max_ops = max(len(j.operations) for j in jobs)
+        # Compiled arrays are read-only, so episodes share them without copying
+        self.instance = instance if instance is not None else compile_instance(jobs, machines)
+        self._jobs: List[Job] = list(self.instance.jobs)
+        self._job_n_ops = [
+            self.instance.job_op_start[j + 1] - self.instance.job_op_start[j]
+            for j in range(self.instance.n_jobs)
+        ]
+        # Machine indices in observation order (sorted by machine_id)
+        self._obs_machine_order = sorted(
+            range(self.instance.n_machines), key=lambda k: self.instance.machine_ids[k]
+        )
+
+        self.n_jobs = self.instance.n_jobs
+        self.n_machines = self.instance.n_machines
+        self.max_ops = max(self._job_n_ops)
 
         # Rough upper bound for normalization
-        self._max_time = sum(
-            sum(op.processing_time for op in j.operations) for j in jobs
-        ) + setup_time * self.n_machines * self.n_jobs + 1
+        self._max_time = sum(self.instance.job_work) + setup_time * self.n_machines * self.n_jobs + 1
 
         # Will be populated on reset()
-        self._jobs: List[Job] = []
-        self._machines: List[Machine] = []
+        self._machine_available_at: List[float] = []
+        self._machine_last_job: List[Optional[int]] = []
         self._op_pointer: List[int] = []   # next operation index per job
         self._job_done_at: List[float] = []  # completion time per job
         self._current_time: float = 0.0
@@ -80,11 +91,8 @@ class ShopFloorEnv:
 
     def reset(self) -> List[float]:
         """Reset environment to initial state and return the initial observation."""
-        self._jobs = copy.deepcopy(self.original_jobs)
-        self._machines = copy.deepcopy(self.original_machines)
-        for m in self._machines:
-            m.available_at = 0
-            m.last_job_id = None  # type: ignore[assignment]
+        self._machine_available_at = [0] * self.n_machines
+        self._machine_last_job = [None] * self.n_machines
         self._op_pointer = [0] * self.n_jobs
         self._job_done_at = [0.0] * self.n_jobs
         self._current_time = 0.0
@@ -104,43 +112,39 @@ class ShopFloorEnv:
         if action < 0 or action >= self.n_jobs:
             raise ValueError(f"Invalid action {action}. Must be in [0, {self.n_jobs})")
 
-        job = self._jobs[action]
         op_idx = self._op_pointer[action]
 
         # Penalize selecting an already-completed job
-        if op_idx >= len(job.operations):
+        if op_idx >= self._job_n_ops[action]:
             return self._observe(), -5.0, self._is_done(), {"invalid_action": True}
 
-        op: Operation = job.operations[op_idx]
-
-        # Find the target machine
-        machine = self._get_machine(op.machine_id)
-        if machine is None:
-            # No matching machine — penalize
-            return self._observe(), -10.0, self._is_done(), {"machine_not_found": True}
+        inst = self.instance
+        job_id = inst.job_ids[action]
+        o = inst.job_op_start[action] + op_idx
+        k = inst.op_machine[o]
+        processing_time = inst.op_time[o]
 
         # Compute start time
         prev_job_end = self._job_done_at[action]
-        if machine.last_job_id is not None and machine.last_job_id != job.job_id:
+        last = self._machine_last_job[k]
+        if last is not None and last != job_id:
             setup_penalty = self.setup_time
         else:
             setup_penalty = 0
-        start = max(machine.available_at + setup_penalty, prev_job_end)
+        start = max(self._machine_available_at[k] + setup_penalty, prev_job_end)
 
-        # Handle unavailability windows
-        for (down_start, down_end) in machine.unavailable_periods:
-            if start < down_end and start + op.processing_time > down_start:
-                start = down_end
+        # Handle unavailability windows (same index the FCFS engines use)
+        start = inst.downtime[k].earliest_start(start, processing_time)
 
-        end = start + op.processing_time
+        end = start + processing_time
 
         # Update state
-        machine.available_at = end
-        machine.last_job_id = job.job_id
+        self._machine_available_at[k] = end
+        self._machine_last_job[k] = job_id
         self._job_done_at[action] = end
         self._op_pointer[action] += 1
         self._current_time = max(self._current_time, end)
-        self._schedule.append((job.job_id, op_idx, op.machine_id, start, end))
+        self._schedule.append((job_id, op_idx, inst.machine_ids[k], start, end))
 
         # Compute reward
         reward = self._compute_reward()
@@ -172,15 +176,16 @@ class ShopFloorEnv:
         obs: List[float] = []
 
         # Machine availability
-        for m in sorted(self._machines, key=lambda x: x.machine_id):
-            obs.append(m.available_at / self._max_time)
+        for k in self._obs_machine_order:
+            obs.append(self._machine_available_at[k] / self._max_time)
 
         # Job progress and urgency
-        for j_idx, job in enumerate(self._jobs):
-            remaining = len(job.operations) - self._op_pointer[j_idx]
+        due_dates = self.instance.due_dates
+        for j_idx in range(self.n_jobs):
+            remaining = self._job_n_ops[j_idx] - self._op_pointer[j_idx]
             obs.append(remaining / max(self.max_ops, 1))
-            slack = max(0.0, job.due_date - self._current_time)
-            obs.append(slack / max(job.due_date, 1))
+            slack = max(0.0, due_dates[j_idx] - self._current_time)
+            obs.append(slack / max(due_dates[j_idx], 1))
 
         # Global time
         obs.append(self._current_time / self._max_time)
@@ -198,16 +203,11 @@ class ShopFloorEnv:
 
     def _total_tardiness(self) -> float:
         tardiness = 0.0
-        for j_idx, job in enumerate(self._jobs):
-            if self._op_pointer[j_idx] >= len(job.operations):
-                tardiness += max(0.0, self._job_done_at[j_idx] - job.due_date)
+        due_dates = self.instance.due_dates
+        for j_idx in range(self.n_jobs):
+            if self._op_pointer[j_idx] >= self._job_n_ops[j_idx]:
+                tardiness += max(0.0, self._job_done_at[j_idx] - due_dates[j_idx])
         return tardiness
 
     def _is_done(self) -> bool:
-        return all(self._op_pointer[j] >= len(self._jobs[j].operations) for j in range(self.n_jobs))
-
-    def _get_machine(self, machine_id: int) -> Optional[Machine]:
-        for m in self._machines:
-            if m.machine_id == machine_id:
-                return m
-        return None
+        return all(self._op_pointer[j] >= self._job_n_ops[j] for j in range(self.n_jobs))
@@ -13,6 +13,7 @@ from typing import List, Optional, Tuple
 from models import Job, Machine
 from rl.environment import ShopFloorEnv
 from rl.q_agent import QAgent
+from scheduler.instance import ProblemInstance, compile_instance
 from core.logger import logger
 
 # Default path for the pre-trained model shipped with the project
@@ -25,13 +26,15 @@ def run_rl_schedule(
     setup_time: int = 2,
     model_path: Optional[str] = None,
     lambda_tardiness: float = 0.5,
+    instance: Optional[ProblemInstance] = None,
 ) -> List[Tuple[int, int, int, float, float]]:
     """
     Generate a schedule using a trained Q-agent (greedy policy, ε=0).
 
     If `model_path` is None, attempts to load the latest model from
     `rl_models/`. Falls back to a short online training run if no saved
-    model exists.
+    model exists. A pre-compiled `instance` is shared by every environment
+    created here; it is compiled once when omitted.
 
     Returns:
         List of (job_id, op_index, machine_id, start_time, end_time) tuples,
@@ -41,11 +44,15 @@ def run_rl_schedule(
     if model_path is None:
         model_path = _find_latest_model()
 
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+
     env = ShopFloorEnv(
         jobs=jobs,
         machines=machines,
         setup_time=setup_time,
         lambda_tardiness=lambda_tardiness,
+        instance=instance,
     )
 
     if model_path and os.path.isfile(model_path):
@@ -56,7 +63,10 @@ def run_rl_schedule(
         # No pre-trained model → quick online training (50 episodes)
         logger.warning("No RL model found — running quick 50-episode training as fallback.")
         agent = QAgent(n_actions=len(jobs))
-        agent.train(lambda: ShopFloorEnv(jobs, machines, setup_time, lambda_tardiness), episodes=50)
+        agent.train(
+            lambda: ShopFloorEnv(jobs, machines, setup_time, lambda_tardiness, instance=instance),
+            episodes=50,
+        )
         agent.epsilon = 0.0
 
     obs = env.reset()
@@ -0,0 +1,328 @@
+# scheduler/annealing.py
+"""
+Parallel multi-start simulated annealing over job orderings.
+
+`run_simulated_annealing` runs K independent annealing chains, one per
+worker process, on the GA's representation (job-index orderings decoded
+FCFS) and fitness (makespan * w_makespan + tardiness * w_tardiness).
+Chain i starts from the i-th best ALGORITHM_MAP ordering while those
+last, and from a random permutation otherwise; every chain has its own
+RNG stream.
+
+Each move swaps two jobs or moves one job to another position. The
+acceptance test is drawn before the move is evaluated: a neighbour is
+accepted iff its fitness is below current - T * ln(u), so `DeltaEvaluator`
+(scheduler/local_search.py) decodes only from the first changed position
+and gives up as soon as the neighbour's partial fitness reaches that
+threshold. The temperature falls geometrically from a start value
+estimated from sampled moves to 1/1000 of it over the wall-clock budget
+(or over `max_moves`, whichever runs out first).
+
+The chains synchronise through two shared objects only: the best fitness
+found by any chain (a multiprocessing.Value) and its ordering (an Array).
+A chain writes them when it beats the shared best, and reads them when it
+has gone `restart_after` moves without improving its own best: if another
+chain has done better, it restarts from that ordering at its current
+temperature. There is no other communication, so the chains scale with
+the number of cores.
+
+Workers are started with the "spawn" method, like the GA's worker pools.
+"""
+from __future__ import annotations
+
+import math
+import multiprocessing
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+
+from models import Job, Machine
+from scheduler.bounds import lower_bounds
+from scheduler.instance import (
+    ProblemInstance,
+    compile_instance,
+    snapshot_machine_state,
+)
+from core.logger import logger
+
+# Moves sampled to estimate a chain's starting temperature
+_TEMPERATURE_SAMPLES = 50
+# Final temperature as a fraction of the starting one
+_FINAL_TEMPERATURE = 1e-3
+# Moves between checks of the shared stop flag
+_STOP_CHECK = 64
+
+# Per-worker-process state, set once by _init_worker
+_worker = None
+
+
+def _init_worker(instance, setup_time, initial_state, shared_fitness, shared_order, stop_flag) -> None:
+    global _worker
+    _worker = (instance, setup_time, initial_state, shared_fitness, shared_order, stop_flag)
+
+
+def _chain_in_worker(start, settings):
+    return _anneal_chain(*_worker, start, settings)
+
+
+def _anneal_chain(instance, setup_time, initial_state, shared_fitness, shared_order, stop_flag, start, settings,
+                  report=None):
+    """
+    One annealing chain.
+
+    `report(best_fitness)`, if given, is called every few moves, before the
+    stop flag is checked.
+
+    Returns:
+        dict with the chain's best ordering and objectives, and counters.
+    """
+    from scheduler.local_search import DeltaEvaluator
+
+    w_makespan, w_tardiness, time_limit, max_moves, restart_after, fitness_bound, seed = settings
+    rng = random.Random(seed)
+    started = time.monotonic()
+    evaluator = DeltaEvaluator(instance, setup_time, initial_state)
+    # Early rejection is only valid when fitness cannot drop along the decode
+    weights = (w_makespan, w_tardiness) if w_makespan >= 0 and w_tardiness >= 0 else None
+
+    current = array('i', start)
+    n = len(current)
+    objectives = evaluator.reset(current)
+    fitness = objectives[0] * w_makespan + objectives[1] * w_tardiness
+    best, best_objectives, best_fitness = array('i', current), objectives, fitness
+
+    def publish():
+        if best_fitness < shared_fitness.value:
+            with shared_fitness.get_lock():
+                if best_fitness < shared_fitness.value:
+                    shared_order[:] = best
+                    shared_fitness.value = best_fitness
+
+    def neighbour():
+        i, j = rng.sample(range(n), 2)
+        moved = array('i', current)
+        if rng.random() < 0.5:
+            moved[i], moved[j] = moved[j], moved[i]
+        else:
+            moved.insert(j, moved.pop(i))
+        return moved, min(i, j), max(i, j)
+
+    publish()
+    moves = accepted = restarts = since_best = 0
+    stop_reason = "cooled"
+    if n >= 2:
+        # Start hot enough to accept an average worsening move half the time
+        worse = []
+        for _ in range(_TEMPERATURE_SAMPLES):
+            moved, first, last = neighbour()
+            value = evaluator.evaluate(moved, first, last)
+            delta = value[0] * w_makespan + value[1] * w_tardiness - fitness
+            if delta > 0:
+                worse.append(delta)
+        initial_temperature = (sum(worse) / len(worse) if worse else 1.0) / math.log(2)
+        cooling = math.log(_FINAL_TEMPERATURE)
+
+        while True:
+            if moves % _STOP_CHECK == 0:
+                if report is not None:
+                    report(best_fitness)
+                if stop_flag.value:
+                    stop_reason = "stopped"
+                    break
+                if shared_fitness.value <= fitness_bound:
+                    stop_reason = "bound"
+                    break
+            progress = (time.monotonic() - started) / time_limit
+            if max_moves is not None:
+                progress = max(progress, moves / max_moves)
+            if progress >= 1.0:
+                stop_reason = "time_limit" if max_moves is None or moves < max_moves else "cooled"
+                break
+            temperature = initial_temperature * math.exp(cooling * progress)
+
+            moved, first, last = neighbour()
+            threshold = fitness - temperature * math.log(1.0 - rng.random())
+            value = evaluator.evaluate(moved, first, last, weights, threshold)
+            moves += 1
+            candidate = value[0] * w_makespan + value[1] * w_tardiness
+            if candidate < threshold:
+                current, fitness = moved, candidate
+                objectives = evaluator.reset(current)
+                accepted += 1
+                if fitness < best_fitness:
+                    best, best_objectives, best_fitness = array('i', current), objectives, fitness
+                    since_best = 0
+                    publish()
+                    continue
+            since_best += 1
+            if since_best >= restart_after:
+                since_best = 0
+                if shared_fitness.value < best_fitness:
+                    # Another chain is ahead: continue from its best ordering
+                    with shared_fitness.get_lock():
+                        current = array('i', shared_order)
+                    objectives = evaluator.reset(current)
+                    fitness = objectives[0] * w_makespan + objectives[1] * w_tardiness
+                    restarts += 1
+
+    return {
+        "order": list(best),
+        "objectives": best_objectives,
+        "fitness": best_fitness,
+        "moves": moves,
+        "accepted": accepted,
+        "restarts": restarts,
+        "jobs_decoded": evaluator.jobs_decoded,
+        "stop_reason": stop_reason,
+    }
+
+
+def _report_progress(progress_callback, elapsed, time_limit, best_fitness):
+    if progress_callback:
+        try:
+            progress_callback(elapsed=elapsed, time_limit=time_limit, best_fitness=best_fitness)
+        except Exception:
+            pass  # Don't let callback errors break the search
+
+
+def run_simulated_annealing(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    w_makespan: float = 0.5,
+    w_tardiness: float = 0.5,
+    chains: int = 4,
+    time_limit: float = 10.0,
+    instance: ProblemInstance | None = None,
+    max_moves: int | None = None,
+    restart_after: int = 2000,
+    seed: int | None = None,
+    progress_callback=None,
+    progress_interval: float = 0.5,
+    cancel_event=None,
+    stats: dict | None = None,
+) -> list:
+    """
+    Parallel multi-start simulated annealing.
+
+    Args:
+        jobs: Jobs to schedule.
+        machines: Machines with their current availability state (not modified).
+        setup_time: Time units added when a machine switches to a different job.
+        w_makespan: Weight of makespan in the fitness, as in the GA.
+        w_tardiness: Weight of total tardiness.
+        chains: Independent annealing chains, one worker process each
+            (1 runs the chain in the calling thread).
+        time_limit: Wall-clock seconds of every chain's cooling schedule.
+        instance: Optional pre-compiled ProblemInstance.
+        max_moves: Optional moves per chain; the schedule then cools over
+            whichever of time and moves runs out first.
+        restart_after: Moves without improving its own best after which a
+            chain restarts from the shared best, if another chain found a
+            better one.
+        seed: Seed of the chains' RNG streams (default: drawn from the
+            `random` module, so random.seed() applies).
+        progress_callback: Optional callable(elapsed, time_limit,
+            best_fitness), called every `progress_interval` seconds.
+        cancel_event: Optional threading.Event; stops every chain.
+        stats: Optional dict filled with per-chain results, the lower
+            bound and the stop reason.
+
+    Returns:
+        List of tuples: (job_id, op_index, machine_id, start_time, end_time)
+    """
+    from scheduler.engine import evaluate_instance, schedule_instance
+    from scheduler.seeding import heuristic_orderings
+
+    if chains < 1:
+        raise ValueError("chains must be >= 1")
+    if time_limit <= 0:
+        raise ValueError("time_limit must be > 0")
+    if restart_after < 1:
+        raise ValueError("restart_after must be >= 1")
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    initial_state = snapshot_machine_state(machines)
+    if seed is None:
+        seed = random.getrandbits(32)
+    rng = random.Random(seed)
+
+    def weighted(order):
+        makespan, tardiness = evaluate_instance(instance, order, setup_time, initial_state)
+        return makespan * w_makespan + tardiness * w_tardiness
+
+    # Distinct rule orderings, best first, then random permutations
+    starts = sorted(heuristic_orderings(jobs, machines, setup_time, instance).values(), key=weighted)[:chains]
+    while len(starts) < chains:
+        order = list(range(instance.n_jobs))
+        rng.shuffle(order)
+        starts.append(order)
+
+    bounds = lower_bounds(instance, setup_time, initial_state)
+    fitness_bound = bounds["makespan"] * w_makespan + bounds["tardiness"] * w_tardiness
+    context = multiprocessing.get_context("spawn")
+    shared_fitness = context.Value('d', float('inf'))
+    shared_order = context.Array('i', instance.n_jobs, lock=False)
+    stop_flag = context.Value('b', 0, lock=False)
+    settings = [
+        (w_makespan, w_tardiness, time_limit, max_moves, restart_after, fitness_bound, rng.getrandbits(64))
+        for _ in range(chains)
+    ]
+
+    logger.info("Simulated annealing: {} chains, {:.1f}s", chains, time_limit)
+    started = time.monotonic()
+    if chains == 1:
+        last_report = started
+
+        def report(best_fitness):
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report >= progress_interval:
+                _report_progress(progress_callback, now - started, time_limit, best_fitness)
+                last_report = now
+            if cancel_event is not None and cancel_event.is_set():
+                stop_flag.value = 1
+
+        results = [_anneal_chain(
+            instance, setup_time, initial_state, shared_fitness, shared_order, stop_flag, starts[0], settings[0],
+            report,
+        )]
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=chains,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(instance, setup_time, initial_state, shared_fitness, shared_order, stop_flag),
+        )
+        try:
+            futures = [pool.submit(_chain_in_worker, start, chain) for start, chain in zip(starts, settings)]
+            while True:
+                done, pending = wait(futures, timeout=progress_interval, return_when=FIRST_EXCEPTION)
+                if not pending or any(f.exception() for f in done):
+                    break
+                if cancel_event is not None and cancel_event.is_set():
+                    stop_flag.value = 1
+                _report_progress(progress_callback, time.monotonic() - started, time_limit, shared_fitness.value)
+            results = [future.result() for future in futures]
+        finally:
+            stop_flag.value = 1
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    best = min(results, key=lambda result: result["fitness"])
+    elapsed = time.monotonic() - started
+    _report_progress(progress_callback, elapsed, time_limit, best["fitness"])
+    stop_reason = "cancelled" if cancel_event is not None and cancel_event.is_set() else best["stop_reason"]
+    logger.info(
+        "Simulated annealing finished in {:.2f}s: best fitness {:.2f} (Makespan={}, Tardiness={}), {} moves, {} restarts",
+        elapsed, best["fitness"], best["objectives"][0], best["objectives"][1],
+        sum(r["moves"] for r in results), sum(r["restarts"] for r in results),
+    )
+    if stats is not None:
+        stats["lower_bound"] = bounds["makespan"]
+        stats["stop_reason"] = stop_reason
+        stats["chains"] = [
+            {key: result[key] for key in ("fitness", "moves", "accepted", "restarts", "jobs_decoded", "stop_reason")}
+            for result in results
+        ]
+    return schedule_instance(instance, best["order"], setup_time, initial_state)
@@ -0,0 +1,223 @@
+# scheduler/bounds.py
+"""
+Cheap lower bounds on makespan and total tardiness.
+
+Every bound is a relaxation of the real problem, so no schedule produced
+by any engine — FCFS, gap-filling, dispatching or the GA — can beat it.
+When a solver's best schedule reaches the bound it is optimal and the
+search can stop; otherwise the distance to the bound is an upper limit
+on how much better any schedule could be.
+
+  job           each job alone on an empty shop: its operations in order,
+                each waiting for its machine's starting state (availability,
+                setup after a different last job) and maintenance windows.
+                Also gives every operation an earliest start ("head") and
+                every job an earliest completion, hence a tardiness bound.
+  machine_load  each machine alone: its work plus the setups it cannot
+                avoid (one per distinct job, less one if it may start with
+                a job it last ran), from the earliest head, plus the
+                smallest amount of work still to follow ("tail").
+  one_machine   each machine alone as 1 | r_j, q_j, pmtn | max(C_j + q_j),
+                solved exactly by the preemptive Jackson schedule (always
+                run the released operation with the longest tail), with
+                the machine's maintenance windows blocked out.
+
+All bounds take O(n log n) time for n operations.
+"""
+from __future__ import annotations
+
+import heapq
+
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+
+def _job_heads(instance: ProblemInstance, setup_time, available_at: list, last_job: list) -> list:
+    """Earliest start of every operation when its job runs alone."""
+    job_ids = instance.job_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    downtime = instance.downtime
+
+    heads = [0] * instance.n_ops
+    for j in range(instance.n_jobs):
+        job_id = job_ids[j]
+        t = 0
+        for o in range(job_op_start[j], job_op_start[j + 1]):
+            k = op_machine[o]
+            ready = available_at[k]
+            if last_job[k] is not None and last_job[k] != job_id:
+                ready += setup_time
+            if ready > t:
+                t = ready
+            t = downtime[k].earliest_start(t, op_time[o])
+            heads[o] = t
+            t += op_time[o]
+    return heads
+
+
+def _job_tails(instance: ProblemInstance) -> list:
+    """Work remaining in every operation's job after it finishes."""
+    job_op_start = instance.job_op_start
+    op_time = instance.op_time
+    tails = [0] * instance.n_ops
+    for j in range(instance.n_jobs):
+        acc = 0
+        for o in range(job_op_start[j + 1] - 1, job_op_start[j] - 1, -1):
+            tails[o] = acc
+            acc += op_time[o]
+    return tails
+
+
+def _preemptive_jackson(ops: list, window_starts: list, window_ends: list):
+    """
+    Optimal max(C + q) of one machine with preemption.
+
+    Args:
+        ops: (release, processing_time, tail) per operation.
+        window_starts / window_ends: sorted, merged maintenance windows.
+    """
+    ops = sorted(ops)
+    n = len(ops)
+    best = 0
+    ready = []   # (-tail, remaining processing time)
+    i = 0        # next operation to release
+    w = 0        # first window that has not ended by t
+    t = ops[0][0] if ops else 0
+    while i < n or ready:
+        while i < n and ops[i][0] <= t:
+            release, duration, tail = ops[i]
+            i += 1
+            if duration > 0:
+                heapq.heappush(ready, (-tail, duration))
+            elif release + tail > best:
+                best = release + tail
+        if not ready:
+            if i >= n:
+                break  # only zero-duration operations were left
+            t = ops[i][0]
+            continue
+
+        while w < len(window_ends) and window_ends[w] <= t:
+            w += 1
+        if w < len(window_starts) and window_starts[w] <= t:
+            t = window_ends[w]  # machine is down: nothing runs until the window ends
+            continue
+
+        neg_tail, remaining = heapq.heappop(ready)
+        # Run until it finishes, a new operation is released or a window opens
+        until = t + remaining
+        if i < n and ops[i][0] < until:
+            until = ops[i][0]
+        if w < len(window_starts) and window_starts[w] < until:
+            until = window_starts[w]
+        remaining -= until - t
+        t = until
+        if remaining > 0:
+            heapq.heappush(ready, (neg_tail, remaining))
+        elif t - neg_tail > best:
+            best = t - neg_tail
+    return best
+
+
+def lower_bounds(
+    instance: ProblemInstance,
+    setup_time: int = 0,
+    initial_state: MachineStateSnapshot | None = None,
+) -> dict:
+    """
+    All lower bounds of a compiled instance.
+
+    Args:
+        instance: Compiled ProblemInstance.
+        setup_time: Time units added when a machine switches to a different job.
+        initial_state: Optional {machine_id: (available_at, last_job_id)}.
+
+    Returns:
+        dict with the makespan bounds "job", "machine_load" and "one_machine",
+        their maximum "makespan", and "tardiness" (a total-tardiness bound).
+    """
+    available_at, last_job = instance.initial_state(initial_state)
+    job_ids = instance.job_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    due_dates = instance.due_dates
+
+    heads = _job_heads(instance, setup_time, available_at, last_job)
+    tails = _job_tails(instance)
+
+    job_bound = 0
+    tardiness_bound = 0
+    for j in range(instance.n_jobs):
+        first, stop = job_op_start[j], job_op_start[j + 1]
+        if stop == first:
+            continue
+        completion = heads[stop - 1] + op_time[stop - 1]
+        if completion > job_bound:
+            job_bound = completion
+        if completion > due_dates[j]:
+            tardiness_bound += completion - due_dates[j]
+
+    machine_ops = [[] for _ in range(instance.n_machines)]
+    machine_jobs = [set() for _ in range(instance.n_machines)]
+    for j in range(instance.n_jobs):
+        for o in range(job_op_start[j], job_op_start[j + 1]):
+            k = op_machine[o]
+            machine_ops[k].append((heads[o], op_time[o], tails[o]))
+            machine_jobs[k].add(job_ids[j])
+
+    load_bound = 0
+    one_machine_bound = 0
+    for k, ops in enumerate(machine_ops):
+        if not ops:
+            continue
+        # The earliest head already includes a setup from the machine's
+        # last job, so count that one only when starting from available_at
+        work = sum(op[1] for op in ops)
+        between = (len(machine_jobs[k]) - 1) * setup_time
+        switches = len(machine_jobs[k])
+        if last_job[k] is None or last_job[k] in machine_jobs[k]:
+            switches -= 1
+        load = max(
+            min(op[0] for op in ops) + work + between,
+            available_at[k] + work + switches * setup_time,
+        ) + min(op[2] for op in ops)
+        if load > load_bound:
+            load_bound = load
+
+        index = instance.downtime[k]
+        jackson = _preemptive_jackson(ops, index.starts, index.ends)
+        if jackson > one_machine_bound:
+            one_machine_bound = jackson
+
+    return {
+        "job": job_bound,
+        "machine_load": load_bound,
+        "one_machine": one_machine_bound,
+        "makespan": max(job_bound, load_bound, one_machine_bound),
+        "tardiness": tardiness_bound,
+    }
+
+
+def makespan_lower_bound(
+    instance: ProblemInstance,
+    setup_time: int = 0,
+    initial_state: MachineStateSnapshot | None = None,
+):
+    """Best (largest) makespan lower bound of a compiled instance."""
+    return lower_bounds(instance, setup_time, initial_state)["makespan"]
+
+
+def optimality_gap(makespan, lower_bound) -> float | None:
+    """
+    Percentage by which `makespan` exceeds `lower_bound`.
+
+    0.0 means the schedule is provably optimal; None when the bound is 0
+    and the makespan is not.
+    """
+    if makespan <= lower_bound:
+        return 0.0
+    if lower_bound <= 0:
+        return None
+    return round((makespan - lower_bound) / lower_bound * 100, 2)
@@ -0,0 +1,88 @@
+# scheduler/checkpoint.py
+"""
+Checkpoint files for resumable GA runs.
+
+A checkpoint holds everything the serial GA loop needs to carry on as if
+it had never stopped: the population about to be evaluated, the state of
+the `random` module, the best ordering found so far and the generation
+counter. It is zlib-compressed JSON (a few KB even for large instances)
+and is written to a temporary file that then replaces the old one, so a
+crash mid-write never leaves a truncated checkpoint behind.
+
+Each checkpoint records a fingerprint of the problem it belongs to
+(instance, setup time and starting machine state); loading it for a
+different problem raises ValueError instead of silently mixing the two.
+"""
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from hashlib import blake2b
+
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+CHECKPOINT_VERSION = 1
+
+
+def instance_fingerprint(
+    instance: ProblemInstance,
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None = None,
+) -> str:
+    """Short digest identifying the problem a job-index ordering is decoded against."""
+    state = sorted((initial_state or {}).items(), key=lambda item: str(item[0]))
+    payload = repr((
+        instance.job_ids, instance.machine_ids, instance.job_op_start, instance.op_machine,
+        instance.op_time, instance.due_dates, instance.unavailable, setup_time, state,
+    ))
+    return blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    """
+    Atomically write a GA checkpoint.
+
+    `state` holds JSON-serializable values; orderings may be array('i').
+    """
+    payload = {"version": CHECKPOINT_VERSION, **state}
+    data = zlib.compress(json.dumps(payload, default=list, separators=(",", ":")).encode())
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, fingerprint: str | None = None) -> dict:
+    """
+    Read a GA checkpoint written by `save_checkpoint`.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of this version, or
+            was written for a problem with a different `fingerprint`.
+    """
+    with open(path, "rb") as f:
+        try:
+            state = json.loads(zlib.decompress(f.read()))
+        except (zlib.error, ValueError) as exc:
+            raise ValueError(f"Not a GA checkpoint: {path}") from exc
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')!r}")
+    if fingerprint is not None and state.get("fingerprint") != fingerprint:
+        raise ValueError("Checkpoint was written for a different problem instance.")
+    return state
+
+
+def rng_state_to_json(rng_state: tuple) -> list:
+    """random.getstate() as nested lists."""
+    version, internal, gauss_next = rng_state
+    return [version, list(internal), gauss_next]
+
+
+def rng_state_from_json(data: list) -> tuple:
+    """Inverse of `rng_state_to_json`, ready for random.setstate()."""
+    version, internal, gauss_next = data
+    return version, tuple(internal), gauss_next
@@ -0,0 +1,84 @@
+# scheduler/downtime.py
+"""
+Indexed machine-unavailability lookup.
+
+The engines used to resolve maintenance conflicts by rescanning a
+machine's `unavailable_periods` from the beginning after every conflict,
+which is O(k^2) per operation for k downtime windows. `DowntimeIndex`
+sorts and merges the windows once, so the earliest feasible start for an
+operation is found with one bisect plus a sparse-table jump over the
+free gaps that are too short for the operation: O(log k) per query.
+
+Semantics match the original scan: an operation occupying [t, t + d)
+conflicts with a window (s, e) when t < e and s < t + d; the answer is
+the smallest t' >= t with no conflict. Windows with end < start are
+malformed and ignored.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+
+_INF = float("inf")
+
+
+class DowntimeIndex:
+    """Sorted, merged maintenance windows of one machine."""
+
+    __slots__ = ("starts", "ends", "_gap_table")
+
+    def __init__(self, periods: list[tuple[int, int]] | None = None) -> None:
+        merged: list[list] = []
+        for start, end in sorted(p for p in (periods or []) if p[1] >= p[0]):
+            # Only strictly overlapping windows are merged: two windows that
+            # merely touch still leave a zero-length gap a zero-duration
+            # operation may use, exactly as the linear scan allowed.
+            if merged and start < merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+
+        self.starts = [s for s, _ in merged]
+        self.ends = [e for _, e in merged]
+
+        # _gap_table[p][i] = largest free gap following windows i .. i + 2^p - 1.
+        # The gap after the last window is unbounded.
+        gaps = [self.starts[i + 1] - self.ends[i] for i in range(len(merged) - 1)]
+        if merged:
+            gaps.append(_INF)
+        table = [gaps]
+        span = 1
+        while 2 * span <= len(gaps):
+            prev = table[-1]
+            table.append([max(prev[i], prev[i + span]) for i in range(len(gaps) - 2 * span + 1)])
+            span *= 2
+        self._gap_table = table
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def earliest_start(self, t, duration):
+        """Return the earliest time >= t at which [start, start + duration) is free."""
+        ends = self.ends
+        i = bisect_right(ends, t)  # first window still open at t
+        if i == len(ends) or t + duration <= self.starts[i]:
+            return t
+        return ends[self._first_gap_at_least(i, duration)]
+
+    def _first_gap_at_least(self, i: int, duration) -> int:
+        """Smallest j >= i whose following free gap can hold `duration`."""
+        table = self._gap_table
+        if table[0][i] >= duration:
+            return i
+        j = i
+        for p in range(len(table) - 1, -1, -1):
+            row = table[p]
+            if j < len(row) and row[j] < duration:
+                j += 1 << p
+        return j
+
+    def __repr__(self) -> str:
+        return f"DowntimeIndex({list(zip(self.starts, self.ends))})"
@@ -7,16 +7,202 @@ Contains all scheduling algorithm implementations:
 - SPT   : Shortest Processing Time
 - EDD   : Earliest Due Date
 - WSPT  : Weighted Shortest Processing Time
+- ACTIVE: Input order, decoded into an active schedule that reuses idle gaps
+          (scheduler/gap_fill.py)
+- ATC, MWKR, CR, SLACK : Non-delay dispatching rules that interleave
+          operations of different jobs (scheduler/dispatch.py)
+- TABU  : Tabu search over job orderings with critical-block moves,
+          started from the best of the rules above (scheduler/tabu.py)
 
-All algorithms delegate to schedule_fcfs() as the constraint-aware
-base executor. The sorting order of jobs passed to it defines the
-algorithm behaviour.
+FCFS, SPT, EDD and WSPT only differ in the job order they hand to
+schedule_fcfs(), the constraint-aware base executor. ACTIVE decodes its
+input order with the gap-filling decoder instead, the dispatching rules
+build their schedules operation by operation, and TABU searches job
+orderings decoded like schedule_fcfs().
+
+Every algorithm accepts an optional pre-compiled `ProblemInstance`
+(see scheduler/instance.py); the decode itself runs over its flat,
+integer-indexed arrays rather than the Job/Operation object graph.
 """
 from models import Job, Machine
+from scheduler.instance import (
+    MachineStateSnapshot,
+    ProblemInstance,
+    compile_instance,
+    snapshot_machine_state,
+)
+from scheduler.dispatch import schedule_atc, schedule_cr, schedule_mwkr, schedule_slack
+from scheduler.gap_fill import schedule_gap_fill
+from scheduler.kernel import KernelDecoder, use_kernel
+from scheduler.tabu import schedule_tabu
 from core.logger import logger
 
 
-def schedule_fcfs(jobs: list[Job], machines: list[Machine], setup_time: int) -> list:
+def _decode_fcfs(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    available_at: list,
+    last_job: list,
+) -> list:
+    """
+    Decode a job-index ordering over a compiled instance.
+
+    `available_at` and `last_job` are per-machine-index state lists and are
+    updated in place; the caller owns them.
+    """
+    schedule = []
+    append = schedule.append
+    job_ids = instance.job_ids
+    machine_ids = instance.machine_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    downtime = instance.downtime
+
+    for j in order:
+        job_id = job_ids[j]
+        first_op = job_op_start[j]
+        current_job_end_time = 0
+        for o in range(first_op, job_op_start[j + 1]):
+            k = op_machine[o]
+            processing_time = op_time[o]
+
+            # --- Setup time ---
+            last = last_job[k]
+            if last is not None and last != job_id:
+                earliest_start = available_at[k] + setup_time
+            else:
+                earliest_start = available_at[k]
+            if current_job_end_time > earliest_start:
+                earliest_start = current_job_end_time
+
+            # --- Resolve machine unavailability conflicts ---
+            valid_start_time = downtime[k].earliest_start(earliest_start, processing_time)
+
+            end_time = valid_start_time + processing_time
+            append((job_id, o - first_op, machine_ids[k], valid_start_time, end_time))
+
+            available_at[k] = end_time
+            last_job[k] = job_id
+            current_job_end_time = end_time
+
+    return schedule
+
+
+def _objectives_fcfs(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    available_at: list,
+    last_job: list,
+) -> tuple:
+    """
+    Objective-only twin of `_decode_fcfs`: same decode, no schedule list.
+
+    Only running accumulators are kept — the current job's end time, the
+    makespan and the tardiness sum — so nothing is allocated per operation.
+    `available_at` and `last_job` are updated in place, as in `_decode_fcfs`.
+
+    Returns:
+        (makespan, total_tardiness)
+    """
+    job_ids = instance.job_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    due_dates = instance.due_dates
+    downtime = instance.downtime
+
+    makespan = 0
+    total_tardiness = 0
+    for j in order:
+        job_id = job_ids[j]
+        first_op = job_op_start[j]
+        stop = job_op_start[j + 1]
+        current_job_end_time = 0
+        for o in range(first_op, stop):
+            k = op_machine[o]
+            processing_time = op_time[o]
+
+            last = last_job[k]
+            if last is not None and last != job_id:
+                earliest_start = available_at[k] + setup_time
+            else:
+                earliest_start = available_at[k]
+            if current_job_end_time > earliest_start:
+                earliest_start = current_job_end_time
+
+            end_time = downtime[k].earliest_start(earliest_start, processing_time) + processing_time
+            available_at[k] = end_time
+            last_job[k] = job_id
+            current_job_end_time = end_time
+
+        if stop > first_op:
+            if current_job_end_time > makespan:
+                makespan = current_job_end_time
+            if current_job_end_time > due_dates[j]:
+                total_tardiness += current_job_end_time - due_dates[j]
+
+    return makespan, total_tardiness
+
+
+def evaluate_instance(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None = None,
+) -> tuple:
+    """
+    (makespan, total_tardiness) of the FCFS decode of a job-index ordering.
+
+    Same decode as `schedule_instance` without building the schedule, for
+    search loops that only compare objective values; build the schedule of
+    the ordering you keep with `schedule_instance`. Always runs in pure
+    Python — use `KernelDecoder.objectives` for repeated JIT evaluation.
+    """
+    available_at, last_job = instance.initial_state(initial_state)
+    return _objectives_fcfs(instance, order, setup_time, available_at, last_job)
+
+
+def schedule_instance(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None = None,
+) -> list:
+    """
+    Side-effect-free FCFS decode of a job-index ordering.
+
+    Reads only the compiled machine specs in `instance`; the starting
+    availability of each machine comes from `initial_state` (all machines
+    idle at t=0 when omitted). Nothing passed in is modified, so callers
+    such as the GA can decode the same instance repeatedly without
+    copying machines. Large instances run through the JIT kernel in
+    scheduler/kernel.py when Numba is installed; `_decode_fcfs` below is
+    the reference implementation.
+
+    Args:
+        instance: Compiled ProblemInstance.
+        order: Job indices (positions in `instance.job_ids`) in decode order.
+        setup_time: Time units added when a machine switches to a different job.
+        initial_state: Optional {machine_id: (available_at, last_job_id)}.
+
+    Returns:
+        List of tuples: (job_id, op_index, machine_id, start_time, end_time)
+    """
+    if use_kernel(instance):
+        return KernelDecoder(instance, setup_time, initial_state).schedule(order)
+    available_at, last_job = instance.initial_state(initial_state)
+    return _decode_fcfs(instance, order, setup_time, available_at, last_job)
+
+
+def schedule_fcfs(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> list:
     """
     Schedules jobs using the First-Come, First-Served (FCFS) algorithm.
 
@@ -25,50 +211,26 @@ def schedule_fcfs(jobs: list[Job], machines: list[Machine], setup_time: int) ->
     - Machine unavailability / maintenance windows
     - Precedence within a single job (operation ordering)
 
+    The machines' current `available_at` / `last_job_id` are used as the
+    starting state; the Machine objects themselves are not modified.
+
     Args:
         jobs: Ordered list of Job objects to schedule.
         machines: List of Machine objects with their availability state.
         setup_time: Time units added when a machine switches to a different job.
+        instance: Optional pre-compiled ProblemInstance covering `jobs` and
+            `machines`. Compiled on the fly when omitted.
 
     Returns:
         List of tuples: (job_id, op_index, machine_id, start_time, end_time)
     """
-    schedule = []
-    machine_map = {m.machine_id: m for m in machines}
-
-    for job in jobs:
-        current_job_end_time = 0
-        for i, operation in enumerate(job.operations):
-            machine = machine_map[operation.machine_id]
-
-            # --- Setup time ---
-            setup = 0
-            if machine.last_job_id is not None and machine.last_job_id != job.job_id:
-                setup = setup_time
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+        order = list(range(instance.n_jobs))
+    else:
+        order = instance.order_of(jobs)
 
-            earliest_start = max(machine.available_at + setup, current_job_end_time)
-
-            # --- Resolve machine unavailability conflicts ---
-            valid_start_time = earliest_start
-            while True:
-                conflict_found = False
-                proposed_end_time = valid_start_time + operation.processing_time
-                for down_start, down_end in machine.unavailable_periods:
-                    if valid_start_time < down_end and down_start < proposed_end_time:
-                        valid_start_time = down_end
-                        conflict_found = True
-                        break
-                if not conflict_found:
-                    break
-
-            start_time = valid_start_time
-            end_time = start_time + operation.processing_time
-
-            schedule.append((job.job_id, i, machine.machine_id, start_time, end_time))
-
-            machine.available_at = end_time
-            machine.last_job_id = job.job_id
-            current_job_end_time = end_time
+    schedule = schedule_instance(instance, order, setup_time, snapshot_machine_state(machines))
 
     logger.debug(
         "FCFS scheduled {} operations for {} jobs.",
@@ -78,27 +240,42 @@ def schedule_fcfs(jobs: list[Job], machines: list[Machine], setup_time: int) ->
     return schedule
 
 
-def schedule_spt(jobs: list[Job], machines: list[Machine], setup_time: int) -> list:
+def schedule_spt(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> list:
     """
     Schedules jobs using Shortest Processing Time (SPT) rule.
     Jobs with the smallest total processing time run first.
     """
     sorted_jobs = sorted(jobs, key=lambda job: sum(op.processing_time for op in job.operations))
     logger.debug("SPT ordering applied to {} jobs.", len(sorted_jobs))
-    return schedule_fcfs(sorted_jobs, machines, setup_time)
+    return schedule_fcfs(sorted_jobs, machines, setup_time, instance=instance)
 
 
-def schedule_edd(jobs: list[Job], machines: list[Machine], setup_time: int) -> list:
+def schedule_edd(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> list:
     """
     Schedules jobs using Earliest Due Date (EDD) rule.
     Jobs with the closest due dates are prioritised to minimise tardiness.
     """
     sorted_jobs = sorted(jobs, key=lambda job: job.due_date)
     logger.debug("EDD ordering applied to {} jobs.", len(sorted_jobs))
-    return schedule_fcfs(sorted_jobs, machines, setup_time)
+    return schedule_fcfs(sorted_jobs, machines, setup_time, instance=instance)
 
 
-def schedule_wspt(jobs: list[Job], machines: list[Machine], setup_time: int) -> list:
+def schedule_wspt(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> list:
     """
     Schedules jobs using Weighted Shortest Processing Time (WSPT) rule.
     Balances speed and priority: shorter/higher-priority jobs run first.
@@ -108,7 +285,7 @@ def schedule_wspt(jobs: list[Job], machines: list[Machine], setup_time: int) ->
         key=lambda job: sum(op.processing_time for op in job.operations) / job.priority,
     )
     logger.debug("WSPT ordering applied to {} jobs.", len(sorted_jobs))
-    return schedule_fcfs(sorted_jobs, machines, setup_time)
+    return schedule_fcfs(sorted_jobs, machines, setup_time, instance=instance)
 
 
 # Convenience mapping for API and CLI usage
@@ -117,4 +294,13 @@ ALGORITHM_MAP = {
     "SPT": schedule_spt,
     "EDD": schedule_edd,
     "WSPT": schedule_wspt,
+    "ACTIVE": schedule_gap_fill,
+    "ATC": schedule_atc,
+    "MWKR": schedule_mwkr,
+    "CR": schedule_cr,
+    "SLACK": schedule_slack,
+    "TABU": schedule_tabu,
 }
+
+# Improvement searches that start from the rules' orderings: not used as GA seeds
+SEARCH_ALGORITHMS = frozenset({"TABU"})
@@ -0,0 +1,121 @@
+# scheduler/fitness_cache.py
+"""
+Bounded memoization of objective values for permutation search.
+
+Elitism carries the best chromosome into every generation, and tournament
+selection with low mutation rates keeps producing children identical to
+a parent, so a GA decodes the same ordering many times over. A decode is
+deterministic for a fixed instance, setup time and start state, so its
+(makespan, total_tardiness) can be looked up instead.
+
+Keys are 16-byte BLAKE2b digests of the job-index ordering — compact
+regardless of the number of jobs. The cache lives in the calling process:
+lookups happen before any work is handed to an evaluator, so it sits in
+front of the serial, batched and process-pool evaluators alike and only
+the misses are ever decoded.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+
+
+def ordering_key(order) -> bytes:
+    """Compact, collision-resistant key of a job-index ordering."""
+    return blake2b(array("i", order).tobytes(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """
+    LRU map from job orderings to their (makespan, total_tardiness).
+
+    Args:
+        max_entries: Maximum number of orderings kept; least recently used
+            entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, orders: list, evaluate) -> list:
+        """
+        Objectives of every ordering, evaluating only those not cached.
+
+        Args:
+            orders: Job-index orderings.
+            evaluate: Callable taking a list of orderings and returning
+                their objectives in the same order. Called at most once,
+                with each uncached ordering appearing once.
+
+        Returns:
+            List of objective tuples, in input order.
+        """
+        entries = self._entries
+        keys = [ordering_key(order) for order in orders]
+        results = [None] * len(orders)
+        pending: dict[bytes, list[int]] = {}
+        for i, key in enumerate(keys):
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                results[i] = cached
+                self.hits += 1
+            elif key in pending:
+                # Same ordering twice in one batch: decoded once
+                pending[key].append(i)
+                self.hits += 1
+            else:
+                pending[key] = [i]
+                self.misses += 1
+
+        if pending:
+            values = evaluate([orders[positions[0]] for positions in pending.values()])
+            for (key, positions), value in zip(pending.items(), values):
+                value = tuple(value)
+                for i in positions:
+                    results[i] = value
+                entries[key] = value
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return results
+
+    def get(self, order) -> tuple | None:
+        """Cached objectives of one ordering, or None (counted as a miss)."""
+        key = ordering_key(order)
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return cached
+
+    def put(self, order, value) -> None:
+        """Store the objectives of one ordering decoded outside `evaluate`."""
+        self._entries[ordering_key(order)] = tuple(value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the share of evaluations answered from the cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,167 @@
+# scheduler/gap_fill.py
+"""
+Gap-filling (active schedule) decoder.
+
+`schedule_fcfs` appends every operation after the machine's last one, so
+idle time left earlier on a machine — while it waited for a job's previous
+operation elsewhere — is never used again. This decoder keeps each
+machine's busy intervals sorted by start time and places every operation
+into the earliest idle gap that can hold it, given its job-precedence
+release time, setup times on both sides of the gap and maintenance
+windows. Operations already placed never move.
+
+Jobs are still decoded in the order given, so any job ordering (a GA
+chromosome, or the SPT/EDD/WSPT sort) can be decoded either way. The gap
+search is a bisect to the release time followed by a linear scan over
+later gaps that stops at the first one that fits, and the operation is
+then added with list.insert.
+
+Complexity: with m intervals already on the machine, placing one
+operation costs O(log m) for the bisect plus O(m) in the worst case for
+the gap scan and the insert (a memmove of the interval lists), so a full
+decode is O(ops x ops-per-machine) in the worst case, not O(ops log ops).
+Measured on 10 machines, jobs in input order: 1.7k operations decode in
+about 11 ms (13x schedule_fcfs), 16k in about 0.8 s (95x). Whether a gap
+fits depends on setups on both sides and on maintenance windows, so gaps
+cannot be indexed by length alone; the sorted lists are kept, and the
+decoder is meant for the GA's "active" mode and the ACTIVE rule on
+instances of a few thousand operations.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from models import Job, Machine
+from scheduler.instance import (
+    MachineStateSnapshot,
+    ProblemInstance,
+    compile_instance,
+    snapshot_machine_state,
+)
+from core.logger import logger
+
+_NEG_INF = float("-inf")
+
+
+def _decode_gap_fill(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    available_at: list,
+    last_job: list,
+) -> list:
+    """
+    Decode a job-index ordering into an active schedule.
+
+    `available_at` / `last_job` give each machine's starting state; a machine
+    that is busy or has run a job starts with a virtual busy interval ending
+    at `available_at`, so nothing is inserted before it.
+    """
+    n_machines = instance.n_machines
+    # Per machine: parallel lists of busy interval starts, ends and job ids
+    busy_start = [[] for _ in range(n_machines)]
+    busy_end = [[] for _ in range(n_machines)]
+    busy_job = [[] for _ in range(n_machines)]
+    for k in range(n_machines):
+        if available_at[k] or last_job[k] is not None:
+            busy_start[k].append(_NEG_INF)
+            busy_end[k].append(available_at[k])
+            busy_job[k].append(last_job[k])
+
+    schedule = []
+    append = schedule.append
+    job_ids = instance.job_ids
+    machine_ids = instance.machine_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    downtime = instance.downtime
+
+    for j in order:
+        job_id = job_ids[j]
+        first_op = job_op_start[j]
+        release = 0
+        for o in range(first_op, job_op_start[j + 1]):
+            k = op_machine[o]
+            duration = op_time[o]
+            starts = busy_start[k]
+            ends = busy_end[k]
+            jobs_on = busy_job[k]
+            n = len(starts)
+
+            # Gaps before intervals that start at or before the release
+            # time cannot hold the operation: begin at the first later one.
+            i = bisect_right(starts, release)
+            while True:
+                earliest = release
+                if i > 0:
+                    prev_job = jobs_on[i - 1]
+                    gap_open = ends[i - 1]
+                    if prev_job is not None and prev_job != job_id:
+                        gap_open += setup_time
+                    if gap_open > earliest:
+                        earliest = gap_open
+                start = downtime[k].earliest_start(earliest, duration)
+                if i == n:
+                    break
+                gap_close = starts[i]
+                if jobs_on[i] != job_id:
+                    gap_close -= setup_time
+                if start + duration <= gap_close:
+                    break
+                i += 1
+
+            end = start + duration
+            starts.insert(i, start)
+            ends.insert(i, end)
+            jobs_on.insert(i, job_id)
+            append((job_id, o - first_op, machine_ids[k], start, end))
+            release = end
+
+    return schedule
+
+
+def schedule_instance_gap_fill(
+    instance: ProblemInstance,
+    order: list[int],
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None = None,
+) -> list:
+    """
+    Side-effect-free gap-filling decode of a job-index ordering.
+
+    Same arguments and result format as `scheduler.engine.schedule_instance`.
+    """
+    available_at, last_job = instance.initial_state(initial_state)
+    return _decode_gap_fill(instance, order, setup_time, available_at, last_job)
+
+
+def schedule_gap_fill(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> list:
+    """
+    Schedules jobs in the given order, filling earlier idle gaps (active schedule).
+
+    Args:
+        jobs: Ordered list of Job objects to schedule.
+        machines: List of Machine objects (their availability state is read, not modified).
+        setup_time: Time units added when a machine switches to a different job.
+        instance: Optional pre-compiled ProblemInstance covering `jobs` and `machines`.
+
+    Returns:
+        List of tuples: (job_id, op_index, machine_id, start_time, end_time)
+    """
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+        order = list(range(instance.n_jobs))
+    else:
+        order = instance.order_of(jobs)
+
+    schedule = schedule_instance_gap_fill(
+        instance, order, setup_time, snapshot_machine_state(machines)
+    )
+    logger.debug("Gap-filling decoder scheduled {} operations for {} jobs.", len(schedule), len(jobs))
+    return schedule
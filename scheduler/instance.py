@@ -0,0 +1,151 @@
+# scheduler/instance.py
+"""
+Compiled, array-backed representation of a scheduling problem.
+
+The object graph produced by the data loaders (Job -> Operation, Machine)
+is convenient to build but expensive to walk: every decode does attribute
+lookups and `machine_map[operation.machine_id]` dict hits for every
+operation. `ProblemInstance` compiles that graph once into integer-indexed
+flat lists so the scheduling engines, the GA and the RL environment can
+decode a job ordering with plain list indexing.
+
+Layout (n = number of jobs, m = number of machines):
+  job_ids[j]          original job_id of job index j
+  machine_ids[k]      original machine_id of machine index k
+  job_op_start[j]     offset of job j's first operation in the flat arrays
+                      (length n + 1, so job j owns [start[j], start[j+1]))
+  op_machine[o]       machine index of flat operation o
+  op_time[o]          processing time of flat operation o
+  due_dates[j], priorities[j], job_work[j] (total processing time)
+  unavailable[k]      maintenance windows of machine k, as given
+  downtime[k]         DowntimeIndex over unavailable[k] (O(log k) lookups)
+
+An instance only holds the machine *specs* (ID and maintenance windows).
+The mutable part of a machine — when it is next free and which job it ran
+last — is passed separately as a `MachineStateSnapshot`, so one instance
+can be decoded any number of times without copying anything.
+"""
+from __future__ import annotations
+
+from models import Job, Machine
+from scheduler.downtime import DowntimeIndex
+
+# machine_id -> (available_at, last_job_id)
+MachineStateSnapshot = dict[int, tuple[float, int | None]]
+
+
+class ProblemInstance:
+    """
+    Immutable, integer-indexed view of a list of jobs and machines.
+
+    Build it once after loading (``compile_instance(jobs, machines)``) and
+    pass it to any engine via its ``instance=`` argument to skip the
+    per-call compilation.
+    """
+
+    __slots__ = (
+        "jobs",
+        "machines",
+        "job_ids",
+        "machine_ids",
+        "job_index",
+        "machine_index",
+        "job_op_start",
+        "op_machine",
+        "op_time",
+        "due_dates",
+        "priorities",
+        "job_work",
+        "unavailable",
+        "downtime",
+    )
+
+    def __init__(self, jobs: list[Job], machines: list[Machine]) -> None:
+        self.jobs = tuple(jobs)
+        self.machines = tuple(machines)
+
+        self.machine_ids = [m.machine_id for m in machines]
+        self.machine_index = {mid: k for k, mid in enumerate(self.machine_ids)}
+        if len(self.machine_index) != len(self.machine_ids):
+            raise ValueError("Duplicate machine_id in machine list.")
+
+        self.job_ids = [j.job_id for j in jobs]
+        self.job_index = {jid: j for j, jid in enumerate(self.job_ids)}
+        if len(self.job_index) != len(self.job_ids):
+            raise ValueError("Duplicate job_id in job list.")
+
+        self.job_op_start = [0]
+        self.op_machine = []
+        self.op_time = []
+        for job in jobs:
+            for op in job.operations:
+                k = self.machine_index.get(op.machine_id)
+                if k is None:
+                    raise ValueError(
+                        f"Job {job.job_id}: operation references unknown machine {op.machine_id}."
+                    )
+                self.op_machine.append(k)
+                self.op_time.append(op.processing_time)
+            self.job_op_start.append(len(self.op_machine))
+
+        self.due_dates = [j.due_date for j in jobs]
+        self.priorities = [j.priority for j in jobs]
+        self.job_work = [
+            sum(self.op_time[self.job_op_start[j]:self.job_op_start[j + 1]])
+            for j in range(len(jobs))
+        ]
+        self.unavailable = [list(m.unavailable_periods) for m in machines]
+        self.downtime = [DowntimeIndex(periods) for periods in self.unavailable]
+
+    @property
+    def n_jobs(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def n_machines(self) -> int:
+        return len(self.machine_ids)
+
+    @property
+    def n_ops(self) -> int:
+        return len(self.op_machine)
+
+    def initial_state(self, snapshot: MachineStateSnapshot | None = None) -> tuple[list, list]:
+        """
+        Fresh per-machine-index (available_at, last_job_id) lists.
+
+        Machines missing from `snapshot` start idle at t=0 with no previous job.
+        """
+        available_at = [0] * self.n_machines
+        last_job = [None] * self.n_machines
+        if snapshot:
+            machine_index = self.machine_index
+            for machine_id, (free_at, last_job_id) in snapshot.items():
+                k = machine_index.get(machine_id)
+                if k is not None:
+                    available_at[k] = free_at
+                    last_job[k] = last_job_id
+        return available_at, last_job
+
+    def order_of(self, jobs: list[Job]) -> list[int]:
+        """Translate an ordered list of Job objects into a list of job indices."""
+        job_index = self.job_index
+        return [job_index[job.job_id] for job in jobs]
+
+    def __repr__(self) -> str:
+        return f"ProblemInstance(jobs={self.n_jobs}, machines={self.n_machines}, ops={self.n_ops})"
+
+
+def snapshot_machine_state(machines: list[Machine]) -> MachineStateSnapshot:
+    """Capture the mutable availability state of Machine objects."""
+    return {m.machine_id: (m.available_at, m.last_job_id) for m in machines}
+
+
+def compile_instance(jobs: list[Job], machines: list[Machine]) -> ProblemInstance:
+    """
+    Compile jobs and machines into a ProblemInstance.
+
+    Raises:
+        ValueError: If IDs are duplicated or an operation references a
+            machine that is not in `machines`.
+    """
+    return ProblemInstance(jobs, machines)
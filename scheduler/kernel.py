@@ -0,0 +1,205 @@
+# scheduler/kernel.py
+"""
+Optional JIT-compiled FCFS decode kernel.
+
+When Numba is importable, `_decode_kernel` is compiled with `numba.njit`
+and runs the FCFS decode plus the makespan / total-tardiness computation
+over the instance's integer arrays at native speed. Without Numba (or with
+SHOPFLOOR_DISABLE_JIT=1) nothing changes: `scheduler.engine._decode_fcfs`
+stays the reference implementation and `KERNEL_AVAILABLE` is False.
+
+The kernel source is plain Python over NumPy arrays, so the parity tests
+run it uncompiled as well as compiled against the reference decode.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from scheduler.batch_decoder import _NO_JOB, _OTHER_JOB, _integral
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+try:  # pragma: no cover - depends on the environment
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+KERNEL_AVAILABLE = numba is not None and os.getenv("SHOPFLOOR_DISABLE_JIT", "") not in ("1", "true", "yes")
+
+# Below this many operations the array conversion costs more than it saves
+KERNEL_MIN_OPS = 200
+
+
+def _decode_kernel(
+    order, job_op_start, op_machine, op_time, due_dates,
+    window_start, window_end, window_ptr,
+    setup_time, zero, available, last, op_start_out, op_end_out,
+):
+    """
+    FCFS decode of `order` (job indices) over flat arrays.
+
+    `available` / `last` are per-machine state arrays updated in place;
+    `last` holds job indices (-1 = no job yet). Start and end times are
+    written to `op_start_out` / `op_end_out` by flat operation index.
+    Maintenance windows of machine k are window_start/end[window_ptr[k]:
+    window_ptr[k + 1]], sorted and merged as in DowntimeIndex.
+
+    Returns:
+        (makespan, total_tardiness)
+    """
+    makespan = zero
+    tardiness = zero
+    for n in range(order.shape[0]):
+        j = order[n]
+        job_end = zero
+        first = job_op_start[j]
+        stop = job_op_start[j + 1]
+        for o in range(first, stop):
+            k = op_machine[o]
+            duration = op_time[o]
+
+            t = available[k]
+            if last[k] != -1 and last[k] != j:
+                t = t + setup_time
+            if job_end > t:
+                t = job_end
+
+            lo = window_ptr[k]
+            hi = window_ptr[k + 1]
+            if lo < hi and t < window_end[hi - 1]:
+                # First window still open at t, then skip windows the
+                # operation would overlap
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if window_end[mid] <= t:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                hi = window_ptr[k + 1]
+                while lo < hi and t + duration > window_start[lo]:
+                    t = window_end[lo]
+                    lo += 1
+
+            end = t + duration
+            available[k] = end
+            last[k] = j
+            job_end = end
+            op_start_out[o] = t
+            op_end_out[o] = end
+
+        if stop > first:
+            if job_end > makespan:
+                makespan = job_end
+            if job_end > due_dates[j]:
+                tardiness = tardiness + (job_end - due_dates[j])
+    return makespan, tardiness
+
+
+if KERNEL_AVAILABLE:  # pragma: no cover
+    _compiled_kernel = numba.njit(cache=True, nogil=True)(_decode_kernel)
+else:
+    _compiled_kernel = None
+
+
+def _scalar(value):
+    """Plain Python number (the compiled kernel already returns one)."""
+    return value.item() if hasattr(value, "item") else value
+
+
+class KernelDecoder:
+    """
+    FCFS decoder for one compiled instance backed by `_decode_kernel`.
+
+    Args:
+        instance: Compiled ProblemInstance.
+        setup_time: Time units added when a machine switches jobs.
+        initial_state: Optional {machine_id: (available_at, last_job_id)}.
+        jit: Use the compiled kernel (requires Numba). With jit=False the
+            kernel runs as plain Python — only useful for testing.
+    """
+
+    def __init__(
+        self,
+        instance: ProblemInstance,
+        setup_time: int,
+        initial_state: MachineStateSnapshot | None = None,
+        jit: bool = True,
+    ) -> None:
+        if jit and not KERNEL_AVAILABLE:
+            raise RuntimeError("The JIT decode kernel needs numba, which is not available.")
+        self.instance = instance
+        self._kernel = _compiled_kernel if jit else _decode_kernel
+
+        available_at, last_job = instance.initial_state(initial_state)
+        window_times = [t for index in instance.downtime for t in (*index.starts, *index.ends)]
+        integral = _integral(
+            [setup_time, *instance.op_time, *available_at, *instance.due_dates, *window_times]
+        )
+        dtype = np.int64 if integral else np.float64
+        self.dtype = dtype
+
+        self.setup_time = dtype(setup_time)
+        self.zero = dtype(0)
+        self.job_op_start = np.asarray(instance.job_op_start, dtype=np.int64)
+        self.op_machine = np.asarray(instance.op_machine, dtype=np.int64)
+        self.op_time = np.asarray(instance.op_time, dtype=dtype)
+        self.due_dates = np.asarray(instance.due_dates, dtype=dtype)
+        self.window_ptr = np.cumsum([0] + [len(index) for index in instance.downtime]).astype(np.int64)
+        self.window_start = np.asarray(
+            [s for index in instance.downtime for s in index.starts], dtype=dtype
+        )
+        self.window_end = np.asarray(
+            [e for index in instance.downtime for e in index.ends], dtype=dtype
+        )
+        self.initial_available = np.asarray(available_at, dtype=dtype)
+        job_index = instance.job_index
+        self.initial_last = np.asarray(
+            [_NO_JOB if jid is None else job_index.get(jid, _OTHER_JOB) for jid in last_job],
+            dtype=np.int64,
+        )
+
+    def _run(self, order) -> tuple:
+        starts = np.empty(self.instance.n_ops, dtype=self.dtype)
+        ends = np.empty(self.instance.n_ops, dtype=self.dtype)
+        makespan, tardiness = self._kernel(
+            np.asarray(order, dtype=np.int64),
+            self.job_op_start, self.op_machine, self.op_time, self.due_dates,
+            self.window_start, self.window_end, self.window_ptr,
+            self.setup_time, self.zero,
+            self.initial_available.copy(), self.initial_last.copy(),
+            starts, ends,
+        )
+        return _scalar(makespan), _scalar(tardiness), starts, ends
+
+    def objectives(self, order) -> tuple:
+        """(makespan, total_tardiness) of a job-index ordering."""
+        makespan, tardiness, _, _ = self._run(order)
+        return makespan, tardiness
+
+    def schedule(self, order) -> list:
+        """
+        Full schedule of a job-index ordering.
+
+        Returns:
+            List of tuples: (job_id, op_index, machine_id, start_time, end_time)
+        """
+        _, _, starts, ends = self._run(order)
+        starts = starts.tolist()
+        ends = ends.tolist()
+        inst = self.instance
+        job_ids = inst.job_ids
+        machine_ids = inst.machine_ids
+        job_op_start = inst.job_op_start
+        op_machine = inst.op_machine
+        schedule = []
+        for j in order:
+            first = job_op_start[j]
+            for o in range(first, job_op_start[j + 1]):
+                schedule.append((job_ids[j], o - first, machine_ids[op_machine[o]], starts[o], ends[o]))
+        return schedule
+
+
+def use_kernel(instance: ProblemInstance) -> bool:
+    """Whether the engines should route `instance` through the JIT kernel."""
+    return KERNEL_AVAILABLE and instance.n_ops >= KERNEL_MIN_OPS
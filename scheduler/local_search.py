@@ -0,0 +1,194 @@
+# scheduler/local_search.py
+"""
+Swap / insertion local search over job orderings with delta evaluation.
+
+A swap of positions i < j, or moving the job at i to position j, leaves
+every job before min(i, j) where it was: the FCFS decode of that prefix,
+and the machine state it leaves behind, are unchanged. `DeltaEvaluator`
+decodes a base ordering once, saving the per-machine (available_at,
+last_job) state every `stride` positions together with running makespan /
+tardiness totals, so a neighbour is decoded only from the saved position
+at or before its first change.
+
+Past the last changed position the neighbour decodes the same jobs as the
+base ordering. As soon as its machine state equals the saved base state
+at a saved position, the rest of the decode is identical, and the
+remaining makespan and tardiness are read from the base totals instead.
+Makespan and tardiness only grow along the decode, so with non-negative
+weights a neighbour is also abandoned as soon as its partial fitness
+reaches the fitness it has to beat.
+
+Objective values are exactly those of `evaluate_instance`.
+"""
+from __future__ import annotations
+
+import random
+import time
+from array import array
+
+from scheduler.engine import _objectives_fcfs
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+
+class DeltaEvaluator:
+    """
+    Objectives of orderings that differ from a base ordering in one window.
+
+    Call `reset(order)` to decode a new base ordering, then
+    `evaluate(neighbour, first, last)` for neighbours whose positions
+    outside [first, last] hold the same jobs as the base. The base state is
+    saved every `stride` jobs, so a neighbour is decoded from the saved
+    position at or before `first`.
+    """
+
+    def __init__(
+        self,
+        instance: ProblemInstance,
+        setup_time: int,
+        initial_state: MachineStateSnapshot | None = None,
+        stride: int = 8,
+    ) -> None:
+        if stride < 1:
+            raise ValueError("stride must be >= 1")
+        self.instance = instance
+        self.setup_time = setup_time
+        self.stride = stride
+        self._initial = instance.initial_state(initial_state)
+        self.jobs_decoded = 0
+
+    def reset(self, order) -> tuple:
+        """Decode the base ordering, saving the state every `stride` positions."""
+        instance = self.instance
+        setup_time = self.setup_time
+        stride = self.stride
+        available_at, last_job = (list(state) for state in self._initial)
+        n = len(order)
+        # Per saved position c * stride: machine state and totals of the jobs before it
+        self._states = []
+        self._prefix = []
+        chunks = []
+        makespan = tardiness = 0
+        for p in range(0, n, stride):
+            self._states.append((tuple(available_at), tuple(last_job)))
+            self._prefix.append((makespan, tardiness))
+            chunk = _objectives_fcfs(instance, order[p:p + stride], setup_time, available_at, last_job)
+            chunks.append(chunk)
+            makespan = max(makespan, chunk[0])
+            tardiness += chunk[1]
+
+        # Makespan / tardiness of the jobs from saved position c to the end
+        self._suffix = [None] * len(chunks)
+        suffix_makespan = suffix_tardiness = 0
+        for c in range(len(chunks) - 1, -1, -1):
+            suffix_makespan = max(suffix_makespan, chunks[c][0])
+            suffix_tardiness += chunks[c][1]
+            self._suffix[c] = (suffix_makespan, suffix_tardiness)
+        self.jobs_decoded += n
+        self.objectives = (makespan, tardiness)
+        return self.objectives
+
+    def evaluate(self, order, first: int, last: int, weights: tuple | None = None, cutoff: float = float("inf")) -> tuple:
+        """
+        (makespan, total_tardiness) of `order`, which matches the base
+        ordering everywhere outside positions first..last.
+
+        With non-negative `weights` (w_makespan, w_tardiness), the decode
+        stops once the weighted partial objectives reach `cutoff`; the
+        values returned are then a partial lower bound, not exact.
+        """
+        instance = self.instance
+        setup_time = self.setup_time
+        stride = self.stride
+        n = len(order)
+
+        c = first // stride
+        available_at, last_job = (list(state) for state in self._states[c])
+        makespan, tardiness = self._prefix[c]
+        # Decode through the changed window up to the next saved position
+        p = c * stride
+        end = min(n, (last // stride + 1) * stride)
+        window_makespan, window_tardiness = _objectives_fcfs(
+            instance, order[p:end], setup_time, available_at, last_job
+        )
+        makespan = max(makespan, window_makespan)
+        tardiness += window_tardiness
+        decoded = end - p
+
+        states = self._states
+        for p in range(end, n, stride):
+            c = p // stride
+            if weights is not None and makespan * weights[0] + tardiness * weights[1] >= cutoff:
+                break
+            if (tuple(available_at), tuple(last_job)) == states[c]:
+                # Same state, same remaining jobs: the rest of the base decode
+                suffix_makespan, suffix_tardiness = self._suffix[c]
+                makespan = max(makespan, suffix_makespan)
+                tardiness += suffix_tardiness
+                break
+            chunk_makespan, chunk_tardiness = _objectives_fcfs(
+                instance, order[p:p + stride], setup_time, available_at, last_job
+            )
+            makespan = max(makespan, chunk_makespan)
+            tardiness += chunk_tardiness
+            decoded += min(stride, n - p)
+        self.jobs_decoded += decoded
+        return makespan, tardiness
+
+
+def local_search(
+    evaluator: DeltaEvaluator,
+    order,
+    w_makespan: float,
+    w_tardiness: float,
+    deadline: float,
+    max_moves: int,
+    rng=random,
+) -> tuple:
+    """
+    First-improvement search over random swap and insertion moves.
+
+    Moves are drawn from `rng` (a random.Random, or the `random` module by
+    default, so `random.seed()` applies); a seeded RNG makes a search
+    reproducible as long as the deadline is not what stops it.
+
+    Args:
+        evaluator: DeltaEvaluator for the instance being searched.
+        order: Starting job-index ordering (not modified).
+        w_makespan: Weight of makespan in the fitness being minimised.
+        w_tardiness: Weight of total tardiness.
+        deadline: time.monotonic() value at which to stop.
+        max_moves: Stop after this many consecutive non-improving moves.
+        rng: Source of the random moves.
+
+    Returns:
+        (order, (makespan, total_tardiness), moves_evaluated, improvements)
+    """
+    order = array('i', order)
+    n = len(order)
+    objectives = evaluator.reset(order)
+    if n < 2:
+        return order, objectives, 0, 0
+    best = objectives[0] * w_makespan + objectives[1] * w_tardiness
+    # Early rejection is only valid when fitness cannot drop along the decode
+    weights = (w_makespan, w_tardiness) if w_makespan >= 0 and w_tardiness >= 0 else None
+
+    moves = improvements = failures = 0
+    while failures < max_moves and time.monotonic() < deadline:
+        i, j = rng.sample(range(n), 2)
+        neighbour = array('i', order)
+        if rng.random() < 0.5:
+            neighbour[i], neighbour[j] = neighbour[j], neighbour[i]
+        else:
+            neighbour.insert(j, neighbour.pop(i))
+        candidate = evaluator.evaluate(neighbour, min(i, j), max(i, j), weights, best)
+        moves += 1
+        fitness = candidate[0] * w_makespan + candidate[1] * w_tardiness
+        if fitness < best:
+            best = fitness
+            order = neighbour
+            objectives = evaluator.reset(order)
+            improvements += 1
+            failures = 0
+        else:
+            failures += 1
+    return order, objectives, moves, improvements
@@ -43,6 +43,26 @@ def calculate_tardiness(schedule: list, jobs: list[Job]) -> int:
     return total_tardiness
 
 
+def schedule_objectives(schedule: list, due_dates: dict) -> tuple:
+    """
+    Returns (makespan, total_tardiness) in one pass.
+
+    Takes a prebuilt {job_id: due_date} map so search loops scoring many
+    schedules of the same jobs build it once instead of once per call.
+    """
+    job_completion_times: dict[int, int] = {}
+    for op in schedule:
+        job_id, end_time = op[0], op[4]
+        job_completion_times[job_id] = max(job_completion_times.get(job_id, 0), end_time)
+
+    makespan = max(job_completion_times.values(), default=0)
+    total_tardiness = 0
+    for job_id, completion_time in job_completion_times.items():
+        if job_id in due_dates:
+            total_tardiness += max(0, completion_time - due_dates[job_id])
+    return makespan, total_tardiness
+
+
 def calculate_utilization(schedule: list, machines: list) -> dict[int, float]:
     """
     Returns per-machine utilization as a fraction (0.0 – 1.0).
@@ -0,0 +1,129 @@
+# scheduler/parallel.py
+"""
+Process-pool fitness evaluation for permutation search.
+
+Decoding is pure Python and holds the GIL, so a GA evaluating its
+population in the FastAPI worker thread uses one core and slows the event
+loop down with it. `ParallelEvaluator` spreads the decodes over a
+`ProcessPoolExecutor` instead:
+
+  - the compiled instance, setup time and starting machine state are sent
+    to every worker once, through the pool initializer;
+  - each call ships only job-index orderings (lists of ints), split into
+    one chunk per worker, and gets back only (makespan, total_tardiness).
+
+Workers are started with the "spawn" method: the scheduling API runs the
+GA in a background thread, and forking a multi-threaded process is unsafe.
+Objective values are exactly those of the serial decoders.
+"""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+# Per-worker-process state, set once by _init_worker
+_worker = None
+
+
+def _init_worker(
+    instance: ProblemInstance,
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None,
+    decoder: str,
+    use_jit: bool,
+) -> None:
+    global _worker
+    from scheduler.kernel import KernelDecoder, use_kernel
+
+    kernel = None
+    if use_jit and decoder == "fcfs" and use_kernel(instance):
+        kernel = KernelDecoder(instance, setup_time, initial_state)
+    _worker = (instance, setup_time, initial_state, decoder, kernel)
+
+
+def _evaluate_chunk(orders: list) -> list:
+    """(makespan, total_tardiness) for each ordering, in the worker process."""
+    from scheduler.engine import evaluate_instance
+    from scheduler.gap_fill import schedule_instance_gap_fill
+    from scheduler.metrics import schedule_objectives
+
+    instance, setup_time, initial_state, decoder, kernel = _worker
+    if kernel is not None:
+        return [kernel.objectives(order) for order in orders]
+    if decoder == "fcfs":
+        return [evaluate_instance(instance, order, setup_time, initial_state) for order in orders]
+    due_dates = dict(zip(instance.job_ids, instance.due_dates))
+    return [
+        schedule_objectives(schedule_instance_gap_fill(instance, order, setup_time, initial_state), due_dates)
+        for order in orders
+    ]
+
+
+class ParallelEvaluator:
+    """
+    Evaluates batches of job orderings on a pool of worker processes.
+
+    Args:
+        instance: Compiled ProblemInstance.
+        setup_time: Time units added when a machine switches jobs.
+        initial_state: Optional {machine_id: (available_at, last_job_id)}.
+        workers: Number of worker processes (>= 1).
+        decoder: "fcfs" or "active" (scheduler/gap_fill.py).
+        use_jit: Let workers evaluate through the Numba kernel when it is
+            available and the instance is large enough.
+
+    Use as a context manager, or call `close()`, to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        instance: ProblemInstance,
+        setup_time: int,
+        initial_state: MachineStateSnapshot | None = None,
+        workers: int = 2,
+        decoder: str = "fcfs",
+        use_jit: bool = True,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if decoder not in ("fcfs", "active"):
+            raise ValueError(f"Unknown decoder: {decoder!r}")
+        self.workers = workers
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(instance, setup_time, initial_state, decoder, use_jit),
+        )
+
+    def evaluate(self, orders: list) -> list:
+        """
+        Objectives of every ordering, in input order.
+
+        Args:
+            orders: Job-index orderings, as produced by `ProblemInstance.order_of`.
+
+        Returns:
+            List of (makespan, total_tardiness) tuples.
+        """
+        orders = list(orders)
+        if not orders:
+            return []
+        size = -(-len(orders) // self.workers)
+        chunks = [orders[i:i + size] for i in range(0, len(orders), size)]
+        results = []
+        for chunk_result in self._pool.map(_evaluate_chunk, chunks):
+            results.extend(chunk_result)
+        return results
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,80 @@
+# scheduler/pareto.py
+"""
+Pareto ranking for the two scheduling objectives, makespan and total
+tardiness, both minimised (NSGA-II building blocks).
+
+  non_dominated_sort  splits points into fronts: front 0 is dominated by
+                      no point, front k only by points of earlier fronts.
+                      With two objectives, points taken in lexicographic
+                      order are dominated by a front exactly when they are
+                      dominated by its last point, and the fronts that
+                      dominate a point form a prefix, so each point finds
+                      its front by binary search: O(n log n).
+  crowding_distance   how isolated each point of a front is; boundary
+                      points are infinitely isolated so the extremes of the
+                      trade-off are always kept.
+  hypervolume         area dominated by a front up to a reference point,
+                      a single number that grows whenever the front improves.
+"""
+from __future__ import annotations
+
+
+def dominates(a: tuple, b: tuple) -> bool:
+    """True when `a` is no worse than `b` in both objectives and better in one."""
+    return a[0] <= b[0] and a[1] <= b[1] and a != b
+
+
+def non_dominated_sort(points: list) -> list[list[int]]:
+    """
+    Non-dominated fronts of (makespan, tardiness) points.
+
+    Returns:
+        List of fronts, best first; each front is a list of indices into
+        `points`, in lexicographic order of their points.
+    """
+    fronts: list[list[int]] = []
+    for i in sorted(range(len(points)), key=points.__getitem__):
+        p = points[i]
+        # First front whose last point does not dominate p
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if dominates(points[fronts[mid][-1]], p):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append([i])
+        else:
+            fronts[lo].append(i)
+    return fronts
+
+
+def crowding_distance(points: list, front: list[int]) -> dict[int, float]:
+    """Crowding distance of every index of `front`, normalised per objective."""
+    distance = {i: 0.0 for i in front}
+    if len(front) < 3:
+        return {i: float("inf") for i in front}
+    for k in (0, 1):
+        ranked = sorted(front, key=lambda i: points[i][k])
+        low, high = points[ranked[0]][k], points[ranked[-1]][k]
+        distance[ranked[0]] = distance[ranked[-1]] = float("inf")
+        if high == low:
+            continue
+        for prev, i, nxt in zip(ranked, ranked[1:], ranked[2:]):
+            distance[i] += (points[nxt][k] - points[prev][k]) / (high - low)
+    return distance
+
+
+def hypervolume(points: list, reference: tuple) -> float:
+    """Area dominated by `points` and bounded by `reference` (worse than every point of interest)."""
+    area = 0.0
+    best_tardiness = reference[1]
+    # Sweep by makespan; each point adds the strip below the best tardiness so far
+    for makespan, tardiness in sorted(set(points)):
+        if makespan >= reference[0]:
+            break
+        if tardiness < best_tardiness:
+            area += (reference[0] - makespan) * (best_tardiness - tardiness)
+            best_tardiness = tardiness
+    return area
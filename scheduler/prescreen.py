@@ -0,0 +1,186 @@
+# scheduler/prescreen.py
+"""
+Lower-bound pre-screening of GA children.
+
+Tournament selection draws `tourn_size` distinct individuals and keeps
+the fittest, so an individual with `pop_size - tourn_size + 1` strictly
+fitter ones can never win a tournament: whatever its exact fitness, it is
+never selected as a parent, never the elite and never the best. Such a
+child does not need a full decode.
+
+`PrescreenEvaluator` decodes an ordering one job at a time with the
+shared FCFS decoder (`engine._objectives_fcfs`, which `evaluate_instance`
+runs over the whole ordering) and, after every job, bounds the final
+objectives from below:
+
+  makespan   each machine still has to run its remaining work after its
+             current availability (setups and maintenance only add to it)
+  tardiness  each job not yet decoded is at least as tardy as when it
+             runs alone on the shop from the starting machine state
+
+and abandons the decode as soon as the weighted bound is worse than the
+cutoff. `evaluate_population` sets the cutoff to the fitness of the
+(pop_size - tourn_size + 1)-th fittest individual decoded so far, so only
+children that can never be selected are abandoned. They are recorded
+with their bound objectives, which are still worse than every selectable
+individual, so selection, elitism and the best-so-far are exactly those
+of a full evaluation.
+"""
+from __future__ import annotations
+
+import heapq
+
+from scheduler.bounds import _job_heads
+from scheduler.engine import _objectives_fcfs
+from scheduler.instance import MachineStateSnapshot, ProblemInstance
+
+
+class PrescreenEvaluator:
+    """
+    FCFS objectives of orderings, abandoning hopeless ones part-way.
+
+    Weights must be non-negative: the bound relies on fitness never
+    dropping as more jobs are decoded.
+    """
+
+    def __init__(
+        self,
+        instance: ProblemInstance,
+        setup_time: int,
+        initial_state: MachineStateSnapshot | None = None,
+        w_makespan: float = 1.0,
+        w_tardiness: float = 1.0,
+    ) -> None:
+        if w_makespan < 0 or w_tardiness < 0:
+            raise ValueError("Pre-screening needs non-negative fitness weights.")
+        self.instance = instance
+        self.setup_time = setup_time
+        self.w_makespan = w_makespan
+        self.w_tardiness = w_tardiness
+        self._initial = instance.initial_state(initial_state)
+
+        op_machine = instance.op_machine
+        op_time = instance.op_time
+        work = [0] * instance.n_machines
+        for o in range(instance.n_ops):
+            work[op_machine[o]] += op_time[o]
+        self._work = work
+        available_at = self._initial[0]
+        self._makespan_bound = max(
+            (available_at[k] + work[k] for k in range(instance.n_machines) if work[k]), default=0,
+        )
+
+        # Tardiness no ordering can avoid: each job alone on the shop
+        heads = _job_heads(instance, setup_time, *instance.initial_state(initial_state))
+        job_op_start = instance.job_op_start
+        self._job_tardiness = [0] * instance.n_jobs
+        for j in range(instance.n_jobs):
+            stop = job_op_start[j + 1]
+            if stop > job_op_start[j]:
+                completion = heads[stop - 1] + op_time[stop - 1]
+                self._job_tardiness[j] = max(0, completion - instance.due_dates[j])
+        self._tardiness_bound = sum(self._job_tardiness)
+
+        self.decoded = 0
+        self.aborted = 0
+        self.jobs_skipped = 0
+
+    def evaluate(self, order, cutoff: float = float("inf")) -> tuple:
+        """
+        Objectives of `order`, or a bound on them once they exceed `cutoff`.
+
+        Returns:
+            ((makespan, total_tardiness), exact). When `exact` is False the
+            decode was abandoned and the pair is a lower bound whose
+            weighted fitness is greater than `cutoff`.
+        """
+        instance = self.instance
+        job_op_start = instance.job_op_start
+        op_machine = instance.op_machine
+        op_time = instance.op_time
+        setup_time = self.setup_time
+        w_makespan = self.w_makespan
+        w_tardiness = self.w_tardiness
+        job_tardiness = self._job_tardiness
+
+        available_at = list(self._initial[0])
+        last_job = list(self._initial[1])
+        remaining = list(self._work)
+        makespan_bound = self._makespan_bound
+        rest_tardiness = self._tardiness_bound
+        self.decoded += 1
+
+        makespan = 0
+        total_tardiness = 0
+        for position, j in enumerate(order):
+            # One job at a time through the shared decoder, which carries the machine state
+            job_end, job_late = _objectives_fcfs(instance, (j,), setup_time, available_at, last_job)
+            if job_end > makespan:
+                makespan = job_end
+            total_tardiness += job_late
+            rest_tardiness -= job_tardiness[j]
+            ops = range(job_op_start[j], job_op_start[j + 1])
+            for o in ops:
+                remaining[op_machine[o]] -= op_time[o]
+            # Never decreases: availability grows by at least the work removed
+            for o in ops:
+                k = op_machine[o]
+                if available_at[k] + remaining[k] > makespan_bound:
+                    makespan_bound = available_at[k] + remaining[k]
+
+            bound_makespan = makespan if makespan > makespan_bound else makespan_bound
+            bound_tardiness = total_tardiness + rest_tardiness
+            if bound_makespan * w_makespan + bound_tardiness * w_tardiness > cutoff:
+                self.aborted += 1
+                self.jobs_skipped += len(order) - position - 1
+                return (bound_makespan, bound_tardiness), False
+
+        return (makespan, total_tardiness), True
+
+    def evaluate_population(self, orders: list, selectable: int, cache=None) -> list:
+        """
+        Objectives of a population, abandoning individuals that cannot be selected.
+
+        Args:
+            orders: The population's job-index orderings.
+            selectable: How many of the fittest individuals tournament
+                selection can pick (pop_size - tourn_size + 1).
+            cache: Optional FitnessCache; its hits are known exactly before
+                anything is decoded, and only exact results are stored.
+
+        Returns:
+            List of (makespan, total_tardiness), exact or bounds, in input order.
+        """
+        w_makespan = self.w_makespan
+        w_tardiness = self.w_tardiness
+        results = [None] * len(orders)
+        # Max-heap (negated) of the `selectable` best exact fitnesses so far
+        best: list = []
+
+        def record(value):
+            fitness = value[0] * w_makespan + value[1] * w_tardiness
+            if len(best) < selectable:
+                heapq.heappush(best, -fitness)
+            elif fitness < -best[0]:
+                heapq.heapreplace(best, -fitness)
+
+        pending = []
+        for i, order in enumerate(orders):
+            value = cache.get(order) if cache is not None else None
+            if value is None:
+                pending.append(i)
+            else:
+                results[i] = value
+                record(value)
+        for i in pending:
+            cutoff = -best[0] if selectable > 0 and len(best) >= selectable else float("inf")
+            value, exact = self.evaluate(orders[i], cutoff)
+            results[i] = value
+            if exact:
+                record(value)
+                if cache is not None:
+                    cache.put(orders[i], value)
+        return results
+
+    def stats(self) -> dict:
+        return {"decoded": self.decoded, "aborted": self.aborted, "jobs_skipped": self.jobs_skipped}
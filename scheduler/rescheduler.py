@@ -8,16 +8,38 @@ Provides two rescheduling strategies:
 
 Both functions reuse the FCFS constraint-aware engine from scheduler/engine.py
 to ensure all scheduling rules (setup times, unavailability, precedence) are respected.
+The machine state left behind by the frozen operations is passed to the engine
+as a snapshot, so the caller's Machine objects are never modified or copied.
 """
-import copy
 from typing import Optional
 
 from models import Job, Operation, Machine
-from scheduler.engine import schedule_fcfs
+from scheduler.engine import schedule_instance
+from scheduler.instance import MachineStateSnapshot, compile_instance
 from scheduler.metrics import build_full_metrics
 from core.logger import logger
 
 
+def _state_after(
+    frozen_ops: list,
+    machines: list[Machine],
+    start_time: int,
+) -> MachineStateSnapshot:
+    """
+    Machine state left behind by already-executed operations.
+
+    Every machine starts free at `start_time`; a machine that ran frozen
+    operations is free from the latest of their end times, with the job of
+    the last one listed as its previous job.
+    """
+    state = {m.machine_id: (start_time, None) for m in machines}
+    for job_id, _, machine_id, _, end_time in frozen_ops:
+        if machine_id in state:
+            available_at, _ = state[machine_id]
+            state[machine_id] = (max(available_at, end_time), job_id)
+    return state
+
+
 def reschedule_after_breakdown(
     original_schedule: list,
     broken_machine_id: int,
@@ -44,7 +66,7 @@ def reschedule_after_breakdown(
         downtime_start: When the breakdown starts.
         downtime_end: When the machine is expected back online.
         jobs: Full list of Job objects.
-        machines: Full list of Machine objects (will be deep-copied).
+        machines: Full list of Machine objects (not modified).
         setup_time: Setup time between different jobs.
 
     Returns:
@@ -55,16 +77,17 @@ def reschedule_after_breakdown(
         broken_machine_id, downtime_start, downtime_end,
     )
 
-    # Deep copy machines to avoid mutating originals
-    machines_copy = copy.deepcopy(machines)
-
-    # Add the breakdown window to the machine's unavailable periods
-    for m in machines_copy:
+    # Machine specs for the reschedule: the broken machine gets the breakdown
+    # window added to a new period list; every other machine is used as-is.
+    machine_specs = []
+    for m in machines:
         if m.machine_id == broken_machine_id:
-            m.unavailable_periods.append((downtime_start, downtime_end))
-            # Sort periods to maintain order
-            m.unavailable_periods.sort(key=lambda x: x[0])
-            break
+            periods = sorted(
+                list(m.unavailable_periods) + [(downtime_start, downtime_end)],
+                key=lambda x: x[0],
+            )
+            m = Machine(machine_id=m.machine_id, unavailable_periods=periods)
+        machine_specs.append(m)
 
     # Separate completed vs. in-progress/future operations
     completed_ops = []
@@ -115,21 +138,14 @@ def reschedule_after_breakdown(
         logger.info("All affected operations were already completed.")
         return completed_ops
 
-    # Reset machine state for rescheduling
-    # Set machine availability based on completed operations
-    for m in machines_copy:
-        m.available_at = 0
-        m.last_job_id = None
-
-    for op in completed_ops:
-        _, _, machine_id, _, end_time = op
-        for m in machines_copy:
-            if m.machine_id == machine_id:
-                m.available_at = max(m.available_at, end_time)
-                m.last_job_id = op[0]  # job_id
+    # Machine availability based on completed operations
+    initial_state = _state_after(completed_ops, machines, start_time=0)
 
     # Reschedule remaining work
-    new_schedule = schedule_fcfs(reschedule_jobs, machines_copy, setup_time)
+    instance = compile_instance(reschedule_jobs, machine_specs)
+    new_schedule = schedule_instance(
+        instance, list(range(instance.n_jobs)), setup_time, initial_state
+    )
 
     # Combine completed + rescheduled
     final_schedule = completed_ops + new_schedule
@@ -161,7 +177,7 @@ def insert_rush_order(
         original_schedule: The current schedule list of tuples.
         rush_job: The high-priority Job to insert.
         jobs: Original list of Job objects.
-        machines: List of Machine objects (will be deep-copied).
+        machines: List of Machine objects (not modified).
         setup_time: Setup time between different jobs.
         current_time: The current time point (operations ending before this are frozen).
 
@@ -173,8 +189,6 @@ def insert_rush_order(
         rush_job.job_id, rush_job.due_date, rush_job.priority, current_time,
     )
 
-    machines_copy = copy.deepcopy(machines)
-
     # Separate frozen (completed) vs. future operations
     frozen_ops = []
     future_job_ids = set()
@@ -217,20 +231,14 @@ def insert_rush_order(
     # Also include jobs that had no future operations but were in original list
     # (they're fully completed — nothing to reschedule)
 
-    # Reset machine state based on frozen operations
-    for m in machines_copy:
-        m.available_at = max(current_time, 0)
-        m.last_job_id = None
-
-    for op in frozen_ops:
-        _, _, machine_id, _, end_time = op
-        for m in machines_copy:
-            if m.machine_id == machine_id:
-                m.available_at = max(m.available_at, end_time)
-                m.last_job_id = op[0]
+    # Machine state based on frozen operations
+    initial_state = _state_after(frozen_ops, machines, start_time=max(current_time, 0))
 
     # Reschedule with rush job at the front
-    new_schedule = schedule_fcfs(reschedule_jobs, machines_copy, setup_time)
+    instance = compile_instance(reschedule_jobs, machines)
+    new_schedule = schedule_instance(
+        instance, list(range(instance.n_jobs)), setup_time, initial_state
+    )
 
     final_schedule = frozen_ops + new_schedule
 
@@ -0,0 +1,112 @@
+# scheduler/seeding.py
+"""
+Heuristic seed orderings for permutation search.
+
+A GA started from random permutations spends its first generations
+rediscovering what a sort rule or a dispatcher produces in one pass.
+`heuristic_orderings` runs every engine in ALGORITHM_MAP (the sort-then-
+FCFS rules, gap filling and the non-delay dispatch rules) once and turns
+each schedule back into a job-index ordering the GA can start from.
+
+A schedule is turned into the ordering whose FCFS decode keeps its
+per-machine operation sequences (see `schedule_ordering`): exact for the
+sort rules, an approximation for the interleaved dispatch and gap-fill
+schedules. Either way it is only a starting point for evolution.
+"""
+from __future__ import annotations
+
+import heapq
+
+from models import Job, Machine
+from scheduler.instance import ProblemInstance, compile_instance
+from core.logger import logger
+
+
+def schedule_ordering(instance: ProblemInstance, schedule: list) -> list[int]:
+    """
+    Job-index ordering whose FCFS decode follows `schedule`'s machine sequences.
+
+    Each machine's operation sequence says which jobs must come before
+    which. The ordering is a topological sort of those job precedences,
+    taking the ready job whose first operation starts earliest. Schedules
+    built by the FCFS decoder have no conflicting precedences, so their
+    ordering is recovered exactly. Interleaved (dispatched) schedules can
+    put job A before B on one machine and after it on another; such a cycle
+    is broken by releasing the blocked job with the earliest first start.
+    """
+    job_index = instance.job_index
+    n = instance.n_jobs
+    first_start = [float("inf")] * n
+    sequences: dict = {}
+    for job_id, _, machine_id, start, end in schedule:
+        j = job_index[job_id]
+        if start < first_start[j]:
+            first_start[j] = start
+        sequences.setdefault(machine_id, []).append((start, end, j))
+
+    successors: list[set] = [set() for _ in range(n)]
+    for ops in sequences.values():
+        ops.sort()
+        for (_, _, a), (_, _, b) in zip(ops, ops[1:]):
+            if a != b:
+                successors[a].add(b)
+    indegree = [0] * n
+    for succ in successors:
+        for b in succ:
+            indegree[b] += 1
+
+    # Jobs without operations have an infinite first start and go last
+    ready = [(first_start[j], j) for j in range(n) if indegree[j] == 0]
+    heapq.heapify(ready)
+    blocked = sorted((first_start[j], j) for j in range(n) if indegree[j] > 0)
+    placed = [False] * n
+    order = []
+    next_blocked = 0
+    while len(order) < n:
+        if ready:
+            _, j = heapq.heappop(ready)
+            if placed[j]:
+                continue
+        else:
+            # Precedence cycle: release the earliest-starting waiting job
+            while placed[blocked[next_blocked][1]]:
+                next_blocked += 1
+            j = blocked[next_blocked][1]
+        placed[j] = True
+        order.append(j)
+        for b in successors[j]:
+            indegree[b] -= 1
+            if indegree[b] == 0 and not placed[b]:
+                heapq.heappush(ready, (first_start[b], b))
+    return order
+
+
+def heuristic_orderings(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+) -> dict[str, list[int]]:
+    """
+    Distinct job-index orderings produced by the engines in ALGORITHM_MAP.
+
+    Returns:
+        {algorithm_name: ordering}; an algorithm whose ordering duplicates
+        an earlier one is left out.
+    """
+    from scheduler.engine import ALGORITHM_MAP, SEARCH_ALGORITHMS
+
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    orderings: dict[str, list[int]] = {}
+    seen: set[tuple] = set()
+    for name, fn in ALGORITHM_MAP.items():
+        if name in SEARCH_ALGORITHMS:
+            continue
+        order = schedule_ordering(instance, fn(jobs, machines, setup_time, instance=instance))
+        key = tuple(order)
+        if key not in seen:
+            seen.add(key)
+            orderings[name] = order
+    logger.debug("Heuristic seeds: {} distinct orderings from {}", len(orderings), list(orderings))
+    return orderings
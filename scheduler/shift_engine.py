@@ -18,6 +18,8 @@ Example: machine_id="1", shift_start=6, shift_end=14, cycle_length=24
 from __future__ import annotations
 
 from models import Job, Machine
+from scheduler.downtime import DowntimeIndex
+from scheduler.instance import ProblemInstance, compile_instance, snapshot_machine_state
 from core.logger import logger
 
 
@@ -82,77 +84,97 @@ def _adjust_for_shift(
     return start  # fallback
 
 
+def _earliest_start_with_shift(
+    downtime: DowntimeIndex,
+    shift: tuple[float, float, float] | None,
+    start: float,
+    duration: float,
+) -> float:
+    """
+    Earliest start >= `start` that avoids every maintenance window and,
+    when a shift is given, lies entirely inside a shift window.
+
+    Alternates the two adjustments until neither moves the start; both
+    only ever push forward, so the first fixed point is the earliest one.
+    """
+    max_iters = 1000
+    for _ in range(max_iters):
+        start = downtime.earliest_start(start, duration)
+        if shift is None:
+            return start
+        adjusted = _adjust_for_shift(start, duration, *shift)
+        if adjusted == start:
+            return start
+        start = adjusted
+    return start  # fallback
+
+
 def schedule_fcfs_with_shifts(
     jobs: list[Job],
     machines: list[Machine],
     setup_time: int,
     shift_map: ShiftMap | None = None,
+    instance: ProblemInstance | None = None,
 ) -> list:
     """
     Schedules jobs using FCFS with optional shift-window constraints.
 
     Args:
         jobs: Ordered list of Job objects.
-        machines: List of Machine objects.
+        machines: List of Machine objects (their availability state is read, not modified).
         setup_time: Extra time units when a machine switches jobs.
         shift_map: Optional mapping of machine_id -> (shift_start, shift_end, cycle_length).
                    If None or a machine is not in the map, no shift constraint is applied.
+        instance: Optional pre-compiled ProblemInstance covering `jobs` and `machines`.
 
     Returns:
         List of tuples: (job_id, op_index, machine_id, start_time, end_time)
     """
     shift_map = shift_map or {}
-    schedule = []
-    machine_map = {m.machine_id: m for m in machines}
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+        order = list(range(instance.n_jobs))
+    else:
+        order = instance.order_of(jobs)
 
-    for job in jobs:
+    schedule = []
+    available_at, last_job = instance.initial_state(snapshot_machine_state(machines))
+    # Shift windows per machine index (None = unconstrained)
+    shifts = [shift_map.get(str(mid)) for mid in instance.machine_ids]
+
+    job_ids = instance.job_ids
+    machine_ids = instance.machine_ids
+    job_op_start = instance.job_op_start
+    op_machine = instance.op_machine
+    op_time = instance.op_time
+    downtime = instance.downtime
+
+    for j in order:
+        job_id = job_ids[j]
         current_job_end_time = 0.0
-        for i, operation in enumerate(job.operations):
-            machine = machine_map[operation.machine_id]
+        for o in range(job_op_start[j], job_op_start[j + 1]):
+            k = op_machine[o]
+            processing_time = op_time[o]
 
             # --- Setup time ---
             setup = 0
-            if machine.last_job_id is not None and machine.last_job_id != job.job_id:
+            if last_job[k] is not None and last_job[k] != job_id:
                 setup = setup_time
 
-            earliest_start = max(machine.available_at + setup, current_job_end_time)
-
-            # --- Resolve machine unavailability conflicts ---
-            valid_start = earliest_start
-            while True:
-                conflict = False
-                proposed_end = valid_start + operation.processing_time
-                for down_start, down_end in machine.unavailable_periods:
-                    if valid_start < down_end and down_start < proposed_end:
-                        valid_start = down_end
-                        conflict = True
-                        break
-                if not conflict:
-                    break
-
-            # --- Resolve shift window constraints ---
-            mid = str(operation.machine_id)
-            if mid in shift_map:
-                s_start, s_end, cycle = shift_map[mid]
-                valid_start = _adjust_for_shift(
-                    valid_start, operation.processing_time, s_start, s_end, cycle
-                )
-                # Re-check unavailability after shift adjustment (simplified: single pass)
-                proposed_end = valid_start + operation.processing_time
-                for down_start, down_end in machine.unavailable_periods:
-                    if valid_start < down_end and down_start < proposed_end:
-                        valid_start = _adjust_for_shift(
-                            down_end, operation.processing_time, s_start, s_end, cycle
-                        )
-                        break
+            earliest_start = max(available_at[k] + setup, current_job_end_time)
+
+            # --- Resolve unavailability and shift windows until both hold ---
+            valid_start = _earliest_start_with_shift(
+                downtime[k], shifts[k], earliest_start, processing_time
+            )
 
             start_time = valid_start
-            end_time = start_time + operation.processing_time
+            end_time = start_time + processing_time
 
-            schedule.append((job.job_id, i, machine.machine_id, start_time, end_time))
+            schedule.append((job_id, o - job_op_start[j], machine_ids[k], start_time, end_time))
 
-            machine.available_at = end_time
-            machine.last_job_id = job.job_id
+            available_at[k] = end_time
+            last_job[k] = job_id
             current_job_end_time = end_time
 
     logger.debug(
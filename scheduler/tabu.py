@@ -0,0 +1,373 @@
+# scheduler/tabu.py
+"""
+Tabu search over job orderings with critical-block (N5) neighbourhoods.
+
+The search starts from the best ordering of the constructive engines in
+ALGORITHM_MAP and, every iteration, moves to the best non-tabu neighbour
+of the current ordering, even when it is worse, so it walks out of the
+local optima a first-improvement search stops in.
+
+Neighbourhood. A critical path is traced back through the decoded
+schedule from the operation that sets the makespan (and, when tardiness
+is weighted, from the last operation of the most tardy jobs): each step
+follows the job or machine predecessor whose end (plus setup) is exactly
+the operation's start. Consecutive path operations on one machine form a
+critical block. As in the N5 neighbourhood of Nowicki & Smutnicki, only
+the first two and the last two operations of a block are swapped (the
+first block only at its end, the last block only at its start); swapping
+operations inside a block cannot shorten the path. The FCFS decoder
+sequences each machine in ordering order, so reversing operations of jobs
+A and B on a machine means putting B before A in the ordering, either by
+swapping the two jobs or by moving B to just before A.
+
+Moves are evaluated incrementally with `DeltaEvaluator`
+(scheduler/local_search.py): only the jobs from the first changed
+position on are decoded, the decode stops as soon as the neighbour can no
+longer beat the best neighbour found so far, and it reads the rest from
+the current ordering once the machine state has converged.
+
+After a move swapping jobs A and B, putting A back before B is tabu for
+`tenure` iterations, unless it beats the best fitness found (aspiration).
+After `stagnation_limit` iterations without a new best the search
+restarts from the best ordering, slightly perturbed. It stops at its
+wall-clock `time_limit`, after its last restart stagnates, at the lower
+bound, or on cancellation.
+"""
+from __future__ import annotations
+
+import random
+import time
+from array import array
+
+from models import Job, Machine
+from scheduler.bounds import lower_bounds
+from scheduler.instance import (
+    MachineStateSnapshot,
+    ProblemInstance,
+    compile_instance,
+    snapshot_machine_state,
+)
+from core.logger import logger
+
+# Wall-clock seconds of an ALGORITHM_MAP "TABU" run
+TABU_TIME_LIMIT = 5.0
+# Tardy jobs whose critical paths join the makespan path's
+_TARDY_PATHS = 3
+
+
+def critical_pairs(
+    instance: ProblemInstance,
+    schedule: list,
+    setup_time: int,
+    w_makespan: float = 1.0,
+    w_tardiness: float = 0.0,
+) -> list[tuple[int, int]]:
+    """
+    N5 swap candidates of a decoded FCFS schedule.
+
+    Returns:
+        Distinct (a, b) job-index pairs, where job a's operation directly
+        precedes job b's at the start or end of a critical block.
+    """
+    job_index = instance.job_index
+    job_op_start = instance.job_op_start
+    n_ops = instance.n_ops
+    start = [0] * n_ops
+    end = [0] * n_ops
+    job_of = [0] * n_ops
+    sequences: dict = {}
+    for job_id, op_index, machine_id, op_start, op_end in schedule:
+        j = job_index[job_id]
+        o = job_op_start[j] + op_index
+        start[o], end[o], job_of[o] = op_start, op_end, j
+        sequences.setdefault(machine_id, []).append((op_start, o))
+    machine_prev = [-1] * n_ops
+    for ops in sequences.values():
+        ops.sort()
+        for (_, a), (_, b) in zip(ops, ops[1:]):
+            machine_prev[b] = a
+
+    targets = []
+    if w_makespan > 0 and schedule:
+        targets.append(max(range(n_ops), key=lambda o: (end[o], o)))
+    if w_tardiness > 0:
+        due_dates = instance.due_dates
+        tardy = sorted(
+            (
+                (end[job_op_start[j + 1] - 1] - due_dates[j], j)
+                for j in range(instance.n_jobs)
+                if job_op_start[j + 1] > job_op_start[j] and end[job_op_start[j + 1] - 1] > due_dates[j]
+            ),
+            reverse=True,
+        )
+        targets.extend(job_op_start[j + 1] - 1 for _, j in tardy[:_TARDY_PATHS])
+
+    pairs: list[tuple[int, int]] = []
+    seen: set = set()
+    for target in targets:
+        # Trace the path back while some predecessor ends exactly at the start
+        path = [target]
+        o = target
+        while True:
+            m = machine_prev[o]
+            if m >= 0 and end[m] + (setup_time if job_of[m] != job_of[o] else 0) == start[o]:
+                o = m
+            elif o > job_op_start[job_of[o]] and end[o - 1] == start[o]:
+                o -= 1
+            else:
+                break
+            path.append(o)
+        path.reverse()
+
+        blocks = []
+        for a, b in zip(path, path[1:]):
+            if machine_prev[b] == a:
+                if blocks and blocks[-1][-1] == a:
+                    blocks[-1].append(b)
+                else:
+                    blocks.append([a, b])
+        for i, block in enumerate(blocks):
+            ends = []
+            if i > 0 or len(blocks) == 1:
+                ends.append((block[0], block[1]))
+            if i < len(blocks) - 1 or len(blocks) == 1:
+                ends.append((block[-2], block[-1]))
+            for a, b in ends:
+                pair = (job_of[a], job_of[b])
+                if pair[0] != pair[1] and pair not in seen:
+                    seen.add(pair)
+                    pairs.append(pair)
+    return pairs
+
+
+def _report_progress(progress_callback, iteration, elapsed, time_limit, best_fitness):
+    if progress_callback:
+        try:
+            progress_callback(
+                iteration=iteration,
+                elapsed=elapsed,
+                time_limit=time_limit,
+                best_fitness=best_fitness,
+            )
+        except Exception:
+            pass  # Don't let callback errors break the search
+
+
+def tabu_search(
+    instance: ProblemInstance,
+    setup_time: int,
+    initial_state: MachineStateSnapshot | None = None,
+    w_makespan: float = 0.5,
+    w_tardiness: float = 0.5,
+    time_limit: float = TABU_TIME_LIMIT,
+    start=None,
+    tenure: int | None = None,
+    stagnation_limit: int = 200,
+    restarts: int = 10,
+    seed: int = 0,
+    max_iterations: int | None = None,
+    progress_callback=None,
+    progress_interval: float = 0.5,
+    cancel_event=None,
+    stats: dict | None = None,
+) -> tuple:
+    """
+    Tabu search for a job-index ordering minimising the weighted fitness.
+
+    Args:
+        instance: Compiled ProblemInstance.
+        setup_time: Time units added when a machine switches to a different job.
+        initial_state: Optional {machine_id: (available_at, last_job_id)}.
+        w_makespan: Weight of makespan in the fitness.
+        w_tardiness: Weight of total tardiness.
+        time_limit: Wall-clock seconds for the search.
+        start: Starting ordering; default is the best ALGORITHM_MAP ordering.
+        tenure: Iterations a reversed pair stays tabu (default from the
+            number of jobs).
+        stagnation_limit: Iterations without a new best before the search
+            restarts from the best ordering, perturbed by a few random
+            adjacent swaps.
+        restarts: Restarts before the search stops for stagnation.
+        seed: Seed of the restart perturbations.
+        max_iterations: Optional cap on iterations.
+        progress_callback: Optional callable(iteration, elapsed, time_limit,
+            best_fitness), called at most every `progress_interval` seconds
+            and once at the end.
+        cancel_event: Optional threading.Event; checked every iteration.
+        stats: Optional dict filled with iterations, moves_evaluated,
+            improvements, restarts, jobs_decoded, start_algorithm and
+            stop_reason.
+
+    Returns:
+        (ordering, (makespan, total_tardiness)) of the best ordering found.
+    """
+    from scheduler.engine import evaluate_instance, schedule_instance
+    from scheduler.local_search import DeltaEvaluator
+
+    if time_limit <= 0:
+        raise ValueError("time_limit must be > 0")
+    if stagnation_limit < 1:
+        raise ValueError("stagnation_limit must be >= 1")
+    started = time.monotonic()
+    deadline = started + time_limit
+
+    start_algorithm = None
+    if start is None:
+        from scheduler.seeding import heuristic_orderings
+
+        scored = []
+        for name, order in heuristic_orderings(
+            list(instance.jobs), list(instance.machines), setup_time, instance,
+        ).items():
+            makespan, tardiness = evaluate_instance(instance, order, setup_time, initial_state)
+            scored.append((makespan * w_makespan + tardiness * w_tardiness, name, order))
+        _, start_algorithm, start = min(scored, key=lambda item: item[0])
+    current = array('i', start)
+    n = len(current)
+    if tenure is None:
+        tenure = max(3, min(15, n // 4))
+
+    evaluator = DeltaEvaluator(instance, setup_time, initial_state)
+    objectives = evaluator.reset(current)
+    best_order, best_objectives = array('i', current), objectives
+    best_fitness = objectives[0] * w_makespan + objectives[1] * w_tardiness
+    bounds = lower_bounds(instance, setup_time, initial_state)
+    # Early rejection is only valid when fitness cannot drop along the decode
+    weights = (w_makespan, w_tardiness) if w_makespan >= 0 and w_tardiness >= 0 else None
+
+    rng = random.Random(seed)
+    restart = 0
+    tabu: dict = {}
+    iteration = moves = improvements = since_best = 0
+    last_report = started
+    stop_reason = "stagnation"
+    while True:
+        if best_objectives[0] <= bounds["makespan"] and best_objectives[1] <= bounds["tardiness"]:
+            stop_reason = "bound"
+            break
+        if cancel_event is not None and cancel_event.is_set():
+            stop_reason = "cancelled"
+            break
+        now = time.monotonic()
+        if now >= deadline:
+            stop_reason = "time_limit"
+            break
+        if since_best >= stagnation_limit:
+            if restart >= restarts:
+                break
+            # Restart from the best ordering, perturbed by random adjacent swaps
+            restart += 1
+            current = array('i', best_order)
+            for _ in range(max(2, n // 10)):
+                p = rng.randrange(n - 1)
+                current[p], current[p + 1] = current[p + 1], current[p]
+            objectives = evaluator.reset(current)
+            tabu.clear()
+            since_best = 0
+            continue
+        if max_iterations is not None and iteration >= max_iterations:
+            stop_reason = "max_iterations"
+            break
+        if now - last_report >= progress_interval:
+            _report_progress(progress_callback, iteration, now - started, time_limit, best_fitness)
+            last_report = now
+
+        schedule = schedule_instance(instance, current, setup_time, initial_state)
+        pairs = critical_pairs(instance, schedule, setup_time, w_makespan, w_tardiness)
+        if not pairs:
+            stop_reason = "no_moves"
+            break
+        position = [0] * n
+        for p, j in enumerate(current):
+            position[j] = p
+
+        chosen = None
+        chosen_fitness = float("inf")
+        for a, b in pairs:
+            # FCFS sequences each machine in ordering order, so a comes first
+            i, k = position[a], position[b]
+            is_tabu = tabu.get((a, b), -1) >= iteration
+            swap = array('i', current)
+            swap[i], swap[k] = b, a
+            candidates = [swap]
+            if k > i + 1:
+                insert = array('i', current)
+                insert.insert(i, insert.pop(k))
+                candidates.append(insert)
+            for neighbour in candidates:
+                # A tabu move must beat the best so far, any other the best neighbour
+                cutoff = min(chosen_fitness, best_fitness) if is_tabu else chosen_fitness
+                value = evaluator.evaluate(neighbour, i, k, weights, cutoff)
+                moves += 1
+                fitness = value[0] * w_makespan + value[1] * w_tardiness
+                if fitness < cutoff:
+                    chosen, chosen_fitness, chosen_pair = neighbour, fitness, (a, b)
+        iteration += 1
+        if chosen is None:
+            # Every move is tabu and none beats the best: forget the tabu list
+            tabu.clear()
+            since_best += 1
+            continue
+
+        current = chosen
+        objectives = evaluator.reset(current)
+        a, b = chosen_pair
+        # Putting a back before b is tabu
+        tabu[(b, a)] = iteration + tenure
+        if chosen_fitness < best_fitness:
+            best_order, best_objectives, best_fitness = array('i', current), objectives, chosen_fitness
+            improvements += 1
+            since_best = 0
+        else:
+            since_best += 1
+
+    elapsed = time.monotonic() - started
+    _report_progress(progress_callback, iteration, elapsed, time_limit, best_fitness)
+    logger.info(
+        "Tabu search: {} iterations, {} moves in {:.2f}s, best fitness {:.2f} ({})",
+        iteration, moves, elapsed, best_fitness, stop_reason,
+    )
+    if stats is not None:
+        stats.update({
+            "iterations": iteration,
+            "moves_evaluated": moves,
+            "improvements": improvements,
+            "restarts": restart,
+            "jobs_decoded": evaluator.jobs_decoded,
+            "start_algorithm": start_algorithm,
+            "stop_reason": stop_reason,
+        })
+    return best_order, best_objectives
+
+
+def schedule_tabu(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    instance: ProblemInstance | None = None,
+    w_makespan: float = 0.5,
+    w_tardiness: float = 0.5,
+    time_limit: float = TABU_TIME_LIMIT,
+    progress_callback=None,
+    cancel_event=None,
+    stats: dict | None = None,
+) -> list:
+    """
+    Schedules jobs with a tabu search over job orderings (see `tabu_search`).
+
+    The machines' current `available_at` / `last_job_id` are used as the
+    starting state; the Machine objects themselves are not modified.
+
+    Returns:
+        List of tuples: (job_id, op_index, machine_id, start_time, end_time)
+    """
+    from scheduler.engine import schedule_instance
+
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    initial_state = snapshot_machine_state(machines)
+    order, _ = tabu_search(
+        instance, setup_time, initial_state, w_makespan, w_tardiness, time_limit,
+        progress_callback=progress_callback, cancel_event=cancel_event, stats=stats,
+    )
+    return schedule_instance(instance, order, setup_time, initial_state)
@@ -14,7 +14,6 @@ The main task `run_schedule_task` wraps the full optimization pipeline:
   6. Store results in the Celery result backend (Redis)
 """
 import os
-import copy
 
 from celery_app import celery_app
 from data_loader import load_data_from_excel
@@ -66,12 +65,10 @@ def run_schedule_task(
 
         # --- Step 2: Run Algorithm ---
         _update(f"Running {algorithm} algorithm...")
-        machines_copy = copy.deepcopy(machines)
-
         if algorithm == "GA":
             schedule_result = run_genetic_algorithm(
                 jobs_data,
-                machines_copy,
+                machines,
                 setup_time,
                 pop_size,
                 generations,
@@ -81,7 +78,7 @@ def run_schedule_task(
                 w_tardiness,
             )
         elif algorithm in ALGORITHM_MAP:
-            schedule_result = ALGORITHM_MAP[algorithm](jobs_data, machines_copy, setup_time)
+            schedule_result = ALGORITHM_MAP[algorithm](jobs_data, machines, setup_time)
         else:
             raise ValueError(f"Unknown algorithm: {algorithm!r}")
 
@@ -0,0 +1,247 @@
+# scheduler/tuner.py
+"""
+GA hyperparameter tuning by successive halving.
+
+`tune` races candidate (pop_size, mutation_rate, tournament_size)
+configurations on one or more problems. Every rung gives the surviving
+candidates an equal share of that rung's CPU budget as a GA time limit,
+scores them by the weighted fitness they reach, and keeps the best
+1/eta of them. Bad configurations are dropped after a short trial, so
+most of the budget goes to the promising ones. All candidates of a rung
+run with the same random seed, each in its own random.Random handed to
+the GA, so they are compared on equal terms and the process-wide RNG is
+never touched.
+
+The winner's measured generations per CPU second sizes `generations`
+for a run of the same budget. `recommend` caches recommendations in a
+`TuningCache` keyed by an instance-size bucket (see `size_bucket`), so
+similar problems reuse one race instead of paying for it on every upload.
+
+CPU time is measured with time.thread_time(), so concurrent runs in
+other threads are not charged to the race. The GA's time limit is wall
+clock, so on a busy machine a trial uses less CPU than its share, never
+more.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+
+from models import Job, Machine
+from scheduler.instance import ProblemInstance, compile_instance
+from scheduler.metrics import schedule_objectives
+from core.logger import logger
+
+POP_SIZES = (20, 40, 80, 160)
+MUTATION_RATES = (0.05, 0.15, 0.3)
+TOURNAMENT_SIZES = (2, 3, 5)
+# The upload form's defaults always take part, so tuning never ranks below them
+DEFAULT_CONFIG = {"pop_size": 30, "mutation_rate": 0.1, "tournament_size": 3}
+# Stops a trial by its time limit, not its generation count
+_MAX_GENERATIONS = 1_000_000
+
+
+def size_bucket(instance: ProblemInstance) -> str:
+    """
+    Coarse size class of an instance: jobs and machines rounded up to a
+    power of two, and the mean number of operations per job.
+    """
+    n_machines = len(instance.machine_ids)
+    ops_per_job = len(instance.op_machine) / max(1, instance.n_jobs)
+    return (
+        f"j{1 << max(0, instance.n_jobs - 1).bit_length()}"
+        f"-m{1 << max(0, n_machines - 1).bit_length()}"
+        f"-o{round(ops_per_job)}"
+    )
+
+
+def candidate_configs(n: int = 9, seed: int = 0) -> list[dict]:
+    """`n` distinct configurations from the tuning grid, the form defaults first."""
+    grid = [
+        {"pop_size": p, "mutation_rate": m, "tournament_size": t}
+        for p in POP_SIZES for m in MUTATION_RATES for t in TOURNAMENT_SIZES
+    ]
+    return [dict(DEFAULT_CONFIG)] + random.Random(seed).sample(grid, min(len(grid), max(0, n - 1)))
+
+
+def _trial(problem, config, seconds, w_makespan, w_tardiness, seed, ga_options):
+    """
+    One GA run of `config` limited to `seconds`.
+
+    Returns:
+        (weighted fitness, generations run, CPU seconds used)
+    """
+    from genetic_algorithm import run_genetic_algorithm
+
+    jobs, machines, setup_time, instance = problem
+    stats: dict = {}
+    started = time.thread_time()
+    schedule = run_genetic_algorithm(
+        jobs, machines, setup_time, config["pop_size"], _MAX_GENERATIONS,
+        config["mutation_rate"], config["tournament_size"], w_makespan, w_tardiness,
+        instance=instance, stats=stats, time_limit=max(seconds, 1e-3), rng=random.Random(seed), **ga_options,
+    )
+    cpu = time.thread_time() - started
+    makespan, tardiness = schedule_objectives(schedule, {job.job_id: job.due_date for job in jobs})
+    return (makespan * w_makespan) + (tardiness * w_tardiness), stats["generations_run"], cpu
+
+
+def tune(
+    problems: list,
+    w_makespan: float,
+    w_tardiness: float,
+    budget: float,
+    candidates: list[dict] | None = None,
+    eta: int = 3,
+    seed: int = 0,
+    ga_options: dict | None = None,
+) -> dict:
+    """
+    Successive-halving race of GA configurations.
+
+    Args:
+        problems: (jobs, machines, setup_time) tuples, e.g. the uploaded
+            instance or past instances of a similar size. A configuration's
+            score is its fitness relative to the rung's best on each
+            problem, averaged over the problems.
+        budget: CPU seconds for the race, split evenly across its rungs;
+            also the length of the run the recommendation is sized for.
+        candidates: Configurations to race (default: `candidate_configs()`).
+        eta: Each rung keeps the best 1/eta of its candidates.
+        ga_options: Extra run_genetic_algorithm arguments used by every trial,
+            so candidates are raced with the settings the real run will use.
+
+    Returns:
+        Dict with the winner's pop_size, mutation_rate, tournament_size,
+        the generations it completes in `budget` CPU seconds, and
+        race statistics (candidates, rungs, cpu_seconds).
+    """
+    if budget <= 0:
+        raise ValueError("budget must be > 0")
+    if eta < 2:
+        raise ValueError("eta must be >= 2")
+    if not problems:
+        raise ValueError("tune needs at least one problem")
+    survivors = [dict(c) for c in (candidates or candidate_configs())]
+    if not survivors:
+        raise ValueError("tune needs at least one candidate")
+
+    compiled = [
+        (jobs, machines, setup_time, compile_instance(jobs, machines))
+        for jobs, machines, setup_time in problems
+    ]
+    ga_options = {"stop_at_bound": True, **(ga_options or {})}
+    # Halvings until one candidate is left; a single candidate still gets one rung to measure its speed
+    rungs, remaining = 0, len(survivors)
+    while remaining > 1:
+        remaining = max(1, remaining // eta)
+        rungs += 1
+    rungs = max(1, rungs)
+    rung_budget = budget / rungs
+    n_candidates = len(survivors)
+    cpu_total = 0.0
+    for rung in range(rungs):
+        seconds = rung_budget / (len(survivors) * len(compiled))
+        fitness = [[0.0] * len(compiled) for _ in survivors]
+        rates = [0.0] * len(survivors)
+        for i, config in enumerate(survivors):
+            generations = cpu_used = 0.0
+            for k, problem in enumerate(compiled):
+                fitness[i][k], gens, cpu = _trial(
+                    problem, config, seconds, w_makespan, w_tardiness, seed + rung, ga_options,
+                )
+                generations += gens
+                cpu_used += cpu
+            cpu_total += cpu_used
+            rates[i] = generations / max(cpu_used, 1e-9) / len(compiled)
+        best = [min(fitness[i][k] for i in range(len(survivors))) for k in range(len(compiled))]
+        # Shifted ratio, defined even when the best fitness is 0 (no tardiness, zero weight)
+        scores = [
+            sum((f + 1) / (b + 1) for f, b in zip(fitness[i], best)) / len(compiled)
+            for i in range(len(survivors))
+        ]
+        ranked = sorted(range(len(survivors)), key=scores.__getitem__)
+        keep = max(1, len(survivors) // eta)
+        logger.debug(
+            "Tuning rung {}/{}: {} candidates at {:.2f}s each, best {}",
+            rung + 1, rungs, len(survivors), seconds, survivors[ranked[0]],
+        )
+        survivors = [survivors[i] for i in ranked[:keep]]
+        rates = [rates[i] for i in ranked[:keep]]
+
+    winner = survivors[0]
+    result = {
+        **winner,
+        "generations": max(1, round(rates[0] * budget)),
+        "candidates": n_candidates,
+        "rungs": rungs,
+        "cpu_seconds": round(cpu_total, 3),
+    }
+    logger.info("GA tuning: {} candidates in {:.1f} CPU s -> {}", n_candidates, cpu_total, result)
+    return result
+
+
+class TuningCache:
+    """Tuning recommendations keyed by size bucket, persisted as one JSON file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, recommendation: dict) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = recommendation
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def recommend(
+    jobs: list[Job],
+    machines: list[Machine],
+    setup_time: int,
+    w_makespan: float,
+    w_tardiness: float,
+    budget: float,
+    cache: TuningCache | None = None,
+    instance: ProblemInstance | None = None,
+    **tune_kwargs,
+) -> tuple[dict, bool]:
+    """
+    GA configuration for this problem: the cached recommendation of its
+    size bucket (same weights and budget), else a new `tune` race on it.
+
+    Returns:
+        (recommendation, whether it came from the cache)
+    """
+    if instance is None:
+        instance = compile_instance(jobs, machines)
+    key = f"{size_bucket(instance)}/w{w_makespan:.2f}-{w_tardiness:.2f}/b{budget:g}"
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("GA tuning: cached recommendation for {}", key)
+            return cached, True
+    recommendation = tune([(jobs, machines, setup_time)], w_makespan, w_tardiness, budget, **tune_kwargs)
+    if cache is not None:
+        cache.put(key, recommendation)
+    return recommendation, False
@@ -8,6 +8,7 @@ an in-memory SQLite database isolated from production data.
 import sys
 import os
 import copy
+import random
 import pytest
 
 # Ensure project root is on sys.path so imports like `from models import Job` work
@@ -73,6 +74,41 @@ def simple_machines():
     ]
 
 
+def _random_problem(seed, n_jobs=25, n_machines=4, windows=1, route=None, max_time=9, max_due=120):
+    """
+    Random (jobs, machines) problem, the same for the same arguments.
+
+    Each machine gets `windows` maintenance windows. A job has 1-4
+    operations on random machines, or with `route`, one operation on each
+    of `route` distinct machines.
+    """
+    rng = random.Random(seed)
+    machines = []
+    for k in range(n_machines):
+        periods = []
+        for _ in range(windows):
+            start = rng.randint(0, 80)
+            periods.append((start, start + rng.randint(1, 15)))
+        machines.append(Machine(k, periods))
+    jobs = []
+    for j in range(n_jobs):
+        if route is None:
+            stations = [rng.randrange(n_machines) for _ in range(rng.randint(1, 4))]
+        else:
+            stations = rng.sample(range(n_machines), route)
+        jobs.append(Job(
+            j, [Operation(k, rng.randint(1, max_time)) for k in stations],
+            due_date=rng.randint(10, max_due), priority=rng.randint(1, 3),
+        ))
+    return jobs, machines
+
+
+@pytest.fixture
+def random_instance():
+    """Factory for reproducible random problems: random_instance(seed, n_jobs=25, n_machines=4, ...)."""
+    return _random_problem
+
+
 @pytest.fixture
 def sample_schedule():
     """
@@ -0,0 +1,76 @@
+# tests/test_annealing.py
+"""
+Tests for scheduler/annealing.py — parallel multi-start simulated annealing.
+"""
+import threading
+import time
+import pytest
+from scheduler.annealing import run_simulated_annealing
+from scheduler.engine import evaluate_instance
+from scheduler.instance import compile_instance
+from scheduler.metrics import schedule_objectives
+from scheduler.seeding import heuristic_orderings
+
+
+def _fitness(schedule, jobs, w_makespan=0.5, w_tardiness=0.5):
+    makespan, tardiness = schedule_objectives(schedule, {job.job_id: job.due_date for job in jobs})
+    return makespan * w_makespan + tardiness * w_tardiness
+
+
+class TestSingleChain:
+    def test_no_worse_than_the_best_rule(self, random_instance):
+        jobs, machines = random_instance(1, n_jobs=20, n_machines=5, windows=0, route=3, max_due=80)
+        instance = compile_instance(jobs, machines)
+        best_rule = min(
+            0.7 * m + 0.3 * t
+            for m, t in (evaluate_instance(instance, order, 2) for order in heuristic_orderings(jobs, machines, 2, instance).values())
+        )
+        stats = {}
+        schedule = run_simulated_annealing(jobs, machines, 2, 0.7, 0.3, chains=1, time_limit=30, max_moves=3000, seed=1, stats=stats)
+        assert len(schedule) == sum(len(job.operations) for job in jobs)
+        assert _fitness(schedule, jobs, 0.7, 0.3) <= best_rule
+        assert stats["chains"][0]["fitness"] == pytest.approx(_fitness(schedule, jobs, 0.7, 0.3))
+        assert stats["chains"][0]["moves"] <= 3000
+
+    def test_reproducible_by_seed(self, random_instance):
+        jobs, machines = random_instance(2, n_jobs=20, n_machines=5, windows=0, route=3, max_due=80)
+        first = run_simulated_annealing(jobs, machines, 2, chains=1, time_limit=30, max_moves=1500, seed=7)
+        assert run_simulated_annealing(jobs, machines, 2, chains=1, time_limit=30, max_moves=1500, seed=7) == first
+
+    def test_time_limit_progress_and_cancel(self, random_instance):
+        jobs, machines = random_instance(3, n_jobs=40, n_machines=5, windows=0, route=3, max_due=80)
+        reports = []
+        stats = {}
+        started = time.monotonic()
+        run_simulated_annealing(
+            jobs, machines, 2, chains=1, time_limit=0.3, seed=1, stats=stats,
+            progress_callback=lambda **kw: reports.append(kw), progress_interval=0.05,
+        )
+        assert time.monotonic() - started < 3.0
+        assert stats["stop_reason"] in ("time_limit", "bound") and len(reports) >= 2
+
+        cancel = threading.Event()
+        cancel.set()
+        stats = {}
+        run_simulated_annealing(jobs, machines, 2, chains=1, time_limit=30, cancel_event=cancel, stats=stats)
+        assert stats["stop_reason"] == "cancelled"
+
+    def test_rejects_bad_arguments(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_simulated_annealing(sample_jobs, fresh_machines, 2, chains=0)
+        with pytest.raises(ValueError):
+            run_simulated_annealing(sample_jobs, fresh_machines, 2, time_limit=0)
+
+
+class TestParallelChains:
+    def test_chains_share_the_best(self, random_instance):
+        jobs, machines = random_instance(4, n_jobs=25, n_machines=5, windows=0, route=3, max_due=80)
+        stats = {}
+        schedule = run_simulated_annealing(
+            jobs, machines, 2, chains=2, time_limit=30, max_moves=2000, restart_after=100, seed=3, stats=stats,
+        )
+        assert len(stats["chains"]) == 2
+        # The returned schedule is the best chain's
+        assert _fitness(schedule, jobs) == pytest.approx(min(chain["fitness"] for chain in stats["chains"]))
+        # A chain behind the shared best restarted from it
+        assert sum(chain["restarts"] for chain in stats["chains"]) >= 1
@@ -10,6 +10,34 @@ import os
 import pytest
 
 
+@pytest.fixture
+def run_folders(monkeypatch, tmp_path):
+    """Uploads, checkpoints, Excel reports and Gantt charts of the test's runs go to tmp_path, not the project folders."""
+    import threading
+    import visualization
+    import api.routers.schedule as schedule_router
+
+    uploads, output, charts = tmp_path / "uploads", tmp_path / "output", tmp_path / "static"
+    for folder in (uploads, output, charts):
+        folder.mkdir()
+    monkeypatch.setattr(schedule_router, "UPLOAD_FOLDER", str(uploads))
+    monkeypatch.setattr(schedule_router, "OUTPUT_FOLDER", str(output))
+    monkeypatch.setattr(schedule_router, "CHECKPOINT_FOLDER", str(tmp_path / "checkpoints"))
+    create_gantt_chart = visualization.create_gantt_chart
+    monkeypatch.setattr(
+        visualization, "create_gantt_chart",
+        lambda schedule, title, save_path=None: create_gantt_chart(
+            schedule, title, save_path and str(charts / os.path.basename(save_path)),
+        ),
+    )
+    running = set(threading.enumerate())
+    yield tmp_path
+    # Runs started in the background still write to these folders until they finish
+    for thread in set(threading.enumerate()) - running:
+        if thread.name.endswith("_background)"):
+            thread.join(timeout=60)
+
+
 class TestHealthEndpoint:
     def test_health_returns_ok(self, client):
         response = client.get("/health")
@@ -47,7 +75,23 @@ class TestUploadEndpoint:
         not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
         reason="data.xlsx not found",
     )
-    def test_upload_valid_file_returns_202(self, client, auth_headers):
+    def test_accepts_dispatch_rule(self, client, auth_headers, run_folders):
+        """Engines registered in ALGORITHM_MAP pass the upload validator."""
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        with open(xlsx_path, "rb") as f:
+            response = client.post(
+                "/api/schedule/upload",
+                files={"file": ("data.xlsx", f, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+                data={"algorithm": "atc", "setup_time": "2"},
+                headers=auth_headers,
+            )
+        assert response.status_code == 202
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_upload_valid_file_returns_202(self, client, auth_headers, run_folders):
         """POST with a real Excel file should return 202 with a task_id."""
         xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
         with open(xlsx_path, "rb") as f:
@@ -100,3 +144,448 @@ class TestHistoryEndpoint:
         data = response.json()
         assert data["items"] == []
 
+
+
+class TestCancelEndpoint:
+    def test_unknown_task_returns_404(self, client, auth_headers):
+        response = client.delete("/api/schedule/nonexistent-uuid", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_finished_run_returns_409(self, client, auth_headers, test_db):
+        from core.models_db import ScheduleRun
+
+        test_db.add(ScheduleRun(task_id="finished-run", status="complete", algorithm="GA"))
+        test_db.commit()
+        response = client.delete("/api/schedule/finished-run", headers=auth_headers)
+        assert response.status_code == 409
+
+    def test_sets_cancel_token(self, client, auth_headers, test_db):
+        from core.models_db import ScheduleRun
+        from api.routers import schedule
+
+        test_db.add(ScheduleRun(task_id="running-run", status="processing", algorithm="GA"))
+        test_db.commit()
+        event = schedule._register_cancel_event("running-run")
+        try:
+            response = client.delete("/api/schedule/running-run", headers=auth_headers)
+            assert response.status_code == 202
+            assert response.json()["state"] == "processing"
+            assert event.is_set()
+        finally:
+            schedule._release_cancel_event("running-run")
+
+    def test_cancelled_before_start(self, client, test_db):
+        import threading
+        from core.models_db import ScheduleRun
+        from api.routers.schedule import _run_schedule_background
+
+        test_db.add(ScheduleRun(task_id="queued-run", status="pending", algorithm="GA"))
+        test_db.commit()
+        cancel = threading.Event()
+        cancel.set()
+        _run_schedule_background(
+            "queued-run", "missing.xlsx", "missing.xlsx", 2, "GA", 10, 50, 0.1, 3, 0.6, 0.4,
+            cancel_event=cancel,
+        )
+        test_db.expire_all()
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "queued-run").one()
+        assert run.status == "cancelled"
+        assert run.stop_reason == "cancelled"
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_stop_reason_persisted(self, client, test_db, run_folders):
+        import shutil
+        from core.models_db import ScheduleRun
+        from api.routers.schedule import UPLOAD_FOLDER, _run_schedule_background
+
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        filepath = os.path.join(UPLOAD_FOLDER, "stagnating-run.xlsx")
+        shutil.copyfile(xlsx_path, filepath)
+        test_db.add(ScheduleRun(task_id="stagnating-run", status="pending", algorithm="GA"))
+        test_db.commit()
+        _run_schedule_background(
+            "stagnating-run", filepath, "data.xlsx", 2, "GA", 10, 2000, 0.1, 3, 0.6, 0.4,
+            stagnation_limit=3,
+        )
+        test_db.expire_all()
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "stagnating-run").one()
+        assert run.status == "complete"
+        assert run.stop_reason in ("stagnation", "lower_bound")
+        assert run.generations_run < 2000
+
+
+class TestParetoEndpoints:
+    def test_pareto_requires_ga(self, client, auth_headers):
+        response = client.post(
+            "/api/schedule/upload",
+            files={"file": ("test.xlsx", io.BytesIO(b"fake excel data"), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            data={"algorithm": "SPT", "pareto": "true"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    def test_run_without_front_returns_404(self, client, auth_headers, test_db):
+        from core.models_db import ScheduleRun
+
+        test_db.add(ScheduleRun(task_id="weighted-run", status="complete", algorithm="GA", result_json="{}"))
+        test_db.commit()
+        assert client.get("/api/schedule/weighted-run/pareto", headers=auth_headers).status_code == 404
+        assert client.post("/api/schedule/weighted-run/pareto/0", headers=auth_headers).status_code == 404
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_front_is_stored_and_selectable(self, client, auth_headers, test_db, run_folders):
+        import shutil
+        from core.models_db import ScheduleRun, OperationRecord
+        from api.routers.schedule import UPLOAD_FOLDER, _run_schedule_background
+
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        filepath = os.path.join(UPLOAD_FOLDER, "pareto-run.xlsx")
+        shutil.copyfile(xlsx_path, filepath)
+        test_db.add(ScheduleRun(task_id="pareto-run", status="pending", algorithm="GA"))
+        test_db.commit()
+        _run_schedule_background(
+            "pareto-run", filepath, "data.xlsx", 2, "GA", 20, 30, 0.2, 2, 0.6, 0.4, pareto=True,
+        )
+
+        response = client.get("/api/schedule/pareto-run/pareto", headers=auth_headers)
+        assert response.status_code == 200
+        points = response.json()["points"]
+        assert [p["index"] for p in points] == list(range(len(points)))
+        assert sum(p["selected"] for p in points) == 1
+        makespans = [p["makespan"] for p in points]
+        assert makespans == sorted(makespans)
+
+        last = len(points) - 1
+        response = client.post(f"/api/schedule/pareto-run/pareto/{last}", headers=auth_headers)
+        assert response.status_code == 200
+        result = response.json()["result"]
+        assert result["pareto_index"] == last
+        assert result["makespan"] == points[last]["makespan"]
+        assert result["total_tardiness"] == points[last]["total_tardiness"]
+
+        test_db.expire_all()
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "pareto-run").one()
+        assert run.makespan == points[last]["makespan"]
+        ends = [op.end_time for op in test_db.query(OperationRecord).filter(OperationRecord.run_id == run.id)]
+        assert max(ends) == points[last]["makespan"]
+        assert client.post(f"/api/schedule/pareto-run/pareto/{last + 1}", headers=auth_headers).status_code == 404
+
+
+class TestExtendAndResume:
+    def test_extend_unknown_or_unfinished_run(self, client, auth_headers, test_db):
+        from core.models_db import ScheduleRun
+
+        assert client.post("/api/schedule/no-such-run/extend", headers=auth_headers).status_code == 404
+        test_db.add(ScheduleRun(task_id="running", status="processing", algorithm="GA"))
+        test_db.add(ScheduleRun(task_id="heuristic", status="complete", algorithm="SPT", result_json="{}"))
+        test_db.commit()
+        assert client.post("/api/schedule/running/extend", headers=auth_headers).status_code == 409
+        assert client.post("/api/schedule/heuristic/extend", headers=auth_headers).status_code == 409
+
+    def test_unresumable_runs_fail_on_startup(self, test_db):
+        from core.models_db import ScheduleRun
+        from api.routers.schedule import resume_interrupted_runs
+
+        test_db.add(ScheduleRun(task_id="stuck", status="processing", algorithm="GA"))
+        test_db.add(ScheduleRun(task_id="done", status="complete", algorithm="GA"))
+        test_db.commit()
+        assert resume_interrupted_runs() == 0
+        test_db.expire_all()
+        stuck = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "stuck").one()
+        assert stuck.status == "error" and "restart" in stuck.error_message
+        assert test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "done").one().status == "complete"
+
+    def test_resumed_runs_are_claimed_once(self, monkeypatch, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        started = []
+        monkeypatch.setattr(
+            schedule_router, "_start_schedule_thread",
+            lambda task_id, original_filename, params, resume=False: started.append(task_id),
+        )
+        for task_id, status in (("queued", "pending"), ("interrupted", "processing")):
+            (run_folders / "uploads" / f"{task_id}.xlsx").write_bytes(b"x")
+            test_db.add(ScheduleRun(task_id=task_id, status=status, algorithm="GA", params_json=json.dumps({})))
+        test_db.commit()
+
+        assert schedule_router.resume_interrupted_runs() == 2
+        assert sorted(started) == ["interrupted", "queued"]
+        test_db.expire_all()
+        assert {run.status for run in test_db.query(ScheduleRun)} == {"resuming"}
+        # Claimed runs are not picked up a second time
+        assert schedule_router.resume_interrupted_runs() == 0
+        assert len(started) == 2
+
+    def test_concurrent_extensions_are_claimed_once(self, monkeypatch, client, auth_headers, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        started = []
+        monkeypatch.setattr(
+            schedule_router, "_start_schedule_thread",
+            lambda task_id, original_filename, params, resume=False: started.append(task_id),
+        )
+        (run_folders / "uploads" / "finished.xlsx").write_bytes(b"x")
+        (run_folders / "checkpoints").mkdir()
+        (run_folders / "checkpoints" / "finished.ckpt").write_bytes(b"x")
+        test_db.add(ScheduleRun(
+            task_id="finished", status="complete", algorithm="GA", params_json=json.dumps({}), generations_run=5,
+        ))
+        test_db.commit()
+        # Both requests pass the status check before either claims the run
+        stale = schedule_router._get_run("finished")
+        monkeypatch.setattr(schedule_router, "_get_run", lambda task_id: stale)
+
+        assert client.post("/api/schedule/finished/extend", headers=auth_headers).status_code == 202
+        assert client.post("/api/schedule/finished/extend", headers=auth_headers).status_code == 409
+        assert started == ["finished"]
+        test_db.expire_all()
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "finished").one()
+        assert run.status == "processing" and json.loads(run.params_json)["generations"] == 55
+
+    def test_expired_checkpoints_are_pruned(self, monkeypatch, tmp_path, test_db):
+        import time
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        monkeypatch.setattr(schedule_router, "CHECKPOINT_FOLDER", str(tmp_path))
+        monkeypatch.setattr(schedule_router, "GA_CHECKPOINT_RETENTION_HOURS", 1.0)
+        old = time.time() - 7200
+        for task_id in ("expired", "running", "recent"):
+            (tmp_path / f"{task_id}.ckpt").write_bytes(b"x")
+        for task_id in ("expired", "running"):
+            os.utime(tmp_path / f"{task_id}.ckpt", (old, old))
+        test_db.add(ScheduleRun(task_id="expired", status="complete", algorithm="GA"))
+        test_db.add(ScheduleRun(task_id="running", status="processing", algorithm="GA"))
+        test_db.commit()
+
+        assert schedule_router.prune_checkpoints() == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["recent.ckpt", "running.ckpt"]
+
+    def test_cancelled_run_discards_checkpoint(self, monkeypatch, tmp_path, test_db):
+        import threading
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        monkeypatch.setattr(schedule_router, "CHECKPOINT_FOLDER", str(tmp_path))
+        (tmp_path / "cancelled-run.ckpt").write_bytes(b"x")
+        test_db.add(ScheduleRun(task_id="cancelled-run", status="pending", algorithm="GA"))
+        test_db.commit()
+        cancel = threading.Event()
+        cancel.set()
+        schedule_router._run_schedule_background(
+            "cancelled-run", str(tmp_path / "missing.xlsx"), "data.xlsx", 2, "GA", 10, 5, 0.1, 3, 0.6, 0.4,
+            cancel_event=cancel,
+        )
+        assert not (tmp_path / "cancelled-run.ckpt").exists()
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_extend_continues_from_checkpoint(self, monkeypatch, client, auth_headers, test_db, run_folders):
+        import json
+        import shutil
+        from core.models_db import ScheduleRun, OperationRecord
+        import api.routers.schedule as schedule_router
+        from api.routers.schedule import UPLOAD_FOLDER, _checkpoint_path, _run_schedule_background
+
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        shutil.copyfile(xlsx_path, os.path.join(UPLOAD_FOLDER, "extend-run.xlsx"))
+        params = {
+            "setup_time": 2, "algorithm": "GA", "pop_size": 10, "generations": 6, "mutation_rate": 0.2,
+            "tournament_size": 2, "w_makespan": 0.6, "w_tardiness": 0.4,
+            "time_limit": None, "stagnation_limit": None, "pareto": False,
+        }
+        test_db.add(ScheduleRun(task_id="extend-run", status="pending", algorithm="GA", params_json=json.dumps(params)))
+        test_db.commit()
+        _run_schedule_background(
+            "extend-run", os.path.join(UPLOAD_FOLDER, "extend-run.xlsx"), "data.xlsx", **params,
+        )
+        assert os.path.exists(_checkpoint_path("extend-run"))
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "extend-run").one()
+        first_fitness = 0.6 * run.makespan + 0.4 * run.total_tardiness
+        first_generations = run.generations_run
+        operations = test_db.query(OperationRecord).filter(OperationRecord.run_id == run.id).count()
+
+        # The extension runs inside the request: polling while a background
+        # thread writes would share the test engine's single connection
+        def run_inline(task_id, original_filename, params, resume=False):
+            _run_schedule_background(
+                task_id, os.path.join(UPLOAD_FOLDER, f"{task_id}.xlsx"), original_filename, **params, resume=resume,
+            )
+
+        monkeypatch.setattr(schedule_router, "_start_schedule_thread", run_inline)
+        response = client.post("/api/schedule/extend-run/extend", data={"generations": 4}, headers=auth_headers)
+        assert response.status_code == 202
+
+        test_db.expire_all()
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "extend-run").one()
+        assert run.generations_run == first_generations + 4
+        # The best schedule is carried over, so an extension never makes it worse
+        assert 0.6 * run.makespan + 0.4 * run.total_tardiness <= first_fitness
+        assert test_db.query(OperationRecord).filter(OperationRecord.run_id == run.id).count() == operations
+
+
+class TestIntermediateResults:
+    def test_status_returns_best_so_far_while_processing(self, client, auth_headers, test_db):
+        import json
+        from core.models_db import ScheduleRun
+
+        intermediate = {
+            "makespan": 40, "total_tardiness": 7, "avg_flow_time": 20.0, "on_time_percent": 80.0,
+            "algorithm": "GA", "generation": 12,
+            "schedule": [{"job_id": "1", "op_index": 0, "machine_id": "0", "start_time": 0, "end_time": 40}],
+        }
+        run = ScheduleRun(
+            task_id="anytime-run", status="processing", algorithm="GA",
+            intermediate_json=json.dumps(intermediate), intermediate_version=3,
+        )
+        test_db.add(run)
+        test_db.commit()
+
+        data = client.get("/api/schedule/status/anytime-run", headers=auth_headers).json()
+        assert data["state"] == "processing"
+        assert data["intermediate_version"] == 3 and data["intermediate_generation"] == 12
+        assert data["result"]["makespan"] == 40 and len(data["result"]["schedule"]) == 1
+
+        # A finished run reports its final result only
+        run.status, run.result_json = "complete", json.dumps({**intermediate, "makespan": 38})
+        test_db.commit()
+        data = client.get("/api/schedule/status/anytime-run", headers=auth_headers).json()
+        assert data["result"]["makespan"] == 38 and data["intermediate_version"] is None
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_background_run_publishes_and_clears(self, monkeypatch, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        saved = []
+        real_save = schedule_router._save_intermediate
+        monkeypatch.setattr(schedule_router, "GA_INTERMEDIATE_INTERVAL", 1e-9)
+        monkeypatch.setattr(
+            schedule_router, "_save_intermediate",
+            lambda task_id, result: saved.append(result) or real_save(task_id, result),
+        )
+        test_db.add(ScheduleRun(task_id="anytime-bg", status="pending", algorithm="GA"))
+        test_db.commit()
+        schedule_router._run_schedule_background("anytime-bg", xlsx_path, "data.xlsx", 2, "GA", 10, 8, 0.2, 2, 0.6, 0.4)
+
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "anytime-bg").one()
+        assert run.status == "complete"
+        assert run.intermediate_version == len(saved) >= 1
+        assert run.intermediate_json is None
+        # The last intermediate result is the schedule the run ends with
+        assert saved[-1]["schedule"] == json.loads(run.result_json)["schedule"]
+
+
+class TestAutoTune:
+    def test_auto_tune_requires_ga(self, client, auth_headers):
+        response = client.post(
+            "/api/schedule/upload",
+            files={"file": ("test.xlsx", io.BytesIO(b"fake excel data"), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            data={"algorithm": "EDD", "auto_tune": "true"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_tuned_parameters_are_stored(self, monkeypatch, tmp_path, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        from scheduler.tuner import TuningCache
+        import api.routers.schedule as schedule_router
+
+        monkeypatch.setattr(schedule_router, "GA_AUTO_TUNE_BUDGET", 1.0)
+        monkeypatch.setattr(schedule_router, "_tuning_cache", TuningCache(str(tmp_path / "tuning.json")))
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        params = {
+            "setup_time": 2, "algorithm": "GA", "pop_size": 30, "generations": 50, "mutation_rate": 0.1,
+            "tournament_size": 3, "w_makespan": 0.6, "w_tardiness": 0.4,
+            "time_limit": None, "stagnation_limit": None, "pareto": False, "auto_tune": True,
+        }
+        test_db.add(ScheduleRun(task_id="auto-run", status="pending", algorithm="GA", params_json=json.dumps(params)))
+        test_db.commit()
+        schedule_router._run_schedule_background("auto-run", xlsx_path, "data.xlsx", **params)
+
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "auto-run").one()
+        assert run.status == "complete"
+        stored = json.loads(run.params_json)
+        recommendation = next(iter(json.loads((tmp_path / "tuning.json").read_text()).values()))
+        assert stored["auto_tune"] is False and stored["time_limit"] == 1.0
+        assert stored["pop_size"] == recommendation["pop_size"]
+        assert stored["generations"] == min(2000, max(5, recommendation["generations"]))
+
+
+class TestTabuSearch:
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_background_run_reports_progress(self, monkeypatch, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+        import api.routers.ws as ws
+
+        messages = []
+        monkeypatch.setattr(ws, "send_task_progress_sync", lambda task_id, message: messages.append(message))
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        test_db.add(ScheduleRun(task_id="tabu-run", status="pending", algorithm="TABU"))
+        test_db.commit()
+        schedule_router._run_schedule_background(
+            "tabu-run", xlsx_path, "data.xlsx", 2, "TABU", 30, 50, 0.1, 3, 0.6, 0.4, time_limit=0.5,
+        )
+
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "tabu-run").one()
+        assert run.status == "complete"
+        assert json.loads(run.result_json)["schedule"]
+        assert any(m.get("message", "").startswith("TABU: Iteration") for m in messages)
+
+
+class TestSimulatedAnnealing:
+    def test_upload_accepts_sa(self):
+        from api.routers.schedule import _allowed_algorithms
+
+        assert "SA" in _allowed_algorithms()
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(os.path.dirname(__file__), "..", "data.xlsx")),
+        reason="data.xlsx not found",
+    )
+    def test_compare_includes_sa(self, monkeypatch, test_db, run_folders):
+        import json
+        from core.models_db import ScheduleRun
+        import api.routers.schedule as schedule_router
+
+        monkeypatch.setattr(schedule_router, "SA_CHAINS", 2)
+        xlsx_path = os.path.join(os.path.dirname(__file__), "..", "data.xlsx")
+        test_db.add(ScheduleRun(task_id="sa-compare", status="pending", algorithm="COMPARE"))
+        test_db.commit()
+        schedule_router._run_compare_background(
+            "sa-compare", xlsx_path, "data.xlsx", 2, ["FCFS", "SA"], 30, 50, 0.1, 3, 0.6, 0.4, time_limit=0.5,
+        )
+
+        run = test_db.query(ScheduleRun).filter(ScheduleRun.task_id == "sa-compare").one()
+        assert run.status == "complete"
+        results = {r["algorithm"]: r for r in json.loads(run.result_json)["results"]}
+        assert set(results) == {"FCFS", "SA"}
+        weighted = {a: 0.6 * r["makespan"] + 0.4 * r["total_tardiness"] for a, r in results.items()}
+        assert weighted["SA"] <= weighted["FCFS"]
@@ -0,0 +1,84 @@
+# tests/test_batch_decoder.py
+"""
+Tests for scheduler/batch_decoder.py — population-batched NumPy decoder.
+"""
+import random
+import pytest
+from models import Job, Operation, Machine
+from scheduler.batch_decoder import BatchDecoder, evaluate_population
+from scheduler.engine import schedule_instance
+from scheduler.instance import compile_instance
+from genetic_algorithm import calculate_tardiness, run_genetic_algorithm
+
+
+def _random_problem(seed, n_jobs=15, n_machines=4, float_times=False):
+    rng = random.Random(seed)
+    machines = [
+        Machine(k, [(s, s + rng.randint(1, 12)) for s in rng.sample(range(120), rng.randint(0, 4))])
+        for k in range(n_machines)
+    ]
+    jobs = []
+    for j in range(n_jobs):
+        ops = [
+            Operation(rng.randrange(n_machines), rng.randint(1, 9) + (0.25 if float_times else 0))
+            for _ in range(rng.randint(1, 4))
+        ]
+        jobs.append(Job(j, ops, due_date=rng.randint(10, 90), priority=rng.randint(1, 5)))
+    return jobs, machines
+
+
+def _objectives(instance, jobs, order, setup_time, state=None):
+    schedule = schedule_instance(instance, order, setup_time, state)
+    makespan = max(op[4] for op in schedule) if schedule else 0
+    return makespan, calculate_tardiness(schedule, jobs)
+
+
+class TestBatchDecoder:
+    @pytest.mark.parametrize("float_times", [False, True])
+    def test_matches_schedule_instance(self, float_times):
+        """Objectives equal the pure-Python decode, including setup and downtime."""
+        for seed in range(8):
+            jobs, machines = _random_problem(seed, float_times=float_times)
+            instance = compile_instance(jobs, machines)
+            state = {0: (7, 3), 1: (2, 999)}
+            rng = random.Random(seed)
+            orders = [rng.sample(range(instance.n_jobs), instance.n_jobs) for _ in range(12)]
+
+            makespans, tardiness = BatchDecoder(instance, 3, state).evaluate(orders)
+            for i, order in enumerate(orders):
+                assert (makespans[i], tardiness[i]) == _objectives(instance, jobs, order, 3, state)
+
+    def test_job_without_operations(self):
+        jobs = [
+            Job(1, [Operation(0, 4)], due_date=2, priority=1),
+            Job(2, [], due_date=0, priority=1),
+            Job(3, [Operation(0, 3), Operation(1, 2)], due_date=20, priority=1),
+        ]
+        instance = compile_instance(jobs, [Machine(0, [(5, 8)]), Machine(1)])
+        orders = [[0, 1, 2], [1, 2, 0]]
+        makespans, tardiness = evaluate_population(instance, orders, setup_time=1)
+        for i, order in enumerate(orders):
+            assert (makespans[i], tardiness[i]) == _objectives(instance, jobs, order, 1)
+
+    def test_rejects_flat_orders(self, sample_jobs, sample_machines):
+        instance = compile_instance(sample_jobs, sample_machines)
+        with pytest.raises(ValueError):
+            BatchDecoder(instance, 2).evaluate([0, 1, 2, 3, 4])
+
+
+class TestGABackend:
+    def test_numpy_backend_matches_python(self, sample_jobs, fresh_machines):
+        """Same seed, same objectives → the same best schedule."""
+        results = []
+        for backend in ("python", "numpy"):
+            random.seed(11)
+            results.append(run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 12, 6, 0.2, 3, 0.6, 0.4, backend=backend,
+            ))
+        assert results[0] == results[1]
+
+    def test_unknown_backend(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.6, 0.4, backend="gpu",
+            )
@@ -0,0 +1,131 @@
+# tests/test_bounds.py
+"""
+Tests for scheduler/bounds.py — makespan / tardiness lower bounds.
+"""
+import itertools
+import pytest
+from models import Job, Operation, Machine
+from scheduler.bounds import lower_bounds, makespan_lower_bound, optimality_gap
+from scheduler.dispatch import DISPATCH_RULES, dispatch_instance
+from scheduler.engine import schedule_instance
+from scheduler.gap_fill import schedule_instance_gap_fill
+from scheduler.instance import compile_instance
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _objectives(schedule, instance):
+    completion = {}
+    for job_id, _, _, _, end in schedule:
+        completion[job_id] = max(completion.get(job_id, 0), end)
+    due = dict(zip(instance.job_ids, instance.due_dates))
+    makespan = max(completion.values(), default=0)
+    return makespan, sum(max(0, c - due[j]) for j, c in completion.items())
+
+
+class TestLowerBounds:
+    def test_single_machine_is_exact(self):
+        """One machine, no downtime: total work plus unavoidable setups."""
+        jobs = [Job(i, [Operation(0, p)], due_date=100, priority=1) for i, p in enumerate([5, 3, 7])]
+        bounds = lower_bounds(compile_instance(jobs, [Machine(0)]), setup_time=2)
+        assert bounds["machine_load"] == 15 + 2 * 2
+        assert bounds["makespan"] == 19
+
+    def test_longest_job(self):
+        """A long job across two idle machines bounds the makespan by its length."""
+        jobs = [
+            Job(1, [Operation(0, 10), Operation(1, 10)], due_date=5, priority=1),
+            Job(2, [Operation(1, 1)], due_date=50, priority=1),
+        ]
+        bounds = lower_bounds(compile_instance(jobs, [Machine(0), Machine(1)]))
+        assert bounds["job"] == 20
+        assert bounds["makespan"] == 20
+        assert bounds["tardiness"] == 15
+
+    def test_one_machine_respects_heads_tails_and_downtime(self):
+        """Work released late on a machine with a maintenance window."""
+        jobs = [
+            Job(1, [Operation(0, 10), Operation(1, 5)], due_date=100, priority=1),
+            Job(2, [Operation(0, 10), Operation(1, 5)], due_date=100, priority=1),
+        ]
+        machines = [Machine(0), Machine(1, [(0, 30)])]
+        bounds = lower_bounds(compile_instance(jobs, machines))
+        # M1 cannot start before 30 and must run 10 units
+        assert bounds["one_machine"] == 40
+        assert bounds["makespan"] == 40
+
+    def test_initial_state(self):
+        """A busy machine whose last job differs adds availability and a setup."""
+        jobs = [Job(1, [Operation(0, 4)], due_date=100, priority=1)]
+        instance = compile_instance(jobs, [Machine(0)])
+        assert makespan_lower_bound(instance, setup_time=3, initial_state={0: (10, 99)}) == 17
+        assert makespan_lower_bound(instance, setup_time=3, initial_state={0: (10, 1)}) == 14
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_never_exceeds_any_schedule(self, seed, random_instance):
+        """Bounds hold for every job ordering under both decoders and all dispatch rules."""
+        jobs, machines = random_instance(seed, n_jobs=5, n_machines=3, windows=2, max_time=12, max_due=80)
+        instance = compile_instance(jobs, machines)
+        setup_time = seed % 3
+        state = {0: (seed % 7, None), 1: (seed % 5, jobs[0].job_id)} if seed % 2 else None
+        bounds = lower_bounds(instance, setup_time, state)
+
+        schedules = [dispatch_instance(instance, rule, setup_time, state) for rule in DISPATCH_RULES]
+        for order in itertools.permutations(range(instance.n_jobs)):
+            schedules.append(schedule_instance(instance, list(order), setup_time, state))
+            schedules.append(schedule_instance_gap_fill(instance, list(order), setup_time, state))
+        for schedule in schedules:
+            makespan, tardiness = _objectives(schedule, instance)
+            assert bounds["makespan"] <= makespan
+            assert bounds["tardiness"] <= tardiness
+
+    def test_zero_duration_operations(self):
+        """A machine whose last released operation takes no time."""
+        jobs = [
+            Job(0, [Operation(0, 3), Operation(1, 0)], due_date=10, priority=1),
+            Job(1, [Operation(0, 2)], due_date=10, priority=1),
+        ]
+        machines = [Machine(0), Machine(1)]
+        bounds = lower_bounds(compile_instance(jobs, machines))
+        assert bounds["makespan"] == 5
+        schedule = run_genetic_algorithm(jobs, machines, 0, 4, 3, 0.2, 2, 0.5, 0.5)
+        assert len(schedule) == 3
+
+    def test_empty_instance(self):
+        bounds = lower_bounds(compile_instance([], [Machine(0)]))
+        assert bounds["makespan"] == 0
+        assert bounds["tardiness"] == 0
+
+
+class TestOptimalityGap:
+    def test_gap(self):
+        assert optimality_gap(110, 100) == 10.0
+        assert optimality_gap(100, 100) == 0.0
+        assert optimality_gap(0, 0) == 0.0
+        assert optimality_gap(5, 0) is None
+
+
+class TestGAEarlyStop:
+    def _jobs(self):
+        # Single machine, no setups: every ordering is optimal
+        return [Job(i, [Operation(0, 3)], due_date=1000, priority=1) for i in range(6)]
+
+    def test_stops_at_bound(self):
+        stats = {}
+        schedule = run_genetic_algorithm(
+            self._jobs(), [Machine(0)], setup_time=0, pop_size=6, num_gen=50,
+            mut_rate=0.1, tourn_size=2, w_makespan=1.0, w_tardiness=0.0, stats=stats,
+        )
+        assert max(op[4] for op in schedule) == 18
+        assert stats["lower_bound"] == 18
+        assert stats["reached_bound"] is True
+        assert stats["generations_run"] == 1
+
+    def test_stop_at_bound_disabled(self):
+        stats = {}
+        run_genetic_algorithm(
+            self._jobs(), [Machine(0)], setup_time=0, pop_size=6, num_gen=5,
+            mut_rate=0.1, tourn_size=2, w_makespan=1.0, w_tardiness=0.0, stats=stats,
+            stop_at_bound=False,
+        )
+        assert stats["generations_run"] == 5
+        assert stats["reached_bound"] is True
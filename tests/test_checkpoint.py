@@ -0,0 +1,107 @@
+# tests/test_checkpoint.py
+"""
+Tests for scheduler/checkpoint.py — checkpoint files and resumable GA runs.
+"""
+import random
+import threading
+from array import array
+import pytest
+from scheduler.checkpoint import (
+    instance_fingerprint, load_checkpoint, rng_state_from_json, rng_state_to_json, save_checkpoint,
+)
+from scheduler.instance import compile_instance
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _run(jobs, machines, num_gen, **kwargs):
+    stats = {}
+    schedule = run_genetic_algorithm(
+        jobs, machines, 2, 12, num_gen, 0.2, 3, 0.5, 0.5, stats=stats, stop_at_bound=False, **kwargs,
+    )
+    return schedule, stats
+
+
+class TestCheckpointFile:
+    def test_round_trip(self, tmp_path):
+        random.seed(4)
+        path = str(tmp_path / "nested" / "run.ckpt")
+        save_checkpoint(path, {
+            "fingerprint": "abc",
+            "generation": 7,
+            "population": [array('i', [2, 0, 1]), array('i', [0, 1, 2])],
+            "rng_state": rng_state_to_json(random.getstate()),
+        })
+        state = load_checkpoint(path, "abc")
+        assert state["generation"] == 7
+        assert state["population"] == [[2, 0, 1], [0, 1, 2]]
+        expected = random.random()
+        random.setstate(rng_state_from_json(state["rng_state"]))
+        assert random.random() == expected
+
+    def test_rejects_other_problem_and_garbage(self, tmp_path):
+        path = str(tmp_path / "run.ckpt")
+        save_checkpoint(path, {"fingerprint": "abc"})
+        with pytest.raises(ValueError):
+            load_checkpoint(path, "xyz")
+        (tmp_path / "bad.ckpt").write_bytes(b"not a checkpoint")
+        with pytest.raises(ValueError):
+            load_checkpoint(str(tmp_path / "bad.ckpt"))
+
+    def test_fingerprint_tracks_problem(self, sample_jobs, fresh_machines):
+        instance = compile_instance(sample_jobs, fresh_machines)
+        assert instance_fingerprint(instance, 2) == instance_fingerprint(instance, 2)
+        assert instance_fingerprint(instance, 2) != instance_fingerprint(instance, 3)
+        assert instance_fingerprint(instance, 2) != instance_fingerprint(instance, 2, {0: (5, None)})
+
+
+class TestResumableGA:
+    def test_resumed_run_matches_uninterrupted_run(self, tmp_path, random_instance):
+        jobs, machines = random_instance(1, windows=0)
+        path = str(tmp_path / "run.ckpt")
+        random.seed(11)
+        full, _ = _run(jobs, machines, 20)
+        random.seed(11)
+        _, first = _run(jobs, machines, 8, checkpoint_path=path)
+        assert first["checkpoints"] == 1 and first["generations_run"] == 8
+        random.seed(999)  # restored from the checkpoint
+        resumed, second = _run(jobs, machines, 20, resume_from=path)
+        assert resumed == full
+        assert second["resumed_from"] == 8 and second["generations_run"] == 20
+
+    def test_cancelled_run_can_be_extended(self, tmp_path, random_instance):
+        jobs, machines = random_instance(2, windows=0)
+        path = str(tmp_path / "run.ckpt")
+        cancel = threading.Event()
+        cancel.set()
+        _, first = _run(jobs, machines, 50, checkpoint_path=path, cancel_event=cancel)
+        assert first["stop_reason"] == "cancelled" and first["generations_run"] == 1
+        schedule, second = _run(jobs, machines, 6, checkpoint_path=path, resume_from=path)
+        assert second["generations_run"] == 6
+        assert len(schedule) == sum(len(job.operations) for job in jobs)
+        assert load_checkpoint(path)["generation"] == 6
+
+    def test_resume_restores_the_runs_own_rng(self, tmp_path, random_instance):
+        jobs, machines = random_instance(4, windows=0)
+        path = str(tmp_path / "run.ckpt")
+        full, _ = _run(jobs, machines, 12, rng=random.Random(5))
+        _run(jobs, machines, 6, checkpoint_path=path, rng=random.Random(5))
+        state = random.getstate()
+        resumed, _ = _run(jobs, machines, 12, resume_from=path, rng=random.Random())
+        assert resumed == full
+        # The process-wide RNG is left alone
+        assert random.getstate() == state
+
+    def test_interval_checkpoints(self, tmp_path, random_instance):
+        jobs, machines = random_instance(3, windows=0)
+        _, stats = _run(jobs, machines, 5, checkpoint_path=str(tmp_path / "run.ckpt"), checkpoint_interval=0)
+        # One per generation boundary plus the final one
+        assert stats["checkpoints"] == 5
+
+    def test_rejects_mismatched_problem_and_islands(self, tmp_path, sample_jobs, fresh_machines, random_instance):
+        jobs, machines = random_instance(4, windows=0)
+        path = str(tmp_path / "run.ckpt")
+        _run(jobs, machines, 2, checkpoint_path=path)
+        with pytest.raises(ValueError):
+            _run(sample_jobs, fresh_machines, 4, resume_from=path)
+        with pytest.raises(ValueError):
+            _run(jobs, machines, 4, checkpoint_path=path, islands=2)
@@ -0,0 +1,115 @@
+# tests/test_dispatch.py
+"""
+Tests for scheduler/dispatch.py — heap-based non-delay dispatching engine.
+"""
+import random
+import time
+import pytest
+from models import Job, Operation, Machine
+from scheduler.dispatch import DISPATCH_RULES, dispatch_instance, schedule_dispatch
+from scheduler.engine import ALGORITHM_MAP
+from scheduler.instance import compile_instance, snapshot_machine_state
+
+
+def _random_problem(seed, n_jobs=20, n_machines=4, max_ops=4):
+    rng = random.Random(seed)
+    machines = [
+        Machine(k, [(s, s + rng.randint(1, 10)) for s in rng.sample(range(150), 2)])
+        for k in range(n_machines)
+    ]
+    jobs = [
+        Job(j, [Operation(rng.randrange(n_machines), rng.randint(1, 9)) for _ in range(rng.randint(1, max_ops))],
+            due_date=rng.randint(10, 120), priority=rng.randint(1, 5))
+        for j in range(n_jobs)
+    ]
+    return jobs, machines
+
+
+def _assert_feasible(schedule, jobs, machines, setup_time):
+    windows = {m.machine_id: m.unavailable_periods for m in machines}
+    by_machine = {}
+    ends = {}
+    for job_id, op_index, machine_id, start, end in sorted(schedule, key=lambda op: (op[0], op[1])):
+        if op_index > 0:
+            assert start >= ends[(job_id, op_index - 1)]
+        ends[(job_id, op_index)] = end
+        by_machine.setdefault(machine_id, []).append((start, end, job_id))
+        for w_start, w_end in windows[machine_id]:
+            assert not (start < w_end and w_start < end)
+    for ops in by_machine.values():
+        ops.sort()
+        for (s1, e1, j1), (s2, e2, j2) in zip(ops, ops[1:]):
+            assert s2 >= e1 + (setup_time if j1 != j2 else 0)
+    assert len(ends) == sum(len(j.operations) for j in jobs)
+
+
+class TestDispatch:
+    @pytest.mark.parametrize("rule", DISPATCH_RULES)
+    def test_feasible(self, rule):
+        for seed in range(10):
+            jobs, machines = _random_problem(seed)
+            schedule = schedule_dispatch(jobs, machines, setup_time=2, rule=rule)
+            _assert_feasible(schedule, jobs, machines, setup_time=2)
+
+    def test_interleaves_jobs(self):
+        """Both jobs start at t=0 on different machines; the dispatcher picks per machine."""
+        jobs = [
+            Job(1, [Operation(0, 5), Operation(1, 5)], due_date=100, priority=1),
+            Job(2, [Operation(1, 2), Operation(0, 2)], due_date=3, priority=1),
+        ]
+        schedule = schedule_dispatch(jobs, [Machine(0), Machine(1)], setup_time=0, rule="SLACK")
+        assert (2, 0, 1, 0, 2) in schedule
+        assert (1, 0, 0, 0, 5) in schedule
+
+    def test_mwkr_prefers_long_job(self):
+        jobs = [
+            Job(1, [Operation(0, 2)], due_date=10, priority=1),
+            Job(2, [Operation(0, 2), Operation(0, 9)], due_date=10, priority=1),
+        ]
+        schedule = schedule_dispatch(jobs, [Machine(0)], setup_time=0, rule="MWKR")
+        assert schedule[0][0] == 2
+
+    def test_slack_prefers_tight_job(self):
+        jobs = [
+            Job(1, [Operation(0, 3)], due_date=50, priority=1),
+            Job(2, [Operation(0, 3)], due_date=5, priority=1),
+        ]
+        schedule = schedule_dispatch(jobs, [Machine(0)], setup_time=0, rule="SLACK")
+        assert schedule[0][0] == 2
+
+    def test_atc_prefers_weighted_job(self):
+        """Both jobs already late: ATC reduces to w / p."""
+        jobs = [
+            Job(1, [Operation(0, 4)], due_date=0, priority=1),
+            Job(2, [Operation(0, 4)], due_date=0, priority=5),
+        ]
+        schedule = schedule_dispatch(jobs, [Machine(0)], setup_time=0, rule="ATC")
+        assert schedule[0][0] == 2
+
+    def test_initial_state(self):
+        jobs = [Job(1, [Operation(0, 3)], due_date=50, priority=1)]
+        instance = compile_instance(jobs, [Machine(0)])
+        assert dispatch_instance(instance, "CR", 2, {0: (10, 7)}) == [(1, 0, 0, 12, 15)]
+
+    def test_machines_not_mutated(self, sample_jobs, fresh_machines):
+        before = snapshot_machine_state(fresh_machines)
+        schedule_dispatch(sample_jobs, fresh_machines, setup_time=2, rule="ATC")
+        assert snapshot_machine_state(fresh_machines) == before
+
+    def test_unknown_rule(self, sample_jobs, sample_machines):
+        with pytest.raises(ValueError):
+            schedule_dispatch(sample_jobs, sample_machines, setup_time=2, rule="LIFO")
+
+    def test_registered(self):
+        for rule in DISPATCH_RULES:
+            assert rule in ALGORITHM_MAP
+
+    def test_large_instance_is_fast(self):
+        """20k operations dispatch in well under a second."""
+        jobs, machines = _random_problem(1, n_jobs=5000, n_machines=40, max_ops=7)
+        instance = compile_instance(jobs, machines)
+        assert instance.n_ops > 19000
+        started = time.perf_counter()
+        schedule = dispatch_instance(instance, "ATC", 2)
+        assert time.perf_counter() - started < 2.0  # generous for slow CI hosts
+        assert len(schedule) == instance.n_ops
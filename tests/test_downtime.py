@@ -0,0 +1,81 @@
+# tests/test_downtime.py
+"""
+Tests for scheduler/downtime.py — indexed machine-unavailability lookup.
+"""
+import random
+from models import Job, Operation, Machine
+from scheduler.downtime import DowntimeIndex
+
+
+def _linear_scan(periods, start, duration):
+    """The restart-from-zero scan the engines used before the index."""
+    while True:
+        for down_start, down_end in periods:
+            if start < down_end and down_start < start + duration:
+                start = down_end
+                break
+        else:
+            return start
+
+
+class TestDowntimeIndex:
+    def test_empty_index_returns_start(self):
+        assert DowntimeIndex([]).earliest_start(7, 5) == 7
+
+    def test_overlapping_windows_are_merged(self):
+        idx = DowntimeIndex([(10, 20), (5, 12), (30, 40), (35, 38)])
+        assert list(zip(idx.starts, idx.ends)) == [(5, 20), (30, 40)]
+
+    def test_pushes_past_window(self):
+        idx = DowntimeIndex([(2, 10)])
+        assert idx.earliest_start(0, 5) == 10
+        assert idx.earliest_start(0, 2) == 0
+
+    def test_skips_gaps_too_short(self):
+        # Gaps of 2 and 3 between windows; a 4-unit op must wait for the end
+        idx = DowntimeIndex([(0, 10), (12, 20), (23, 30)])
+        assert idx.earliest_start(5, 4) == 30
+        assert idx.earliest_start(5, 3) == 20
+        assert idx.earliest_start(5, 2) == 10
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            periods = []
+            for _ in range(rng.randint(0, 15)):
+                s = rng.randint(0, 200)
+                periods.append((s, s + rng.randint(0, 20)))
+            idx = DowntimeIndex(periods)
+            for _ in range(5):
+                t, d = rng.randint(0, 220), rng.randint(0, 25)
+                assert idx.earliest_start(t, d) == _linear_scan(periods, t, d)
+
+
+class TestEnginesShareIndex:
+    def test_fcfs_with_many_windows(self):
+        periods = [(i * 10, i * 10 + 8) for i in range(500)]  # 2-unit gaps
+        jobs = [Job(1, [Operation(0, 3)], due_date=10, priority=1)]
+        from scheduler.engine import schedule_fcfs
+        schedule = schedule_fcfs(jobs, [Machine(0, periods)], setup_time=0)
+        assert schedule[0] == (1, 0, 0, 4998, 5001)
+
+    def test_shift_engine_rechecks_downtime_until_feasible(self):
+        """Shift push lands in a window, the window push leaves the shift — both must hold."""
+        from scheduler.shift_engine import schedule_fcfs_with_shifts
+        jobs = [Job(1, [Operation(1, 4)], due_date=100, priority=1)]
+        machines = [Machine(1, [(6, 8), (9, 12)])]
+        shift_map = {"1": (6.0, 14.0, 24.0)}
+        schedule = schedule_fcfs_with_shifts(jobs, machines, setup_time=0, shift_map=shift_map)
+        _, _, _, start, end = schedule[0]
+        # 6 -> 8 (window) -> 12 (window) -> no room before 14 -> next shift at 30
+        assert start == 30.0 and end == 34.0
+
+    def test_rl_env_resolves_chained_windows(self):
+        """ShopFloorEnv.step used a single pass; it must now agree with FCFS."""
+        from rl.environment import ShopFloorEnv
+        jobs = [Job(1, [Operation(1, 4)], due_date=100, priority=1)]
+        # In this order a single pass stops at 10, inside (9, 15)
+        machines = [Machine(1, [(9, 15), (2, 10)])]
+        env = ShopFloorEnv(jobs, machines, setup_time=0)
+        env.step(0)
+        assert env.get_schedule()[0][3:] == (15, 19)
@@ -10,8 +10,11 @@ from scheduler.engine import (
     schedule_spt,
     schedule_edd,
     schedule_wspt,
+    schedule_instance,
+    evaluate_instance,
     ALGORITHM_MAP,
 )
+from scheduler.instance import compile_instance, snapshot_machine_state
 
 
 class TestFCFS:
@@ -100,6 +103,62 @@ class TestFCFS:
                 )
 
 
+class TestSideEffectFree:
+    """The engines read machine state but never write it back."""
+
+    def test_fcfs_does_not_mutate_machines(self, sample_jobs, fresh_machines):
+        """Machine availability state is unchanged after scheduling."""
+        before = snapshot_machine_state(fresh_machines)
+        first = schedule_fcfs(sample_jobs, fresh_machines, setup_time=2)
+        assert snapshot_machine_state(fresh_machines) == before
+        # Re-running on the same machines must give the same answer
+        assert schedule_fcfs(sample_jobs, fresh_machines, setup_time=2) == first
+
+    def test_fcfs_starts_from_machine_state(self):
+        """A machine that is busy until t=10 delays its first operation."""
+        jobs = [Job(1, [Operation(0, 5)], due_date=50, priority=1)]
+        machine = Machine(machine_id=0)
+        machine.available_at = 10
+        machine.last_job_id = 7
+        schedule = schedule_fcfs(jobs, [machine], setup_time=3)
+
+        assert schedule == [(1, 0, 0, 13, 18)]
+        assert (machine.available_at, machine.last_job_id) == (10, 7)
+
+    def test_schedule_instance_initial_state(self):
+        """initial_state overrides the idle default and is left untouched."""
+        jobs = [
+            Job(1, [Operation(0, 5)], due_date=50, priority=1),
+            Job(2, [Operation(1, 4)], due_date=50, priority=1),
+        ]
+        instance = compile_instance(jobs, [Machine(0), Machine(1)])
+        state = {0: (10, 1)}
+        schedule = schedule_instance(instance, [0, 1], setup_time=3, initial_state=state)
+
+        # Same job as last on M0: no setup; M1 is missing from the snapshot → idle
+        assert schedule == [(1, 0, 0, 10, 15), (2, 0, 1, 0, 4)]
+        assert state == {0: (10, 1)}
+
+    def test_schedule_instance_matches_fcfs(self, sample_jobs, fresh_machines):
+        """Decoding a reversed order matches FCFS over the reversed job list."""
+        instance = compile_instance(sample_jobs, fresh_machines)
+        order = list(reversed(range(instance.n_jobs)))
+        expected = schedule_fcfs(list(reversed(sample_jobs)), fresh_machines, setup_time=2)
+        assert schedule_instance(instance, order, setup_time=2) == expected
+
+    def test_evaluate_instance_matches_schedule(self, sample_jobs, fresh_machines):
+        """Objective-only evaluation agrees with the full decode."""
+        from scheduler.metrics import calculate_tardiness
+
+        instance = compile_instance(sample_jobs, fresh_machines)
+        state = {fresh_machines[0].machine_id: (4, sample_jobs[-1].job_id)}
+        for order in (list(range(instance.n_jobs)), list(reversed(range(instance.n_jobs)))):
+            schedule = schedule_instance(instance, order, setup_time=2, initial_state=state)
+            makespan, tardiness = evaluate_instance(instance, order, setup_time=2, initial_state=state)
+            assert makespan == max(op[4] for op in schedule)
+            assert tardiness == calculate_tardiness(schedule, sample_jobs)
+
+
 class TestSPT:
     """Tests for Shortest Processing Time ordering."""
 
@@ -140,7 +199,7 @@ class TestAlgorithmMap:
     """Tests for the ALGORITHM_MAP registry."""
 
     def test_all_algorithms_present(self):
-        assert set(ALGORITHM_MAP.keys()) == {"FCFS", "SPT", "EDD", "WSPT"}
+        assert set(ALGORITHM_MAP.keys()) == {"FCFS", "SPT", "EDD", "WSPT", "ACTIVE", "ATC", "MWKR", "CR", "SLACK", "TABU"}
 
     def test_map_values_are_callable(self):
         for name, fn in ALGORITHM_MAP.items():
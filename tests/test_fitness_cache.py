@@ -0,0 +1,79 @@
+# tests/test_fitness_cache.py
+"""
+Tests for scheduler/fitness_cache.py — LRU memoization of GA objectives.
+"""
+import random
+import pytest
+from scheduler.fitness_cache import FitnessCache, ordering_key
+from genetic_algorithm import run_genetic_algorithm
+
+
+class _Counter:
+    """Fake evaluator recording the orderings it is asked to decode."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, orders):
+        self.calls.append([list(order) for order in orders])
+        return [(sum(i * v for i, v in enumerate(order)), 0) for order in orders]
+
+
+class TestFitnessCache:
+    def test_key_is_compact_and_order_sensitive(self):
+        assert len(ordering_key(range(500))) == 16
+        assert ordering_key([0, 1, 2]) == ordering_key((0, 1, 2))
+        assert ordering_key([0, 1, 2]) != ordering_key([0, 2, 1])
+
+    def test_only_misses_are_evaluated(self):
+        cache = FitnessCache(10)
+        evaluate = _Counter()
+        first = cache.evaluate([[0, 1, 2], [2, 1, 0], [0, 1, 2]], evaluate)
+        assert evaluate.calls == [[[0, 1, 2], [2, 1, 0]]]
+        assert first[0] == first[2]
+
+        second = cache.evaluate([[2, 1, 0], [1, 0, 2]], evaluate)
+        assert evaluate.calls[1] == [[1, 0, 2]]
+        assert second[0] == first[1]
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 3
+
+    def test_all_hits_skip_evaluator(self):
+        cache = FitnessCache(10)
+        evaluate = _Counter()
+        cache.evaluate([[0, 1]], evaluate)
+        cache.evaluate([[0, 1], [0, 1]], evaluate)
+        assert len(evaluate.calls) == 1
+
+    def test_lru_eviction(self):
+        cache = FitnessCache(2)
+        evaluate = _Counter()
+        cache.evaluate([[0, 1, 2], [1, 0, 2]], evaluate)
+        cache.evaluate([[0, 1, 2]], evaluate)      # refresh
+        cache.evaluate([[2, 1, 0]], evaluate)      # evicts [1, 0, 2]
+        assert len(cache) == 2
+        cache.evaluate([[1, 0, 2]], evaluate)
+        assert evaluate.calls[-1] == [[1, 0, 2]]
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            FitnessCache(0)
+
+
+class TestGAFitnessCache:
+    def test_same_result_and_reports_stats(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 10, 6, 0.1, 3, 0.6, 0.4)
+        random.seed(3)
+        plain = run_genetic_algorithm(*args, stop_at_bound=False)
+        stats = {}
+        random.seed(3)
+        cached = run_genetic_algorithm(*args, stop_at_bound=False, fitness_cache=100, stats=stats)
+        assert cached == plain
+        cache_stats = stats["fitness_cache"]
+        assert cache_stats["hits"] + cache_stats["misses"] == 60
+        # The elite alone is looked up again every generation
+        assert cache_stats["hits"] >= 5
+
+    def test_rejects_negative_size(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.5, 0.5, fitness_cache=-1)
@@ -0,0 +1,121 @@
+# tests/test_gap_fill.py
+"""
+Tests for scheduler/gap_fill.py — gap-filling (active schedule) decoder.
+"""
+import random
+import pytest
+from models import Job, Operation, Machine
+from scheduler.engine import ALGORITHM_MAP, schedule_fcfs
+from scheduler.gap_fill import schedule_gap_fill, schedule_instance_gap_fill
+from scheduler.instance import compile_instance, snapshot_machine_state
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _assert_feasible(schedule, jobs, machines, setup_time):
+    """Precedence, no overlap, setup times and maintenance windows all hold."""
+    windows = {m.machine_id: m.unavailable_periods for m in machines}
+    by_machine = {}
+    for job_id, op_index, machine_id, start, end in schedule:
+        by_machine.setdefault(machine_id, []).append((start, end, job_id))
+        for w_start, w_end in windows[machine_id]:
+            assert not (start < w_end and w_start < end), "operation overlaps downtime"
+    for ops in by_machine.values():
+        ops.sort()
+        for (s1, e1, j1), (s2, e2, j2) in zip(ops, ops[1:]):
+            assert s2 >= e1 + (setup_time if j1 != j2 else 0)
+    ends = {}
+    for job_id, op_index, machine_id, start, end in schedule:
+        if op_index > 0:
+            assert start >= ends[(job_id, op_index - 1)]
+        ends[(job_id, op_index)] = end
+    assert len(ends) == sum(len(j.operations) for j in jobs)
+
+
+class TestGapFill:
+    def test_fills_idle_gap(self):
+        """Job 2 runs on M0 while job 1 waits for its M1 operation."""
+        jobs = [
+            Job(1, [Operation(1, 10), Operation(0, 3)], due_date=50, priority=1),
+            Job(2, [Operation(0, 4)], due_date=50, priority=1),
+            Job(3, [Operation(1, 2), Operation(0, 2)], due_date=50, priority=1),
+        ]
+        machines = [Machine(0), Machine(1)]
+        schedule = schedule_gap_fill(jobs, machines, setup_time=0)
+
+        assert (2, 0, 0, 0, 4) in schedule
+        assert (1, 1, 0, 10, 13) in schedule
+        # Job 3 is released to M0 at 12, after the gap has been used
+        assert (3, 1, 0, 13, 15) in schedule
+        # FCFS appends job 2 after job 1's M0 operation instead
+        assert schedule_fcfs(jobs, machines, setup_time=0)[2] == (2, 0, 0, 13, 17)
+
+    def test_gap_respects_setup_on_both_sides(self):
+        jobs = [
+            Job(1, [Operation(0, 2)], due_date=50, priority=1),
+            Job(2, [Operation(1, 10), Operation(0, 2)], due_date=50, priority=1),
+            Job(3, [Operation(0, 3)], due_date=50, priority=1),
+        ]
+        machines = [Machine(0), Machine(1)]
+        # M0: job 1 [0,2], job 2 [10,12]. Job 3 needs 1 + 3 + 1 = 5 ≤ 8 units
+        schedule = schedule_gap_fill(jobs, machines, setup_time=1)
+        assert (3, 0, 0, 3, 6) in schedule
+        # With setup 3 the gap is too short and job 3 goes to the end
+        schedule = schedule_gap_fill(jobs, machines, setup_time=3)
+        assert (3, 0, 0, 15, 18) in schedule
+
+    def test_gap_respects_downtime(self):
+        jobs = [
+            Job(1, [Operation(1, 10), Operation(0, 3)], due_date=50, priority=1),
+            Job(2, [Operation(0, 4)], due_date=50, priority=1),
+        ]
+        machines = [Machine(0, unavailable_periods=[(0, 7)]), Machine(1)]
+        schedule = schedule_gap_fill(jobs, machines, setup_time=0)
+        assert (1, 1, 0, 10, 13) in schedule
+        assert (2, 0, 0, 13, 17) in schedule
+
+    def test_random_instances_feasible_and_not_longer(self):
+        """Active schedules stay feasible and never exceed FCFS makespan here."""
+        for seed in range(30):
+            rng = random.Random(seed)
+            machines = [
+                Machine(k, [(s, s + rng.randint(1, 8)) for s in rng.sample(range(80), 2)])
+                for k in range(3)
+            ]
+            jobs = [
+                Job(j, [Operation(rng.randrange(3), rng.randint(1, 9)) for _ in range(rng.randint(1, 4))],
+                    due_date=rng.randint(10, 60), priority=1)
+                for j in range(10)
+            ]
+            active = schedule_gap_fill(jobs, machines, setup_time=1)
+            fcfs = schedule_fcfs(jobs, machines, setup_time=1)
+            _assert_feasible(active, jobs, machines, setup_time=1)
+            assert max(op[4] for op in active) <= max(op[4] for op in fcfs)
+
+    def test_initial_state_blocks_earlier_gap(self):
+        jobs = [Job(1, [Operation(0, 2)], due_date=50, priority=1)]
+        instance = compile_instance(jobs, [Machine(0)])
+        schedule = schedule_instance_gap_fill(instance, [0], setup_time=2, initial_state={0: (5, 9)})
+        assert schedule == [(1, 0, 0, 7, 9)]
+
+    def test_machines_not_mutated(self, sample_jobs, fresh_machines):
+        before = snapshot_machine_state(fresh_machines)
+        schedule_gap_fill(sample_jobs, fresh_machines, setup_time=2)
+        assert snapshot_machine_state(fresh_machines) == before
+
+    def test_registered(self):
+        assert ALGORITHM_MAP["ACTIVE"] is schedule_gap_fill
+
+
+class TestGADecoder:
+    def test_active_decoder(self, sample_jobs, fresh_machines):
+        schedule = run_genetic_algorithm(
+            sample_jobs, fresh_machines, 2, 10, 5, 0.1, 3, 0.6, 0.4, decoder="active",
+        )
+        _assert_feasible(schedule, sample_jobs, fresh_machines, setup_time=2)
+
+    def test_active_decoder_rejects_batched_backend(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 10, 5, 0.1, 3, 0.6, 0.4,
+                decoder="active", backend="numpy",
+            )
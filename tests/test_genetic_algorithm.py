@@ -3,14 +3,19 @@
 Tests for genetic_algorithm.py — GA components and end-to-end run.
 """
 import copy
+import threading
+from array import array
 import pytest
 from models import Job, Operation, Machine
 from genetic_algorithm import (
     create_initial_population,
     select_parents,
     crossover,
+    pmx_crossover,
     mutate,
+    insertion_mutate,
     calculate_tardiness,
+    schedule_objectives,
     run_genetic_algorithm,
 )
 
@@ -21,62 +26,96 @@ class TestInitialPopulation:
         assert len(pop) == 20
 
     def test_chromosomes_are_permutations(self, sample_jobs):
-        """Each chromosome should contain all jobs exactly once."""
+        """Each chromosome should contain every job index exactly once."""
         pop = create_initial_population(sample_jobs, size=10)
-        job_ids = sorted(j.job_id for j in sample_jobs)
         for chromosome in pop:
-            assert sorted(j.job_id for j in chromosome) == job_ids
+            assert isinstance(chromosome, array)
+            assert chromosome.typecode == "i"
+            assert sorted(chromosome) == list(range(len(sample_jobs)))
 
     def test_population_diversity(self, sample_jobs):
         """At least some chromosomes should differ (random permutations)."""
         pop = create_initial_population(sample_jobs, size=50)
         orderings = set()
         for chromosome in pop:
-            orderings.add(tuple(j.job_id for j in chromosome))
+            orderings.add(tuple(chromosome))
         # With 5 jobs and 50 samples, we expect more than 1 unique ordering
         assert len(orderings) > 1
 
 
 class TestCrossover:
-    def test_preserves_all_jobs(self, sample_jobs):
-        """OX1 crossover child should contain all jobs with no duplicates."""
+    @pytest.mark.parametrize("operator", [crossover, pmx_crossover])
+    def test_preserves_all_jobs(self, operator):
+        """The child is a permutation of the parents' job indices."""
         import random
         random.seed(42)
-        parent1 = list(sample_jobs)
-        parent2 = list(reversed(sample_jobs))
-        child = crossover(parent1, parent2)
+        for _ in range(50):
+            parent1 = array("i", random.sample(range(12), 12))
+            parent2 = array("i", random.sample(range(12), 12))
+            child = operator(parent1, parent2)
+            assert sorted(child) == list(range(12))
 
-        assert len(child) == len(sample_jobs)
-        child_ids = sorted(j.job_id for j in child)
-        expected_ids = sorted(j.job_id for j in sample_jobs)
-        assert child_ids == expected_ids
+    def test_ox1_keeps_slice_and_parent2_order(self, monkeypatch):
+        """OX1: parent 1's slice stays in place, the rest follow parent 2's order."""
+        import random
+        monkeypatch.setattr(random, "sample", lambda population, k: [2, 5])
+        child = crossover(array("i", [0, 1, 2, 3, 4, 5, 6]), array("i", [6, 5, 4, 3, 2, 1, 0]))
+        assert list(child) == [6, 5, 2, 3, 4, 1, 0]
+
+    def test_pmx_keeps_slice_and_maps_the_rest(self, monkeypatch):
+        """PMX: parent 1's slice in place, displaced jobs follow the mapping."""
+        import random
+        monkeypatch.setattr(random, "sample", lambda population, k: [3, 7])
+        parent1 = array("i", [0, 1, 2, 3, 4, 5, 6, 7, 8])
+        parent2 = array("i", [8, 2, 6, 7, 1, 5, 4, 0, 3])
+        child = pmx_crossover(parent1, parent2)
+        assert list(child[3:7]) == [3, 4, 5, 6]
+        assert list(child) == [8, 2, 1, 3, 4, 5, 6, 0, 7]
 
-    def test_returns_list(self, sample_jobs):
-        child = crossover(list(sample_jobs), list(reversed(sample_jobs)))
-        assert isinstance(child, list)
+    def test_returns_int_array(self):
+        child = crossover(array("i", range(5)), array("i", reversed(range(5))))
+        assert isinstance(child, array)
+        assert child.typecode == "i"
+
+    def test_parents_unchanged(self):
+        parent1 = array("i", range(8))
+        parent2 = array("i", reversed(range(8)))
+        for operator in (crossover, pmx_crossover):
+            operator(parent1, parent2)
+        assert list(parent1) == list(range(8))
+        assert list(parent2) == list(reversed(range(8)))
 
 
 class TestMutation:
     def test_preserves_length(self, sample_jobs):
         """Mutation should not change chromosome length."""
-        chromosome = list(sample_jobs)
+        chromosome = create_initial_population(sample_jobs, size=1)[0]
         mutated = mutate(chromosome, mut_rate=1.0)  # force mutation
         assert len(mutated) == len(sample_jobs)
 
-    def test_preserves_all_jobs(self, sample_jobs):
-        """Mutation should keep all jobs (just swap two)."""
+    @pytest.mark.parametrize("operator", [mutate, insertion_mutate])
+    def test_preserves_all_jobs(self, operator):
+        """Mutation should keep all jobs (just reorder them)."""
         import random
         random.seed(42)
-        chromosome = list(sample_jobs)
-        mutated = mutate(chromosome, mut_rate=1.0)
-        assert sorted(j.job_id for j in mutated) == sorted(j.job_id for j in sample_jobs)
+        chromosome = array("i", range(10))
+        mutated = operator(chromosome, mut_rate=1.0)
+        assert sorted(mutated) == list(range(10))
+        assert list(mutated) != list(range(10))
 
-    def test_no_mutation_at_zero_rate(self, sample_jobs):
+    @pytest.mark.parametrize("operator", [mutate, insertion_mutate])
+    def test_no_mutation_at_zero_rate(self, operator):
         """With 0 mutation rate, chromosome should be unchanged."""
-        chromosome = list(sample_jobs)
-        original_order = [j.job_id for j in chromosome]
-        mutated = mutate(chromosome, mut_rate=0.0)
-        assert [j.job_id for j in mutated] == original_order
+        chromosome = array("i", range(10))
+        mutated = operator(chromosome, mut_rate=0.0)
+        assert list(mutated) == list(range(10))
+
+    def test_insertion_moves_one_job(self, monkeypatch):
+        import random
+        monkeypatch.setattr(random, "random", lambda: 0.0)
+        monkeypatch.setattr(random, "sample", lambda population, k: [1, 4])
+        chromosome = insertion_mutate(array("i", range(6)), mut_rate=1.0)
+        assert list(chromosome) == [0, 2, 3, 4, 1, 5]
 
 
 class TestTournamentSelection:
@@ -87,12 +126,12 @@ class TestTournamentSelection:
         fitness_scores = []
         for chromosome in create_initial_population(sample_jobs, size=10):
             machines_copy = copy.deepcopy(fresh_machines)
-            sched = schedule_fcfs(chromosome, machines_copy, setup_time=2)
+            sched = schedule_fcfs([sample_jobs[j] for j in chromosome], machines_copy, setup_time=2)
             makespan = max(op[4] for op in sched) if sched else 0
-            fitness_scores.append((chromosome, makespan, sched, makespan, 0))
+            fitness_scores.append((chromosome, makespan, makespan, 0))
 
         winner = select_parents(fitness_scores, tourn_size=3)
-        assert isinstance(winner, list)
+        assert isinstance(winner, array)
         assert len(winner) == len(sample_jobs)
 
 
@@ -107,6 +146,16 @@ class TestCalculateTardiness:
         metrics_result = metrics_tardiness(sched, sample_jobs)
         assert ga_result == metrics_result
 
+    def test_schedule_objectives(self, sample_jobs, fresh_machines):
+        """Makespan and tardiness from a prebuilt due-date map."""
+        from scheduler.engine import schedule_fcfs
+
+        sched = schedule_fcfs(sample_jobs, fresh_machines, setup_time=2)
+        due_dates = {job.job_id: job.due_date for job in sample_jobs}
+        makespan, tardiness = schedule_objectives(sched, due_dates)
+        assert makespan == max(op[4] for op in sched)
+        assert tardiness == calculate_tardiness(sched, sample_jobs)
+
 
 class TestGAEndToEnd:
     def test_returns_valid_schedule(self, sample_jobs, fresh_machines):
@@ -144,3 +193,130 @@ class TestGAEndToEnd:
             w_tardiness=0.4,
         )
         assert len(schedule) == total_ops
+
+    @pytest.mark.parametrize("crossover_op", ["ox1", "pmx"])
+    @pytest.mark.parametrize("mutation_op", ["swap", "insertion"])
+    def test_operator_choices(self, sample_jobs, fresh_machines, crossover_op, mutation_op):
+        """Every crossover/mutation pairing yields a complete schedule."""
+        total_ops = sum(len(j.operations) for j in sample_jobs)
+        schedule = run_genetic_algorithm(
+            sample_jobs, fresh_machines, 2, 10, 5, 0.5, 3, 0.6, 0.4,
+            crossover_op=crossover_op, mutation_op=mutation_op,
+        )
+        assert len(schedule) == total_ops
+
+    def test_reports_peak_rss(self, sample_jobs, fresh_machines):
+        stats = {}
+        run_genetic_algorithm(sample_jobs, fresh_machines, 2, 6, 2, 0.1, 2, 0.6, 0.4, stats=stats)
+        rss = stats["peak_rss_mb"]
+        if rss is not None:  # None where the resource module is unavailable
+            assert rss["self"] > 0
+
+    def test_rejects_unknown_operators(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.5, 0.5)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, crossover_op="cx")
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, mutation_op="scramble")
+
+
+class TestGAStopping:
+    """Early-stopping criteria and cancellation; every ordering of these jobs is optimal."""
+
+    ARGS = dict(setup_time=0, pop_size=6, mut_rate=0.1, tourn_size=2, w_makespan=1.0, w_tardiness=0.0)
+
+    def _run(self, num_gen=20, **kwargs):
+        jobs = [Job(i, [Operation(0, 3)], due_date=1000, priority=1) for i in range(6)]
+        stats = {}
+        schedule = run_genetic_algorithm(
+            jobs, [Machine(0)], num_gen=num_gen, stats=stats, stop_at_bound=False, **self.ARGS, **kwargs
+        )
+        assert max(op[4] for op in schedule) == 18
+        return stats
+
+    def test_completed(self):
+        stats = self._run(num_gen=3)
+        assert stats["stop_reason"] == "completed"
+        assert stats["generations_run"] == 3
+
+    def test_stagnation(self):
+        # Best fitness is found in generation 1 and never improves
+        stats = self._run(stagnation_limit=4)
+        assert stats["stop_reason"] == "stagnation"
+        assert stats["generations_run"] == 5
+
+    def test_target_fitness(self):
+        stats = self._run(target_fitness=20)
+        assert stats["stop_reason"] == "target_fitness"
+        assert stats["generations_run"] == 1
+
+    def test_time_limit(self):
+        stats = self._run(time_limit=1e-9)
+        assert stats["stop_reason"] == "time_limit"
+        assert stats["generations_run"] == 1
+
+    def test_cancelled_returns_best_so_far(self):
+        cancel = threading.Event()
+        cancel.set()
+        stats = self._run(cancel_event=cancel)
+        assert stats["stop_reason"] == "cancelled"
+        assert stats["generations_run"] == 1
+
+    def test_lower_bound_reported_first(self):
+        jobs = [Job(i, [Operation(0, 3)], due_date=1000, priority=1) for i in range(6)]
+        stats = {}
+        run_genetic_algorithm(jobs, [Machine(0)], num_gen=20, stats=stats, time_limit=1e-9, **self.ARGS)
+        assert stats["stop_reason"] == "lower_bound"
+
+    def test_rejects_bad_limits(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.5, 0.5)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, time_limit=0)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, stagnation_limit=0)
+
+
+class TestIntermediateResults:
+    """best_callback hands over the best schedule so far while the GA runs."""
+
+    def _run(self, interval, **kwargs):
+        import random
+        rng = random.Random(3)
+        jobs = [
+            Job(j, [Operation(rng.randrange(3), rng.randint(1, 9)) for _ in range(3)],
+                due_date=rng.randint(10, 60), priority=1)
+            for j in range(12)
+        ]
+        published = []
+        stats = {}
+        schedule = run_genetic_algorithm(
+            jobs, [Machine(k) for k in range(3)], 2, 10, 15, 0.2, 2, 0.5, 0.5,
+            stats=stats, stop_at_bound=False,
+            best_callback=lambda *args: published.append(args), best_callback_interval=interval, **kwargs,
+        )
+        return jobs, schedule, published, stats
+
+    def test_every_improvement_without_throttle(self):
+        jobs, schedule, published, stats = self._run(0)
+        assert stats["intermediate_results"] == len(published) >= 1
+        generations = [generation for generation, *_ in published]
+        assert generations == sorted(set(generations))
+        fitness = [0.5 * makespan + 0.5 * tardiness for _, _, makespan, tardiness in published]
+        assert fitness == sorted(fitness, reverse=True)
+        for _, intermediate, makespan, tardiness in published:
+            assert schedule_objectives(intermediate, {job.job_id: job.due_date for job in jobs}) == (makespan, tardiness)
+        # The last hand-over is the final result
+        assert published[-1][1] == schedule
+
+    def test_throttled(self):
+        _, _, published, stats = self._run(3600)
+        # The first improvement goes out at once, the rest fall inside the interval
+        assert len(published) == stats["intermediate_results"] == 1
+        assert published[0][0] == 1
+
+    def test_rejects_negative_interval(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.5, 0.5,
+                best_callback=lambda *args: None, best_callback_interval=-1,
+            )
@@ -0,0 +1,59 @@
+# tests/test_instance.py
+"""
+Tests for scheduler/instance.py — compiled, array-backed ProblemInstance.
+"""
+import copy
+import pytest
+from models import Job, Operation, Machine
+from scheduler.instance import ProblemInstance, compile_instance
+from scheduler.engine import ALGORITHM_MAP, schedule_fcfs
+
+
+class TestCompileInstance:
+    def test_flat_arrays(self, sample_jobs, sample_machines):
+        inst = compile_instance(sample_jobs, sample_machines)
+        assert isinstance(inst, ProblemInstance)
+        assert inst.n_jobs == 5
+        assert inst.n_machines == 3
+        assert inst.n_ops == sum(len(j.operations) for j in sample_jobs)
+        assert inst.job_op_start == [0, 3, 6, 8, 10, 12]
+        # Job 3: M2(8) -> M0(5)
+        assert inst.op_machine[8:10] == [inst.machine_index[2], inst.machine_index[0]]
+        assert inst.op_time[8:10] == [8, 5]
+        assert inst.due_dates == [15, 20, 25, 30, 10]
+        assert inst.priorities == [2, 3, 2, 1, 2]
+        assert inst.job_work == [7, 7, 7, 13, 4]
+
+    def test_order_of(self, sample_jobs, sample_machines):
+        inst = compile_instance(sample_jobs, sample_machines)
+        assert inst.order_of(list(reversed(sample_jobs))) == [4, 3, 2, 1, 0]
+
+    def test_unknown_machine_raises(self):
+        jobs = [Job(1, [Operation(9, 3)], due_date=10, priority=1)]
+        with pytest.raises(ValueError):
+            compile_instance(jobs, [Machine(machine_id=0)])
+
+    def test_duplicate_job_id_raises(self):
+        jobs = [
+            Job(1, [Operation(0, 3)], due_date=10, priority=1),
+            Job(1, [Operation(0, 2)], due_date=10, priority=1),
+        ]
+        with pytest.raises(ValueError):
+            compile_instance(jobs, [Machine(machine_id=0)])
+
+
+class TestEnginesAcceptInstance:
+    def test_precompiled_matches_on_the_fly(self, sample_jobs, sample_machines):
+        """Every ALGORITHM_MAP entry gives the same schedule with a shared instance."""
+        inst = compile_instance(sample_jobs, sample_machines)
+        for name, fn in ALGORITHM_MAP.items():
+            expected = fn(sample_jobs, copy.deepcopy(sample_machines), 2)
+            actual = fn(sample_jobs, copy.deepcopy(sample_machines), 2, instance=inst)
+            assert actual == expected, name
+
+    def test_reordered_jobs_use_instance_indices(self, sample_jobs, sample_machines):
+        inst = compile_instance(sample_jobs, sample_machines)
+        order = list(reversed(sample_jobs))
+        expected = schedule_fcfs(order, copy.deepcopy(sample_machines), 2)
+        actual = schedule_fcfs(order, copy.deepcopy(sample_machines), 2, instance=inst)
+        assert actual == expected
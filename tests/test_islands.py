@@ -0,0 +1,58 @@
+# tests/test_islands.py
+"""
+Tests for the island-model GA in genetic_algorithm.py.
+"""
+import random
+from array import array
+import pytest
+from genetic_algorithm import _migrate, run_genetic_algorithm
+
+
+def _scores(island, fitnesses):
+    return [(array("i", [island, k]), f, None, f, 0) for k, f in enumerate(fitnesses)]
+
+
+class TestMigration:
+    def test_ring_replaces_worst_with_previous_best(self):
+        islands = [_scores(0, [5, 1, 9]), _scores(1, [4, 8, 2]), _scores(2, [7, 3, 6])]
+        migrated = _migrate(islands, 1)
+        # Island 0 receives island 2's best (3), losing its worst (9)
+        assert sorted(x[1] for x in migrated[0]) == [1, 3, 5]
+        assert sorted(x[1] for x in migrated[1]) == [1, 2, 4]
+        assert sorted(x[1] for x in migrated[2]) == [2, 3, 6]
+        assert all(len(island) == 3 for island in migrated)
+
+    def test_no_migrants(self):
+        islands = [_scores(0, [5, 1]), _scores(1, [4, 8])]
+        assert _migrate(islands, 0) is islands
+
+
+class TestIslandGA:
+    def test_complete_and_reproducible(self, sample_jobs, fresh_machines):
+        total_ops = sum(len(j.operations) for j in sample_jobs)
+        runs = []
+        for _ in range(2):
+            stats, progress = {}, []
+            random.seed(4)
+            schedule = run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 8, 6, 0.2, 3, 0.6, 0.4,
+                islands=2, migration_interval=2, stop_at_bound=False, stats=stats,
+                progress_callback=lambda **kw: progress.append(kw),
+            )
+            assert len(schedule) == total_ops
+            assert len(stats["islands"]) == 2
+            assert stats["generations_run"] == 6
+            assert [p["generation"] for p in progress] == [2, 4, 6]
+            runs.append(schedule)
+        assert runs[0] == runs[1]
+
+    def test_rejects_incompatible_options(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 6, 2, 0.1, 2, 0.5, 0.5)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, islands=2, workers=2)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, islands=2, prefix_cache=True)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, islands=2, migrants=6)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, islands=0)
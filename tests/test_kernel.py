@@ -0,0 +1,62 @@
+# tests/test_kernel.py
+"""
+Tests for scheduler/kernel.py — JIT decode kernel against the Python reference.
+"""
+import random
+import pytest
+from models import Job, Operation, Machine
+from scheduler.engine import _decode_fcfs
+from scheduler.instance import compile_instance
+from scheduler.kernel import KERNEL_AVAILABLE, KernelDecoder
+from genetic_algorithm import calculate_tardiness
+
+
+def _random_problem(seed, n_jobs=15, n_machines=4, float_times=False):
+    rng = random.Random(seed)
+    machines = [
+        Machine(k, [(s, s + rng.randint(1, 12)) for s in rng.sample(range(120), rng.randint(0, 4))])
+        for k in range(n_machines)
+    ]
+    jobs = []
+    for j in range(n_jobs):
+        ops = [
+            Operation(rng.randrange(n_machines), rng.randint(1, 9) + (0.5 if float_times else 0))
+            for _ in range(rng.randint(0, 4))
+        ]
+        jobs.append(Job(j, ops, due_date=rng.randint(10, 90), priority=rng.randint(1, 5)))
+    return jobs, machines
+
+
+def _check_parity(jit):
+    for seed in range(10):
+        jobs, machines = _random_problem(seed, float_times=seed % 2 == 1)
+        instance = compile_instance(jobs, machines)
+        state = {1: (6, 4), 2: (3, 12345)}
+        decoder = KernelDecoder(instance, 2, state, jit=jit)
+        rng = random.Random(seed)
+        for _ in range(10):
+            order = rng.sample(range(instance.n_jobs), instance.n_jobs)
+            available_at, last_job = instance.initial_state(state)
+            expected = _decode_fcfs(instance, order, 2, available_at, last_job)
+
+            assert decoder.schedule(order) == expected
+            makespan = max(op[4] for op in expected) if expected else 0
+            assert decoder.objectives(order) == (makespan, calculate_tardiness(expected, jobs))
+
+
+class TestKernel:
+    def test_kernel_source_matches_reference(self):
+        """The uncompiled kernel agrees with the reference decode."""
+        _check_parity(jit=False)
+
+    def test_compiled_kernel_matches_reference(self):
+        pytest.importorskip("numba")
+        if not KERNEL_AVAILABLE:
+            pytest.skip("JIT disabled via SHOPFLOOR_DISABLE_JIT")
+        _check_parity(jit=True)
+
+    @pytest.mark.skipif(KERNEL_AVAILABLE, reason="numba is installed")
+    def test_jit_without_numba_raises(self, sample_jobs, sample_machines):
+        instance = compile_instance(sample_jobs, sample_machines)
+        with pytest.raises(RuntimeError):
+            KernelDecoder(instance, 2)
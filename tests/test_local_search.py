@@ -0,0 +1,115 @@
+# tests/test_local_search.py
+"""
+Tests for scheduler/local_search.py — delta evaluation and the memetic GA step.
+"""
+import random
+import time
+from array import array
+import pytest
+from scheduler.engine import evaluate_instance
+from scheduler.instance import compile_instance, snapshot_machine_state
+from scheduler.local_search import DeltaEvaluator, local_search
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _busy(problem):
+    """Machine 0 starts busy until t=5 after a job outside the problem."""
+    jobs, machines = problem
+    machines[0].available_at, machines[0].last_job_id = 5, "previous"
+    return jobs, machines
+
+
+def _neighbour(order, rng):
+    i, j = rng.sample(range(len(order)), 2)
+    neighbour = array('i', order)
+    if rng.random() < 0.5:
+        neighbour[i], neighbour[j] = neighbour[j], neighbour[i]
+    else:
+        neighbour.insert(j, neighbour.pop(i))
+    return neighbour, min(i, j), max(i, j)
+
+
+class TestDeltaEvaluator:
+    @pytest.mark.parametrize("seed", range(8))
+    @pytest.mark.parametrize("stride", [1, 3, 8])
+    def test_matches_full_decode(self, seed, stride, random_instance):
+        jobs, machines = _busy(random_instance(seed, n_jobs=30, max_due=150))
+        instance = compile_instance(jobs, machines)
+        state = snapshot_machine_state(machines)
+        rng = random.Random(seed)
+        delta = DeltaEvaluator(instance, 2, state, stride=stride)
+        order = array('i', rng.sample(range(instance.n_jobs), instance.n_jobs))
+        assert delta.reset(order) == evaluate_instance(instance, order, 2, state)
+        for _ in range(50):
+            neighbour, first, last = _neighbour(order, rng)
+            assert delta.evaluate(neighbour, first, last) == evaluate_instance(instance, neighbour, 2, state)
+
+    def test_cutoff_only_rejects(self, random_instance):
+        jobs, machines = _busy(random_instance(3, n_jobs=30, max_due=150))
+        instance = compile_instance(jobs, machines)
+        rng = random.Random(3)
+        delta = DeltaEvaluator(instance, 2, stride=2)
+        order = array('i', range(instance.n_jobs))
+        delta.reset(order)
+        for _ in range(50):
+            neighbour, first, last = _neighbour(order, rng)
+            makespan, tardiness = evaluate_instance(instance, neighbour, 2)
+            exact = makespan + tardiness
+            cutoff = exact - 1 if rng.random() < 0.5 else exact + 1
+            partial = delta.evaluate(neighbour, first, last, (1, 1), cutoff)
+            if exact < cutoff:
+                assert partial == (makespan, tardiness)
+            else:
+                assert sum(partial) >= cutoff
+
+    def test_invalid_stride(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            DeltaEvaluator(compile_instance(sample_jobs, fresh_machines), 2, stride=0)
+
+
+class TestLocalSearch:
+    def test_improves_and_reports_exact_objectives(self, random_instance):
+        jobs, machines = _busy(random_instance(5, n_jobs=40, max_due=150))
+        instance = compile_instance(jobs, machines)
+        state = snapshot_machine_state(machines)
+        random.seed(0)
+        start = array('i', random.sample(range(instance.n_jobs), instance.n_jobs))
+        before = evaluate_instance(instance, start, 2, state)
+        delta = DeltaEvaluator(instance, 2, state)
+        order, objectives, moves, improvements = local_search(
+            delta, start, 0.6, 0.4, time.monotonic() + 10, max_moves=200,
+        )
+        assert sorted(order) == list(range(instance.n_jobs))
+        assert objectives == evaluate_instance(instance, order, 2, state)
+        assert improvements > 0 and moves >= improvements
+        assert 0.6 * objectives[0] + 0.4 * objectives[1] < 0.6 * before[0] + 0.4 * before[1]
+
+    def test_expired_deadline_returns_start(self, random_instance):
+        jobs, machines = _busy(random_instance(1, n_jobs=30, max_due=150))
+        instance = compile_instance(jobs, machines)
+        start = list(range(instance.n_jobs))
+        order, objectives, moves, _ = local_search(
+            DeltaEvaluator(instance, 2), start, 1.0, 1.0, time.monotonic() - 1, max_moves=100,
+        )
+        assert list(order) == start and moves == 0
+        assert objectives == evaluate_instance(instance, start, 2)
+
+
+class TestMemeticGA:
+    def test_reports_stats_and_valid_schedule(self, sample_jobs, fresh_machines):
+        stats = {}
+        schedule = run_genetic_algorithm(
+            sample_jobs, fresh_machines, 2, 8, 4, 0.1, 3, 0.6, 0.4,
+            stats=stats, stop_at_bound=False, local_search=True, local_search_rate=0.5, local_search_time=1.0,
+        )
+        assert len(schedule) == sum(len(job.operations) for job in sample_jobs)
+        assert stats["local_search"]["moves"] > 0
+
+    def test_rejects_incompatible_options(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 6, 2, 0.1, 2, 0.5, 0.5)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, local_search=True, decoder="active")
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, local_search=True, islands=2)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, local_search=True, local_search_time=0)
@@ -0,0 +1,82 @@
+# tests/test_parallel.py
+"""
+Tests for scheduler/parallel.py — process-pool fitness evaluation.
+"""
+import random
+import pytest
+from scheduler.engine import evaluate_instance
+from scheduler.gap_fill import schedule_instance_gap_fill
+from scheduler.instance import compile_instance, snapshot_machine_state
+from scheduler.metrics import schedule_objectives
+from scheduler.parallel import ParallelEvaluator
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _orders(n_jobs, count, seed=0):
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(count):
+        order = list(range(n_jobs))
+        rng.shuffle(order)
+        orders.append(order)
+    return orders
+
+
+class TestParallelEvaluator:
+    def test_matches_serial_fcfs(self, sample_jobs, fresh_machines):
+        instance = compile_instance(sample_jobs, fresh_machines)
+        state = snapshot_machine_state(fresh_machines)
+        orders = _orders(instance.n_jobs, 7)
+        with ParallelEvaluator(instance, 2, state, workers=2) as evaluator:
+            results = evaluator.evaluate(orders)
+            assert evaluator.evaluate([]) == []
+        assert results == [evaluate_instance(instance, order, 2, state) for order in orders]
+
+    def test_matches_serial_active(self, sample_jobs, fresh_machines):
+        instance = compile_instance(sample_jobs, fresh_machines)
+        due_dates = {job.job_id: job.due_date for job in sample_jobs}
+        orders = _orders(instance.n_jobs, 5, seed=1)
+        with ParallelEvaluator(instance, 2, workers=2, decoder="active") as evaluator:
+            results = evaluator.evaluate(orders)
+        assert results == [
+            schedule_objectives(schedule_instance_gap_fill(instance, order, 2), due_dates)
+            for order in orders
+        ]
+
+    def test_rejects_bad_arguments(self, sample_jobs, fresh_machines):
+        instance = compile_instance(sample_jobs, fresh_machines)
+        with pytest.raises(ValueError):
+            ParallelEvaluator(instance, 2, workers=0)
+        with pytest.raises(ValueError):
+            ParallelEvaluator(instance, 2, decoder="bogus")
+
+
+class TestGAWorkers:
+    def test_same_result_as_serial(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 12, 4, 0.2, 3, 0.6, 0.4)
+        random.seed(7)
+        serial = run_genetic_algorithm(*args, stop_at_bound=False)
+        random.seed(7)
+        parallel = run_genetic_algorithm(*args, stop_at_bound=False, workers=2)
+        assert parallel == serial
+
+    def test_rejects_incompatible_options(self, sample_jobs, fresh_machines):
+        args = (sample_jobs, fresh_machines, 2, 6, 2, 0.1, 2, 0.5, 0.5)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, workers=0)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, workers=2, prefix_cache=True)
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(*args, workers=2, backend="numpy")
+
+    def test_pool_closed_when_setup_fails(self, monkeypatch, tmp_path, sample_jobs, fresh_machines):
+        closed = []
+        close = ParallelEvaluator.close
+        monkeypatch.setattr(ParallelEvaluator, "close", lambda self: closed.append(self) or close(self))
+        (tmp_path / "bad.ckpt").write_bytes(b"not a checkpoint")
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(
+                sample_jobs, fresh_machines, 2, 6, 2, 0.1, 2, 0.5, 0.5,
+                workers=2, resume_from=str(tmp_path / "bad.ckpt"),
+            )
+        assert len(closed) == 1
@@ -0,0 +1,90 @@
+# tests/test_pareto.py
+"""
+Tests for scheduler/pareto.py and the NSGA-II Pareto mode of the GA.
+"""
+import random
+import threading
+import pytest
+from scheduler.metrics import schedule_objectives
+from scheduler.pareto import crowding_distance, dominates, hypervolume, non_dominated_sort
+from genetic_algorithm import run_nsga2
+
+
+class TestNonDominatedSort:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_pairwise_definition(self, seed):
+        rng = random.Random(seed)
+        points = [(rng.randint(0, 12), rng.randint(0, 12)) for _ in range(60)]
+        fronts = non_dominated_sort(points)
+        assert sorted(i for front in fronts for i in front) == list(range(len(points)))
+        level = {i: k for k, front in enumerate(fronts) for i in front}
+        for i, p in enumerate(points):
+            dominators = [level[j] for j, q in enumerate(points) if dominates(q, p)]
+            # Front k: dominated only by earlier fronts, and by some point of front k-1
+            assert all(k < level[i] for k in dominators)
+            if level[i] > 0:
+                assert level[i] - 1 in dominators
+
+    def test_equal_points_share_a_front(self):
+        assert non_dominated_sort([(3, 3), (1, 5), (3, 3), (5, 1), (4, 4)]) == [[1, 0, 2, 3], [4]]
+
+
+class TestCrowdingAndHypervolume:
+    def test_boundary_points_are_kept(self):
+        points = [(0, 10), (2, 7), (5, 5), (10, 0)]
+        distance = crowding_distance(points, [0, 1, 2, 3])
+        assert distance[0] == distance[3] == float("inf")
+        assert distance[1] == pytest.approx(5 / 10 + 5 / 10)
+        assert distance[2] == pytest.approx(8 / 10 + 7 / 10)
+
+    def test_hypervolume(self):
+        assert hypervolume([(1, 3), (2, 2), (3, 1)], (4, 4)) == 6
+        # Dominated and out-of-reference points add nothing
+        assert hypervolume([(1, 3), (2, 2), (3, 1), (3, 3), (5, 0)], (4, 4)) == 6
+        assert hypervolume([], (4, 4)) == 0
+
+
+class TestNSGA2:
+    def test_returns_exact_non_dominated_front(self, random_instance):
+        jobs, machines = random_instance(2, n_jobs=30)
+        due_dates = {job.job_id: job.due_date for job in jobs}
+        random.seed(0)
+        stats = {}
+        front = run_nsga2(jobs, machines, 2, 20, 15, 0.2, stats=stats)
+        points = [(makespan, tardiness) for _, makespan, tardiness in front]
+        assert points == sorted(set(points))
+        assert not any(dominates(p, q) for p in points for q in points)
+        for schedule, makespan, tardiness in front:
+            assert schedule_objectives(schedule, due_dates) == (makespan, tardiness)
+            assert len(schedule) == sum(len(job.operations) for job in jobs)
+        assert stats["front_size"] == len(front)
+        assert stats["generations_run"] == 15 and stats["stop_reason"] == "completed"
+
+    def test_progress_reports_growing_hypervolume(self, sample_jobs, fresh_machines):
+        volumes = []
+        random.seed(1)
+        run_nsga2(sample_jobs, fresh_machines, 2, 10, 8, 0.2,
+                  progress_callback=lambda generation, total_generations, best_fitness: volumes.append(best_fitness),
+                  seed_ratio=0.5)
+        assert len(volumes) == 8
+        assert volumes == sorted(volumes)
+
+    def test_own_rng_is_reproducible(self, sample_jobs, fresh_machines):
+        state = random.getstate()
+        first = run_nsga2(sample_jobs, fresh_machines, 2, 10, 6, 0.3, rng=random.Random(3))
+        assert run_nsga2(sample_jobs, fresh_machines, 2, 10, 6, 0.3, rng=random.Random(3)) == first
+        # The process-wide RNG is left alone
+        assert random.getstate() == state
+
+    def test_cancel_stops_after_first_generation(self, sample_jobs, fresh_machines):
+        cancel = threading.Event()
+        cancel.set()
+        stats = {}
+        front = run_nsga2(sample_jobs, fresh_machines, 2, 10, 50, 0.1, stats=stats, cancel_event=cancel)
+        assert front and stats["stop_reason"] == "cancelled" and stats["generations_run"] == 1
+
+    def test_rejects_bad_arguments(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_nsga2(sample_jobs, fresh_machines, 2, 10, 5, 0.1, decoder="bogus")
+        with pytest.raises(ValueError):
+            run_nsga2(sample_jobs, fresh_machines, 2, 1, 5, 0.1)
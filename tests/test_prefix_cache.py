@@ -0,0 +1,84 @@
+# tests/test_prefix_cache.py
+"""
+Tests for scheduler/prefix_cache.py — prefix-checkpointed FCFS evaluation.
+"""
+import random
+import pytest
+from scheduler.engine import evaluate_instance
+from scheduler.instance import compile_instance
+from scheduler.prefix_cache import PrefixCheckpointEvaluator
+
+
+class TestPrefixCheckpointEvaluator:
+    def test_matches_full_decode(self, random_instance):
+        """Cached and uncached decodes agree on orders with shared prefixes."""
+        rng = random.Random(7)
+        for seed in range(5):
+            inst = compile_instance(*random_instance(seed, n_jobs=20, windows=3, max_due=80))
+            state = {0: (5, 3), 2: (12, None)}
+            evaluator = PrefixCheckpointEvaluator(inst, setup_time=2, initial_state=state, stride=3)
+            base = list(range(inst.n_jobs))
+            for _ in range(40):
+                order = base[:]
+                cut = rng.randrange(inst.n_jobs)
+                tail = order[cut:]
+                rng.shuffle(tail)
+                order[cut:] = tail
+                assert evaluator.evaluate(order) == evaluate_instance(inst, order, 2, state)
+
+    def test_shared_prefix_is_reused(self, random_instance):
+        inst = compile_instance(*random_instance(1, n_jobs=20, windows=3, max_due=80))
+        evaluator = PrefixCheckpointEvaluator(inst, setup_time=1, stride=4)
+        order = list(range(inst.n_jobs))
+        evaluator.evaluate(order)
+        # Only the last two jobs differ: everything up to position 16 is reused
+        evaluator.evaluate(order[:18] + order[18:][::-1])
+
+        stats = evaluator.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["jobs_reused"] == 16
+        assert stats["jobs_decoded"] == 20 + 4
+
+    def test_repeated_order_skips_decode(self, random_instance):
+        inst = compile_instance(*random_instance(2, n_jobs=20, windows=3, max_due=80))
+        evaluator = PrefixCheckpointEvaluator(inst, setup_time=1, stride=5)
+        order = list(range(inst.n_jobs))
+        first = evaluator.evaluate(order)
+        second = evaluator.evaluate(order)
+        assert first == second
+        assert evaluator.stats()["jobs_decoded"] == inst.n_jobs
+
+    def test_entries_bounded(self, random_instance):
+        inst = compile_instance(*random_instance(3, n_jobs=20, windows=3, max_due=80))
+        evaluator = PrefixCheckpointEvaluator(inst, setup_time=1, stride=2, max_entries=5)
+        rng = random.Random(0)
+        for _ in range(20):
+            evaluator.evaluate(rng.sample(range(inst.n_jobs), inst.n_jobs))
+        assert len(evaluator) == 5
+
+    def test_checkpoints_do_not_hold_schedules(self, random_instance):
+        """A checkpoint stores machine state and totals, not the decoded prefix."""
+        inst = compile_instance(*random_instance(5, n_jobs=20, windows=3, max_due=80))
+        evaluator = PrefixCheckpointEvaluator(inst, setup_time=1, stride=4)
+        evaluator.evaluate(list(range(inst.n_jobs)))
+        for node, available_at, last_job, makespan, tardiness in evaluator._checkpoints.values():
+            assert len(available_at) == len(last_job) == inst.n_machines
+
+    def test_invalid_arguments(self, random_instance):
+        inst = compile_instance(*random_instance(4, n_jobs=20, windows=3, max_due=80))
+        with pytest.raises(ValueError):
+            PrefixCheckpointEvaluator(inst, setup_time=1, stride=0)
+        with pytest.raises(ValueError):
+            PrefixCheckpointEvaluator(inst, setup_time=1, max_entries=0)
+
+    def test_ga_reports_cache_stats(self, sample_jobs, fresh_machines):
+        from genetic_algorithm import run_genetic_algorithm
+
+        stats = {}
+        schedule = run_genetic_algorithm(
+            sample_jobs, fresh_machines, 2, 10, 5, 0.1, 3, 0.6, 0.4,
+            prefix_cache=True, stats=stats,
+        )
+        assert len(schedule) == sum(len(j.operations) for j in sample_jobs)
+        assert stats["prefix_cache"]["hits"] + stats["prefix_cache"]["misses"] == 50
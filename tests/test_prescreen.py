@@ -0,0 +1,101 @@
+# tests/test_prescreen.py
+"""
+Tests for scheduler/prescreen.py — lower-bound pre-screening of GA children.
+"""
+import random
+from array import array
+import pytest
+from scheduler.fitness_cache import FitnessCache
+from scheduler.engine import evaluate_instance
+from scheduler.instance import compile_instance
+from scheduler.prescreen import PrescreenEvaluator
+from genetic_algorithm import run_genetic_algorithm
+
+
+def _orders(n_jobs, count, seed=0):
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(count):
+        order = list(range(n_jobs))
+        rng.shuffle(order)
+        orders.append(array('i', order))
+    return orders
+
+
+class TestPrescreenEvaluator:
+    def test_exact_without_cutoff(self, random_instance):
+        jobs, machines = random_instance(1)
+        instance = compile_instance(jobs, machines)
+        prescreener = PrescreenEvaluator(instance, 2)
+        for order in _orders(len(jobs), 20):
+            value, exact = prescreener.evaluate(order)
+            assert exact and value == evaluate_instance(instance, order, 2)
+        assert prescreener.aborted == 0 and prescreener.decoded == 20
+
+    def test_abandoned_decodes_are_bounds_above_cutoff(self, random_instance):
+        jobs, machines = random_instance(2)
+        instance = compile_instance(jobs, machines)
+        prescreener = PrescreenEvaluator(instance, 2, w_makespan=0.7, w_tardiness=0.3)
+        aborted = 0
+        for order in _orders(len(jobs), 50, seed=1):
+            makespan, tardiness = evaluate_instance(instance, order, 2)
+            exact_fitness = makespan * 0.7 + tardiness * 0.3
+            cutoff = exact_fitness * 0.8
+            (bound_m, bound_t), exact = prescreener.evaluate(order, cutoff)
+            if not exact:
+                aborted += 1
+                assert bound_m <= makespan and bound_t <= tardiness
+                assert bound_m * 0.7 + bound_t * 0.3 > cutoff
+            # Never abandoned when the exact fitness is within the cutoff
+            assert prescreener.evaluate(order, exact_fitness)[1]
+        assert aborted and prescreener.jobs_skipped > 0
+
+    def test_population_keeps_selectable_exact(self, random_instance):
+        jobs, machines = random_instance(3)
+        instance = compile_instance(jobs, machines)
+        prescreener = PrescreenEvaluator(instance, 2)
+        orders = _orders(len(jobs), 30, seed=2)
+        cache = FitnessCache(100)
+        results = prescreener.evaluate_population(orders, 28, cache)
+        exact = [sum(evaluate_instance(instance, order, 2)) for order in orders]
+        ranked = sorted(range(len(orders)), key=exact.__getitem__)
+        for i in ranked[:28]:
+            assert sum(results[i]) == exact[i]
+        # Only exact results are cached
+        for order, value in zip(orders, results):
+            cached = cache.get(order)
+            assert cached is None or cached == evaluate_instance(instance, order, 2)
+
+    def test_rejects_negative_weights(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            PrescreenEvaluator(compile_instance(sample_jobs, fresh_machines), 2, w_tardiness=-1)
+
+
+class TestPrescreenedGA:
+    def _run(self, jobs, machines, **kwargs):
+        stats = {}
+        random.seed(5)
+        schedule = run_genetic_algorithm(
+            jobs, machines, 2, 30, 25, 0.2, 5, 0.5, 0.5, stats=stats,
+            stop_at_bound=False, backend="python", **kwargs,
+        )
+        return schedule, stats
+
+    def test_same_result_as_full_evaluation(self, random_instance):
+        jobs, machines = random_instance(4, n_jobs=30)
+        full, _ = self._run(jobs, machines)
+        screened, stats = self._run(jobs, machines, prescreen=True)
+        assert screened == full
+        assert len(stats["prescreen"]["aborts_per_generation"]) == 25
+        # At most tourn_size - 1 individuals per generation cannot be selected
+        assert all(n <= 4 for n in stats["prescreen"]["aborts_per_generation"])
+        cached, _ = self._run(jobs, machines, prescreen=True, fitness_cache=500)
+        assert cached == full
+
+    def test_rejects_unsupported_modes(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(sample_jobs, fresh_machines, 2, 10, 2, 0.1, 3, 0.5, 0.5,
+                                  prescreen=True, decoder="gap_fill")
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(sample_jobs, fresh_machines, 2, 10, 2, 0.1, 3, 0.5, 0.5,
+                                  prescreen=True, islands=2)
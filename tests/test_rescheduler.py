@@ -53,6 +53,32 @@ def test_reschedule_after_breakdown_unit():
             assert op[3] >= 6
 
 
+def test_reschedule_does_not_mutate_machines():
+    machines = [Machine(0, unavailable_periods=[(20, 25)]), Machine(1)]
+    jobs = [
+        Job(0, [Operation(0, 3), Operation(1, 4)], due_date=10, priority=2),
+        Job(1, [Operation(1, 2), Operation(0, 3)], due_date=15, priority=1),
+    ]
+    original_schedule = [
+        (0, 0, 0, 0, 3),
+        (1, 0, 1, 0, 2),
+        (0, 1, 1, 3, 7),
+        (1, 1, 0, 3, 6),
+    ]
+
+    reschedule_after_breakdown(original_schedule, 0, 2, 6, jobs, machines, setup_time=1)
+    insert_rush_order(
+        original_schedule, Job(9, [Operation(1, 2)], due_date=5, priority=5),
+        jobs, machines, setup_time=1, current_time=3,
+    )
+
+    # Breakdown windows go into the reschedule only, never into the caller's machines
+    assert machines[0].unavailable_periods == [(20, 25)]
+    assert machines[1].unavailable_periods == []
+    for m in machines:
+        assert (m.available_at, m.last_job_id) == (0, None)
+
+
 def test_insert_rush_order_unit():
     machines = [Machine(0), Machine(1)]
     jobs = [
@@ -0,0 +1,76 @@
+# tests/test_seeding.py
+"""
+Tests for scheduler/seeding.py and the heuristic-seeded GA population.
+"""
+import random
+import pytest
+from scheduler.engine import ALGORITHM_MAP, evaluate_instance, schedule_edd, schedule_spt, schedule_wspt
+from scheduler.instance import compile_instance, snapshot_machine_state
+from scheduler.metrics import schedule_objectives
+from scheduler.seeding import heuristic_orderings, schedule_ordering
+from genetic_algorithm import create_initial_population, run_genetic_algorithm
+
+
+class TestScheduleOrdering:
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("rule", [schedule_spt, schedule_edd, schedule_wspt])
+    def test_recovers_sort_rule_orderings(self, seed, rule, random_instance):
+        """An FCFS-decoded schedule is reproduced exactly by its recovered ordering."""
+        jobs, machines = random_instance(seed, max_due=150)
+        instance = compile_instance(jobs, machines)
+        schedule = rule(jobs, machines, 2, instance=instance)
+        order = schedule_ordering(instance, schedule)
+        due_dates = {job.job_id: job.due_date for job in jobs}
+        assert sorted(order) == list(range(instance.n_jobs))
+        assert evaluate_instance(instance, order, 2, snapshot_machine_state(machines)) == \
+            schedule_objectives(schedule, due_dates)
+
+    def test_interleaved_schedule_is_a_permutation(self, random_instance):
+        jobs, machines = random_instance(7, max_due=150)
+        instance = compile_instance(jobs, machines)
+        for rule in ("ATC", "MWKR", "CR", "SLACK", "ACTIVE"):
+            order = schedule_ordering(instance, ALGORITHM_MAP[rule](jobs, machines, 2, instance=instance))
+            assert sorted(order) == list(range(instance.n_jobs))
+
+    def test_heuristic_orderings_are_distinct(self, random_instance):
+        jobs, machines = random_instance(3, max_due=150)
+        orderings = heuristic_orderings(jobs, machines, 2)
+        assert set(orderings) <= set(ALGORITHM_MAP)
+        assert len({tuple(order) for order in orderings.values()}) == len(orderings)
+
+
+class TestSeededPopulation:
+    def test_seeds_then_perturbations_then_random(self):
+        seeds = [list(range(40)), list(range(39, -1, -1))]
+        population = create_initial_population(range(40), 10, seeds, seed_ratio=0.5)
+        assert len(population) == 10
+        assert list(population[0]) == seeds[0]
+        assert list(population[1]) == seeds[1]
+        for chromosome in population[2:5]:
+            assert sorted(chromosome) == list(range(40))
+            assert list(chromosome) not in seeds
+        assert all(sorted(chromosome) == list(range(40)) for chromosome in population)
+
+    def test_no_seeds_is_unchanged(self):
+        random.seed(1)
+        plain = create_initial_population(range(8), 5)
+        random.seed(1)
+        assert create_initial_population(range(8), 5, None, 0.5) == plain
+
+    def test_ga_never_worse_than_best_seed(self, random_instance):
+        jobs, machines = random_instance(11, n_jobs=30, max_due=150)
+        instance = compile_instance(jobs, machines)
+        state = snapshot_machine_state(machines)
+        seeds = list(heuristic_orderings(jobs, machines, 2, instance).values())
+        best_seed = min(
+            0.6 * m + 0.4 * t for m, t in (evaluate_instance(instance, order, 2, state) for order in seeds)
+        )
+        schedule = run_genetic_algorithm(
+            jobs, machines, 2, 10, 3, 0.1, 3, 0.6, 0.4, instance=instance, seed_ratio=0.2,
+        )
+        makespan, tardiness = schedule_objectives(schedule, {job.job_id: job.due_date for job in jobs})
+        assert 0.6 * makespan + 0.4 * tardiness <= best_seed
+
+    def test_rejects_bad_ratio(self, sample_jobs, fresh_machines):
+        with pytest.raises(ValueError):
+            run_genetic_algorithm(sample_jobs, fresh_machines, 2, 4, 1, 0.1, 2, 0.5, 0.5, seed_ratio=1.5)
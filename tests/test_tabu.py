@@ -0,0 +1,112 @@
+# tests/test_tabu.py
+"""
+Tests for scheduler/tabu.py — tabu search with critical-block moves.
+"""
+import threading
+import time
+import pytest
+from models import Job, Operation, Machine
+from scheduler.engine import ALGORITHM_MAP, evaluate_instance, schedule_instance
+from scheduler.instance import compile_instance
+from scheduler.metrics import schedule_objectives
+from scheduler.seeding import heuristic_orderings
+from scheduler.tabu import critical_pairs, schedule_tabu, tabu_search
+
+
+class TestCriticalPairs:
+    def test_block_ends_on_the_makespan_path(self):
+        # Jobs 0, 1, 2 queue on machine 0; job 2 then runs longest on machine 1
+        jobs = [
+            Job(0, [Operation(0, 3)], due_date=100, priority=1),
+            Job(1, [Operation(0, 3)], due_date=100, priority=1),
+            Job(2, [Operation(0, 3), Operation(1, 9)], due_date=100, priority=1),
+        ]
+        instance = compile_instance(jobs, [Machine(0), Machine(1)])
+        schedule = schedule_instance(instance, [0, 1, 2], 0)
+        # One block 0 -> 1 -> 2 on machine 0: its first and last pairs
+        assert critical_pairs(instance, schedule, 0) == [(0, 1), (1, 2)]
+
+    def test_setup_and_downtime_break_or_keep_the_path(self):
+        jobs = [Job(0, [Operation(0, 3)], due_date=100, priority=1), Job(1, [Operation(0, 3)], due_date=100, priority=1)]
+        instance = compile_instance(jobs, [Machine(0)])
+        assert critical_pairs(instance, schedule_instance(instance, [0, 1], 2), 2) == [(0, 1)]
+        # Job 1 waits for maintenance, not for job 0
+        instance = compile_instance(jobs, [Machine(0, [(3, 10)])])
+        assert critical_pairs(instance, schedule_instance(instance, [0, 1], 0), 0) == []
+
+    def test_tardy_jobs_add_paths(self):
+        jobs = [
+            Job(0, [Operation(0, 5)], due_date=100, priority=1),
+            Job(1, [Operation(0, 1)], due_date=1, priority=1),
+            Job(2, [Operation(1, 20)], due_date=100, priority=1),
+        ]
+        instance = compile_instance(jobs, [Machine(0), Machine(1)])
+        schedule = schedule_instance(instance, [0, 1, 2], 0)
+        assert critical_pairs(instance, schedule, 0, 1.0, 0.0) == []
+        assert critical_pairs(instance, schedule, 0, 1.0, 1.0) == [(0, 1)]
+
+
+class TestTabuSearch:
+    def test_improves_on_the_best_rule(self, random_instance):
+        jobs, machines = random_instance(1, n_jobs=20, n_machines=5, windows=0, route=3, max_due=80)
+        instance = compile_instance(jobs, machines)
+        start = min(
+            (sum(evaluate_instance(instance, order, 2)) for order in heuristic_orderings(jobs, machines, 2, instance).values()),
+        )
+        stats = {}
+        order, objectives = tabu_search(instance, 2, None, 1.0, 1.0, time_limit=10, stats=stats)
+        assert sorted(order) == list(range(len(jobs)))
+        assert objectives == evaluate_instance(instance, order, 2)
+        assert sum(objectives) <= start
+        assert stats["start_algorithm"] in ALGORITHM_MAP and stats["moves_evaluated"] > 0
+        assert stats["stop_reason"] in ("stagnation", "bound", "no_moves")
+
+    def test_deterministic_without_time_limit(self, random_instance):
+        jobs, machines = random_instance(2, n_jobs=20, n_machines=5, windows=0, route=3, max_due=80)
+        instance = compile_instance(jobs, machines)
+        first = tabu_search(instance, 2, time_limit=30, stagnation_limit=20, restarts=2)
+        assert tabu_search(instance, 2, time_limit=30, stagnation_limit=20, restarts=2) == first
+
+    def test_wall_clock_budget_and_progress(self, random_instance):
+        jobs, machines = random_instance(3, n_jobs=60, n_machines=8, windows=0, route=3, max_due=80)
+        instance = compile_instance(jobs, machines)
+        reports = []
+        stats = {}
+        started = time.monotonic()
+        tabu_search(
+            instance, 2, time_limit=0.3, stagnation_limit=10_000, stats=stats,
+            progress_callback=lambda **kw: reports.append(kw), progress_interval=0.05,
+        )
+        assert time.monotonic() - started < 2.0
+        assert stats["stop_reason"] == "time_limit"
+        assert len(reports) >= 2 and reports[-1]["iteration"] == stats["iterations"]
+
+    def test_cancel_returns_start(self, random_instance):
+        jobs, machines = random_instance(4, n_jobs=20, n_machines=5, windows=0, route=3, max_due=80)
+        instance = compile_instance(jobs, machines)
+        cancel = threading.Event()
+        cancel.set()
+        stats = {}
+        start = list(range(len(jobs)))
+        order, _ = tabu_search(instance, 2, start=start, cancel_event=cancel, stats=stats)
+        assert list(order) == start and stats["stop_reason"] == "cancelled"
+
+    def test_rejects_bad_arguments(self, sample_jobs, fresh_machines):
+        instance = compile_instance(sample_jobs, fresh_machines)
+        with pytest.raises(ValueError):
+            tabu_search(instance, 2, time_limit=0)
+        with pytest.raises(ValueError):
+            tabu_search(instance, 2, stagnation_limit=0)
+
+
+class TestScheduleTabu:
+    def test_engine_entry(self, sample_jobs, fresh_machines):
+        assert ALGORITHM_MAP["TABU"] is schedule_tabu
+        schedule = schedule_tabu(sample_jobs, fresh_machines, 2, w_makespan=1.0, w_tardiness=0.0)
+        assert len(schedule) == sum(len(job.operations) for job in sample_jobs)
+        fcfs = ALGORITHM_MAP["FCFS"](sample_jobs, fresh_machines, 2)
+        due_dates = {job.job_id: job.due_date for job in sample_jobs}
+        assert schedule_objectives(schedule, due_dates)[0] <= schedule_objectives(fcfs, due_dates)[0]
+
+    def test_not_a_ga_seed(self, sample_jobs, fresh_machines):
+        assert "TABU" not in heuristic_orderings(sample_jobs, fresh_machines, 2)
@@ -0,0 +1,95 @@
+# tests/test_tuner.py
+"""
+Tests for scheduler/tuner.py — successive-halving GA tuning and its cache.
+"""
+import random
+import pytest
+from models import Job, Operation, Machine
+from scheduler.instance import compile_instance
+import scheduler.tuner as tuner
+from scheduler.tuner import TuningCache, candidate_configs, recommend, size_bucket, tune
+
+
+def _problem(n_jobs=12, n_machines=3, seed=0):
+    rng = random.Random(seed)
+    jobs = [
+        Job(j, [Operation(rng.randrange(n_machines), rng.randint(1, 9)) for _ in range(3)],
+            due_date=rng.randint(10, 60), priority=1)
+        for j in range(n_jobs)
+    ]
+    return jobs, [Machine(k) for k in range(n_machines)], 2
+
+
+def _fake_trial(calls):
+    """Fitness = pop_size, so the smallest population always wins; 10 generations per CPU second."""
+    def trial(problem, config, seconds, w_makespan, w_tardiness, seed, ga_options):
+        calls.append((config["pop_size"], seconds))
+        return float(config["pop_size"]), 10 * seconds, seconds
+    return trial
+
+
+class TestSizeBucket:
+    def test_similar_sizes_share_a_bucket(self):
+        a = compile_instance(*_problem(n_jobs=20)[:2])
+        b = compile_instance(*_problem(n_jobs=29, seed=1)[:2])
+        c = compile_instance(*_problem(n_jobs=40)[:2])
+        assert size_bucket(a) == size_bucket(b) == "j32-m4-o3"
+        assert size_bucket(c) != size_bucket(a)
+
+
+class TestSuccessiveHalving:
+    def test_keeps_best_third_each_rung(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(tuner, "_trial", _fake_trial(calls))
+        candidates = [{"pop_size": p, "mutation_rate": 0.1, "tournament_size": 2} for p in range(90, 0, -10)]
+        result = tune([_problem()], 0.5, 0.5, budget=6.0, candidates=candidates)
+        assert result["pop_size"] == 10
+        assert result["rungs"] == 2 and result["candidates"] == 9
+        # 9 candidates share the first rung's 3 s, the best 3 share the second's
+        assert [p for p, _ in calls[9:]] == [10, 20, 30]
+        assert calls[0][1] == pytest.approx(3.0 / 9) and calls[-1][1] == pytest.approx(1.0)
+        assert result["cpu_seconds"] == pytest.approx(6.0)
+        # Sized for a run of the whole budget at the winner's measured speed
+        assert result["generations"] == 60
+
+    def test_real_race_stays_within_budget(self):
+        state = random.getstate()
+        result = tune([_problem()], 0.5, 0.5, budget=0.6, candidates=candidate_configs(4))
+        assert {"pop_size", "mutation_rate", "tournament_size"} <= result.keys()
+        assert result["cpu_seconds"] <= 0.6 * 1.5
+        assert result["generations"] >= 1
+        # The caller's random stream is left untouched
+        assert random.getstate() == state
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError):
+            tune([_problem()], 0.5, 0.5, budget=0)
+        with pytest.raises(ValueError):
+            tune([_problem()], 0.5, 0.5, budget=1, eta=1)
+        with pytest.raises(ValueError):
+            tune([], 0.5, 0.5, budget=1)
+
+    def test_candidates_include_form_defaults(self):
+        configs = candidate_configs(6, seed=3)
+        assert len(configs) == 6 and configs[0] == tuner.DEFAULT_CONFIG
+        assert len({tuple(c.values()) for c in configs}) == 6
+
+
+class TestRecommendationCache:
+    def test_races_once_per_bucket(self, monkeypatch, tmp_path):
+        calls = []
+        monkeypatch.setattr(tuner, "_trial", _fake_trial(calls))
+        cache = TuningCache(str(tmp_path / "tuning.json"))
+        jobs, machines, setup_time = _problem(n_jobs=20)
+        first, cached = recommend(jobs, machines, setup_time, 0.5, 0.5, 2.0, cache=cache)
+        assert not cached and calls
+        calls.clear()
+
+        # A similar instance, and a fresh cache object on the same file
+        jobs, machines, setup_time = _problem(n_jobs=25, seed=4)
+        second, cached = recommend(jobs, machines, setup_time, 0.5, 0.5, 2.0, cache=TuningCache(cache.path))
+        assert cached and second == first and not calls
+
+        # Other weights are raced separately
+        _, cached = recommend(jobs, machines, setup_time, 0.9, 0.1, 2.0, cache=cache)
+        assert not cached